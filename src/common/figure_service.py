@@ -0,0 +1,276 @@
+# src/common/figure_service.py
+'''
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from the author..
+See LICENSE file for full terms.
+
+Figure rendering service: experiments hand plot specs (a top-level render function plus
+the data it needs) to a FigureService instead of calling matplotlib inline, so figure
+cost can be moved off the simulation path.
+
+Modes:
+  sync   render immediately in-process (previous behaviour, default)
+  async  render in a background process pool; close() waits for all figures
+  defer  persist only the spec next to the target figure (<figure>.figspec.pkl) so it
+         can be rendered later on demand; nothing is plotted during the run
+
+The default mode can be set with the VDM_FIGURES environment variable. Render functions of
+a script run by path are recorded with their source file and loaded from it when rendered;
+one that cannot be referenced at all (e.g. a nested function) is rendered synchronously
+with a warning, so the run still writes its logs.
+
+# Example usage inside a physics script:
+
+from common.figure_service import FigureService, add_figure_args
+
+add_figure_args(parser)                      # --figure_mode {sync,async,defer}, --no-figures
+...
+with FigureService(args.figure_mode) as figs:
+    figs.submit(fig_path, plot_and_save, data, fig_path)
+
+# Render deferred figures later (files or directories, searched recursively):
+python -m src.common.figure_service figures/reaction_diffusion --workers 4
+'''
+from __future__ import annotations
+
+import argparse
+import importlib
+import importlib.util
+import os
+import pickle
+import sys
+from pathlib import Path
+import warnings
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+MODES = ("sync", "async", "defer")
+ENV_MODE = "VDM_FIGURES"
+SPEC_SUFFIX = ".figspec.pkl"
+SPEC_FORMAT = "vdm-figspec/1"
+
+
+def default_mode() -> str:
+    """Mode from $VDM_FIGURES, falling back to 'sync'."""
+    mode = os.environ.get(ENV_MODE, "sync").strip().lower()
+    return mode if mode in MODES else "sync"
+
+
+def add_figure_args(parser: argparse.ArgumentParser) -> None:
+    """Add --figure_mode and its --no-figures alias (defer: persist specs only)."""
+    parser.add_argument("--figure_mode", choices=MODES, default=default_mode(),
+                        help=f"figure rendering: sync, async (process pool) or defer (write specs only); default ${ENV_MODE} or sync")
+    parser.add_argument("--no-figures", dest="figure_mode", action="store_const", const="defer",
+                        help="persist figure specs only; render later with python -m src.common.figure_service")
+
+
+def spec_path(figure_path) -> Path:
+    """Spec file written in defer mode for a figure path."""
+    p = Path(figure_path)
+    return p.with_name(p.stem + SPEC_SUFFIX)
+
+
+def _render_ref(fn: Callable) -> Tuple[str, Optional[str]]:
+    """
+    Importable 'module:qualname' for a top-level render function, plus its source file when
+    the module is a script run by path (no importable name; the file is loaded instead).
+    """
+    if "<" in fn.__qualname__:
+        raise ValueError(f"render function {fn.__qualname__} must be defined at module top level")
+    module = fn.__module__
+    if module != "__main__":
+        return f"{module}:{fn.__qualname__}", None
+    # scripts run via python -m: recover the importable module name
+    main_spec = getattr(sys.modules["__main__"], "__spec__", None)
+    if main_spec is not None and main_spec.name:
+        return f"{main_spec.name}:{fn.__qualname__}", None
+    source = getattr(getattr(fn, "__code__", None), "co_filename", "")
+    if not source or not Path(source).is_file():
+        raise ValueError(f"cannot resolve {fn.__qualname__}: __main__ has no module spec or source file")
+    return f"{Path(source).stem}:{fn.__qualname__}", str(Path(source).resolve())
+
+
+def _load_source(source: str) -> Any:
+    """Module object for a script file, executed once per process (its __main__ block does not run)."""
+    name = "_vdm_figure_script_" + "".join(c if c.isalnum() else "_" for c in source)
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, source)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"cannot load render module from {source}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return module
+
+
+def _resolve(name: str, source: Optional[str] = None) -> Callable:
+    module, _, qualname = name.partition(":")
+    obj: Any = _load_source(source) if source else importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _call(name: str, args: Tuple, kwargs: dict, source: Optional[str] = None) -> None:
+    _resolve(name, source)(*args, **kwargs)
+
+
+def write_spec(figure_path, fn: Callable, args: Tuple = (), kwargs: Optional[dict] = None) -> Path:
+    """Persist a plot spec beside figure_path; returns the spec path."""
+    render, source = _render_ref(fn)
+    path = spec_path(figure_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    spec = {
+        "format": SPEC_FORMAT,
+        "render": render,
+        "source": source,  # script file for render functions of a script run by path
+        "figure": str(figure_path),
+        "args": tuple(args),
+        "kwargs": dict(kwargs or {}),
+    }
+    with open(path, "wb") as f:
+        pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def render_spec(path, remove: bool = True) -> str:
+    """
+    Render one deferred spec.
+
+    Args:
+        path: spec file written in defer mode.
+        remove: delete the spec once the figure has been written.
+
+    Returns:
+        Path of the rendered figure.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        spec = pickle.load(f)
+    if spec.get("format") != SPEC_FORMAT:
+        raise ValueError(f"{path}: unsupported figure spec format {spec.get('format')!r}")
+    _call(spec["render"], spec["args"], spec["kwargs"], spec.get("source"))
+    if remove:
+        path.unlink()
+    return spec["figure"]
+
+
+def find_specs(paths: Iterable) -> List[Path]:
+    """Spec files among paths (directories are searched recursively)."""
+    found: List[Path] = []
+    for p in map(Path, paths):
+        if p.is_dir():
+            found.extend(sorted(p.rglob("*" + SPEC_SUFFIX)))
+        elif p.is_file():
+            found.append(p)
+    return found
+
+
+def render_deferred(paths: Iterable, workers: int = 1, remove: bool = True) -> List[str]:
+    """Render every spec under paths, optionally across a process pool; returns figure paths."""
+    specs = find_specs(paths)
+    if workers <= 1 or len(specs) <= 1:
+        return [render_spec(p, remove) for p in specs]
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(specs))) as pool:
+        futures = [pool.submit(render_spec, p, remove) for p in specs]
+        return [f.result() for f in as_completed(futures)]
+
+
+class FigureService:
+    """
+    Routes plot specs to synchronous, pooled or deferred rendering.
+
+    Render functions must be importable top-level callables; they are called as
+    fn(*args, **kwargs) and are responsible for writing the figure themselves.
+    """
+
+    def __init__(self, mode: Optional[str] = None, workers: Optional[int] = None):
+        mode = default_mode() if mode is None else mode
+        if mode not in MODES:
+            raise ValueError(f"unknown figure mode {mode!r}; expected one of {MODES}")
+        self.mode = mode
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.specs: List[Path] = []
+        self._pool = None  # ProcessPoolExecutor, created on the first async submit
+        self._pending: List[Any] = []
+
+    @property
+    def renders(self) -> bool:
+        """True if figures are (or will be) written during this run."""
+        return self.mode != "defer"
+
+    def submit(self, figure_path, fn: Callable, *args, **kwargs) -> Path:
+        """
+        Enqueue one figure.
+
+        Args:
+            figure_path: figure the render function writes (the spec lands beside it in defer mode).
+            fn: top-level render function.
+            *args, **kwargs: passed to fn unchanged.
+
+        Returns:
+            figure_path in sync/async mode, the spec path in defer mode. A render function
+            that cannot be referenced from another process (nested, or from a script without
+            a source file) is rendered synchronously with a warning instead.
+        """
+        if self.mode == "sync":
+            fn(*args, **kwargs)
+            return Path(figure_path)
+        try:
+            render, source = _render_ref(fn)
+        except ValueError as exc:
+            warnings.warn(f"{exc}; rendering {figure_path} synchronously", RuntimeWarning, stacklevel=2)
+            fn(*args, **kwargs)
+            return Path(figure_path)
+        if self.mode == "defer":
+            path = write_spec(figure_path, fn, args, kwargs)
+            self.specs.append(path)
+            return path
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._pending.append(self._pool.submit(_call, render, args, kwargs, source))
+        return Path(figure_path)
+
+    def wait(self) -> None:
+        """Block until every queued figure is written; re-raises the first render error."""
+        pending, self._pending = self._pending, []
+        for fut in pending:
+            fut.result()
+
+    def close(self) -> None:
+        try:
+            self.wait()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def __enter__(self) -> "FigureService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render figures deferred with --no-figures / --figure_mode defer.")
+    parser.add_argument("paths", nargs="+", help="spec files or directories to search recursively")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--keep", action="store_true", help="keep spec files after rendering")
+    args = parser.parse_args()
+    for fig in render_deferred(args.paths, workers=args.workers, remove=not args.keep):
+        print(fig)
+
+
+if __name__ == "__main__":
+    main()
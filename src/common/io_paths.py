@@ -61,6 +61,11 @@ def log_path(domain: str, slug: str, failed: bool=False) -> Path:
     base = LOGS_ROOT / domain / ("failed_runs" if failed else "")
     return ensure_dir(base) / f"{_ts()}_{slug}.json"
 
+def results_path(domain: str, slug: str, failed: bool=False) -> Path:
+    """Directory path for a columnar results store (see common.results_store)."""
+    base = LOGS_ROOT / domain / ("failed_runs" if failed else "")
+    return ensure_dir(base) / f"{_ts()}_{slug}.results"
+
 def write_log(path: Path, data: dict):
     ensure_dir(path.parent)
     with open(path, "w", encoding="utf-8") as f:
@@ -0,0 +1,127 @@
+# src/common/results_store.py
+'''
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from the author..
+See LICENSE file for full terms.
+
+Columnar results store: typed tables written as one ``.npy`` file per column plus a
+JSON manifest, so experiments hand results to plotters without printing and re-parsing
+text. Columns load memory-mapped by default, so only the columns (and rows) a consumer
+touches are read from disk.
+
+Layout of a store directory::
+
+    <slug>.results/
+        manifest.json              # format, meta, tables → n_rows + column files/dtypes
+        <table>__<column>.npy
+
+# Example usage inside a physics script:
+
+from common.io_paths import results_path
+from common.results_store import write_results, load_results
+
+store = write_results(results_path("memory_steering", "memory_steering_results"), {
+    "junction": {"x": X, "p_a": P},
+}, meta={"seed": 123})
+tables = load_results(store)          # {"junction": {"x": memmap, "p_a": memmap}}
+'''
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import numpy as np
+
+FORMAT = "vdm-results/1"
+MANIFEST = "manifest.json"
+
+
+def is_results_store(path) -> bool:
+    """True if path is a results store directory (contains a manifest)."""
+    p = Path(path)
+    return p.is_dir() and (p / MANIFEST).is_file()
+
+
+def read_manifest(path) -> Dict[str, Any]:
+    with open(Path(path) / MANIFEST, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT:
+        raise ValueError(f"{path}: unsupported results store format {manifest.get('format')!r}")
+    return manifest
+
+
+def write_results(
+    path,
+    tables: Mapping[str, Mapping[str, Any]],
+    meta: Optional[Mapping[str, Any]] = None,
+) -> Path:
+    """
+    Write named tables of equal-length columns to a store directory.
+
+    Args:
+        path: store directory (created if missing; existing tables of the same name are replaced).
+        tables: {table: {column: 1-D array-like}}; all columns of a table must share a length.
+        meta: optional JSON-serializable metadata (params, seeds, source script).
+
+    Returns:
+        Path of the store directory.
+    """
+    root = Path(path)
+    root.mkdir(parents=True, exist_ok=True)
+    manifest = read_manifest(root) if is_results_store(root) else {"format": FORMAT, "meta": {}, "tables": {}}
+    if meta:
+        manifest["meta"].update(dict(meta))
+
+    for table, columns in tables.items():
+        cols = {name: np.asarray(values) for name, values in columns.items()}
+        lengths = {name: (arr.shape[0] if arr.ndim else 1) for name, arr in cols.items()}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"table {table!r}: columns have different lengths {lengths}")
+        entry = {"n_rows": int(next(iter(lengths.values()), 0)), "columns": {}}
+        for name, arr in cols.items():
+            fname = f"{table}__{name}.npy"
+            np.save(root / fname, np.atleast_1d(arr), allow_pickle=False)
+            entry["columns"][name] = {"file": fname, "dtype": str(arr.dtype)}
+        manifest["tables"][table] = entry
+
+    tmp = root / (MANIFEST + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, root / MANIFEST)
+    return root
+
+
+def load_results(
+    path,
+    tables: Optional[Iterable[str]] = None,
+    mmap: bool = True,
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Load tables from a store directory.
+
+    Args:
+        path: store directory.
+        tables: optional subset of table names; missing names load as empty dicts.
+        mmap: memory-map the column files (lazy reads); False loads them into memory.
+
+    Returns:
+        {table: {column: np.ndarray}}
+    """
+    root = Path(path)
+    manifest = read_manifest(root)
+    names = list(manifest["tables"]) if tables is None else list(tables)
+    out: Dict[str, Dict[str, np.ndarray]] = {}
+    for table in names:
+        entry = manifest["tables"].get(table)
+        if entry is None:
+            out[table] = {}
+            continue
+        out[table] = {
+            name: np.load(root / col["file"], mmap_mode="r" if mmap else None, allow_pickle=False)
+            for name, col in entry["columns"].items()
+        }
+    return out
@@ -17,6 +17,13 @@ Purpose
   1) Solution overlay: numeric vs analytic
   2) Invariant drift over time: |Q(t) - Q(0)|
   3) Convergence study: ΔQ vs dt (log-log) + slope
+- Every (r, u, W0, dt) combination is integrated as one batch (integrate_batch): small
+  batches run per row, large ones advance all rows in lockstep with one NumPy update per
+  step; ΔQ, W_min and W_max are reduced in the same pass. The first r, u, W0 at the
+  finest dt is the primary run that gates acceptance and feeds the figures.
+- Integration streams: ΔQ and the W range are reduced block by block, so memory does not
+  grow with T/dt; the figures use a decimated trace of the primary run (--trace_points).
+  integrate_streaming is the single-trajectory form.
 
 - Usage
 - Basic run (double precision RK4):
@@ -27,11 +34,17 @@ Purpose
     python src/conservation_law/qVDM_validate.py \\
         --r 0.15 --u 0.25 --W0 0.12 --T 10 --dt 0.002 0.001 0.0005 --solver rk4
 
+- Parameter grid (every r, u, W0 and dt combination; ΔQ for each in the JSON runs):
+    python src/conservation_law/qVDM_validate.py \\
+        --r 0.1 0.15 0.2 --u 0.25 0.5 --W0 0.12 0.62 --T 10 --dt 0.002 0.001 0.0005
+
 Outputs
 - Figures:
     figures/conservation_law/<timestamp>_qVDM_solution_overlay.png
     figures/conservation_law/<timestamp>_qVDM_Q_drift.png
     figures/conservation_law/<timestamp>_qVDM_convergence.png
+    (--no-figures writes <figure>.figspec.pkl instead; render later with
+     python -m src.common.figure_service figures/conservation_law)
 - JSON metrics:
     logs/conservation_law/<timestamp>_qVDM_metrics.json
 
@@ -64,8 +77,8 @@ for _path in (SRC_ROOT, REPO_ROOT):
         sys.path.append(_path_str)
 
 import numpy as np
-import matplotlib.pyplot as plt
 import src.common.io_paths as io_paths
+from src.common.figure_service import FigureService, add_figure_args
 
 
 ARXIV_FIG_DIR = "write_ups/arxiv/RD_Methods_QA/figs"
@@ -99,28 +112,256 @@ def rk4_step(F, W: float, dt: float) -> float:
     return W + (dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4)
 
 
+def _integrate_row(r: float, u: float, W0: float, dt: float, N: int, solver: str) -> np.ndarray:
+    """N steps of rk4_step / forward Euler on Python floats (the RHS is inlined, same operation order)."""
+    W = float(W0)
+    h_half = 0.5 * dt
+    h_sixth = dt / 6.0
+    out = [W]
+    append = out.append
+    isfinite = math.isfinite
+    if solver == "rk4":
+        for _ in range(N):
+            k1 = r * W - u * W * W
+            w = W + h_half * k1
+            k2 = r * w - u * w * w
+            w = W + h_half * k2
+            k3 = r * w - u * w * w
+            w = W + dt * k3
+            k4 = r * w - u * w * w
+            w_next = W + h_sixth * (k1 + 2 * k2 + 2 * k3 + k4)
+            # avoid crossing poles; clamp very gently if needed (diagnostic safety)
+            if isfinite(w_next):
+                W = w_next
+            append(W)
+    else:
+        for _ in range(N):
+            w_next = W + dt * (r * W - u * W * W)
+            if isfinite(w_next):
+                W = w_next
+            append(W)
+    return np.array(out, dtype=np.float64)
+
+
 def integrate_numeric(r: float, u: float, W0: float, T: float, dt: float, solver: str = "rk4") -> Tuple[np.ndarray, np.ndarray]:
     N = max(1, int(round(T / dt)))
     t = np.linspace(0.0, N * dt, N + 1, dtype=np.float64)
-    W = np.zeros_like(t)
-    W[0] = float(W0)
-    F = logistic_ode_rhs(r, u)
-    if solver.lower() == "rk4":
-        step = lambda w: rk4_step(F, w, dt)
-    elif solver.lower() == "euler":
-        step = lambda w: w + dt * F(w)
-    else:
+    if solver.lower() not in ("rk4", "euler"):
         raise ValueError(f"Unsupported solver: {solver}")
-    for n in range(N):
-        w_next = step(W[n])
-        # avoid crossing poles; clamp very gently if needed (diagnostic safety)
-        if math.isfinite(w_next):
-            W[n + 1] = w_next
-        else:
-            W[n + 1] = W[n]
+    W = _integrate_row(float(r), float(u), float(W0), float(dt), N, solver.lower())
     return t, W
 
 
+# Below this many rows the per-row float loops beat one NumPy update per step for the whole
+# batch (≈1.4 µs per row-step against ≈20 µs per lockstep step, reductions included).
+LOCKSTEP_MIN_ROWS = 32
+
+
+def integrate_batch(
+    r,
+    u,
+    W0,
+    T: float,
+    dt,
+    solver: str = "rk4",
+    keep: Tuple[int, ...] = (),
+    chunk: int = 4096,
+    method: str = "auto",
+    stride: int = 1,
+) -> Dict[str, object]:
+    """
+    Integrate many logistic trajectories dW/dt = r W - u W^2 and reduce their Q drift.
+
+    Every row b has its own (r, u, W0, dt) and N_b = max(1, round(T/dt_b)) steps, exactly as
+    integrate_numeric. Two interchangeable executions (bit-identical results):
+      lockstep  one vectorized RK4/Euler update per step for the whole batch; rows that
+                have taken their N_b steps keep stepping with h = 0, which leaves W unchanged
+      rows      the float loop of integrate_numeric per row (cheaper for small batches)
+    'auto' picks lockstep from LOCKSTEP_MIN_ROWS rows on. Both stream: trajectories are
+    produced and reduced `chunk` steps at a time with one Q_invariant call over all rows (t
+    clipped at N_b dt_b for finished rows), so memory is O(chunk·B) whatever T/dt is, plus
+    the kept traces of about N_b/stride + 2 samples each.
+
+    Args:
+        r, u, W0, dt: scalars or arrays broadcast to a common (B,) shape.
+        T: time horizon shared by all rows.
+        solver: "rk4" or "euler".
+        keep: row indices whose (t, W) trajectories are returned.
+        chunk: steps per reduction block.
+        method: "auto", "lockstep" or "rows".
+        stride: kept trajectories hold every stride-th step plus the last one (1 = all).
+
+    Returns:
+        dict with (B,) arrays 'r', 'u', 'W0', 'dt', 'steps', 'delta_Q_max', 'W_min', 'W_max',
+        'W_final', and 'trajectories': {row: (t, W)} for the kept rows (with stride 1 equal
+        to integrate_numeric).
+    """
+    solver = solver.lower()
+    if solver not in ("rk4", "euler"):
+        raise ValueError(f"Unsupported solver: {solver}")
+    if method not in ("auto", "lockstep", "rows"):
+        raise ValueError(f"Unsupported method: {method}")
+    if stride < 1:
+        raise ValueError(f"stride must be >= 1, got {stride}")
+    r, u, W0_arr, dt = (np.array(a, dtype=np.float64) for a in np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=np.float64)) for a in (r, u, W0, dt))))
+    steps = np.maximum(1, np.round(T / dt)).astype(np.int64)
+    n_max = int(steps.max())
+    B = W0_arr.size
+    if method == "auto":
+        method = "lockstep" if B >= LOCKSTEP_MIN_ROWS else "rows"
+
+    # np.linspace(0, N dt, N + 1) spacing, with the endpoint pinned to N dt
+    t_end = steps * dt
+    t_step = t_end / steps
+    Q0 = Q_invariant(r, u, W0_arr, np.zeros_like(W0_arr))
+    drift = np.zeros(B)
+    W_min = W0_arr.copy()
+    W_max = W0_arr.copy()
+    keep = tuple(int(b) for b in keep)
+    traj: Dict[int, Tuple[List[np.ndarray], List[np.ndarray]]] = {b: ([np.zeros(1)], [W0_arr[b:b + 1].copy()]) for b in keep}
+
+    def reduce_block(block: np.ndarray, n0: int) -> None:
+        """Fold steps n0 .. n0+len(block)-1 (rows frozen past their N_b) into the metrics."""
+        nonlocal drift, W_min, W_max
+        idx = np.arange(n0, n0 + block.shape[0])
+        t = np.where(idx[:, None] >= steps[None, :], t_end[None, :], idx[:, None] * t_step[None, :])
+        Q = Q_invariant(r, u, block, t)
+        drift = np.fmax(drift, np.nanmax(np.abs(Q - Q0), axis=0))
+        W_min = np.minimum(W_min, block.min(axis=0))
+        W_max = np.maximum(W_max, block.max(axis=0))
+        for b in keep:
+            sel = (idx <= steps[b]) & ((idx % stride == 0) | (idx == steps[b]))
+            if np.any(sel):
+                traj[b][0].append(t[sel, b])
+                traj[b][1].append(block[sel, b])
+
+    if method == "rows":
+        # each row resumes its float loop from the previous block's last value
+        W_cur = W0_arr.tolist()
+        params = list(zip(r.tolist(), u.tolist(), dt.tolist(), steps.tolist()))
+        for n0 in range(1, n_max + 1, chunk):
+            n1 = min(n_max + 1, n0 + chunk)
+            block = np.empty((n1 - n0, B))
+            for b, (rb, ub, dtb, Nb) in enumerate(params):
+                m = max(0, min(n1, Nb + 1) - n0)
+                seg = _integrate_row(rb, ub, W_cur[b], dtb, m, solver)
+                block[:m, b] = seg[1:]
+                block[m:, b] = seg[-1]
+                W_cur[b] = float(seg[-1])
+            reduce_block(block, n0)
+        W_final = np.array(W_cur)
+    else:
+        W_final = _lockstep(r, u, W0_arr, dt, steps, solver, min(chunk, n_max), reduce_block)
+
+    trajectories = {b: (np.concatenate(traj[b][0]), np.concatenate(traj[b][1])) for b in keep}
+    return {
+        "r": r, "u": u, "W0": W0_arr, "dt": dt, "steps": steps,
+        "delta_Q_max": drift, "W_min": W_min, "W_max": W_max, "W_final": W_final,
+        "trajectories": trajectories,
+    }
+
+
+def integrate_streaming(
+    r: float,
+    u: float,
+    W0: float,
+    T: float,
+    dt: float,
+    solver: str = "rk4",
+    trace_points: int = 0,
+    chunk: int = 4096,
+) -> Dict[str, object]:
+    """
+    One trajectory with its Q drift and W range reduced online; memory is O(chunk + trace_points)
+    instead of the O(T/dt) arrays integrate_numeric returns. Values match integrate_numeric.
+
+    Args:
+        r, u, W0, T, dt, solver: as integrate_numeric.
+        trace_points: approximate length of the decimated (t, W) trace (0: no trace).
+        chunk: steps reduced per Q_invariant call.
+
+    Returns:
+        dict with 'steps', 'delta_Q_max', 'W_min', 'W_max', 'W_final' (floats/int) and
+        'trace': (t, W) sampled every ceil(N/trace_points) steps plus the last step, or None.
+    """
+    N = max(1, int(round(T / dt)))
+    stride = max(1, -(-N // trace_points)) if trace_points > 0 else 1
+    res = integrate_batch(r, u, W0, T, dt, solver=solver, keep=(0,) if trace_points > 0 else (),
+                          chunk=chunk, method="rows", stride=stride)
+    return {
+        "steps": N,
+        "delta_Q_max": float(res["delta_Q_max"][0]),
+        "W_min": float(res["W_min"][0]),
+        "W_max": float(res["W_max"][0]),
+        "W_final": float(res["W_final"][0]),
+        "trace": res["trajectories"].get(0),
+    }
+
+
+def _lockstep(r, u, W0, dt, steps, solver, chunk, reduce_block) -> np.ndarray:
+    """Vectorized RK4/Euler over all rows; hands every `chunk` steps to reduce_block."""
+    W = W0.copy()
+    n_max = int(steps.max())
+    buf = np.empty((chunk, W.size), dtype=np.float64)
+    finish = set(int(n) for n in np.unique(steps))  # step indices at which some rows stop
+    # preallocated stage buffers; the operation order mirrors _integrate_row
+    k1, k2, k3, k4, w, tmp, acc = (np.empty_like(W) for _ in range(7))
+    ok = np.empty(W.shape, dtype=bool)
+    mul, add, sub = np.multiply, np.add, np.subtract
+
+    def F(x: np.ndarray, k: np.ndarray) -> None:
+        mul(r, x, out=k)
+        mul(u, x, out=tmp)
+        mul(tmp, x, out=tmp)
+        sub(k, tmp, out=k)
+
+    n0 = 1  # step index stored in buf[0]
+    for n in range(n_max):
+        if n == 0 or n in finish:
+            h = np.where(steps > n, dt, 0.0)
+            h_half = 0.5 * h
+            h_sixth = h / 6.0
+        if solver == "rk4":
+            F(W, k1)
+            mul(h_half, k1, out=w)
+            add(W, w, out=w)
+            F(w, k2)
+            mul(h_half, k2, out=w)
+            add(W, w, out=w)
+            F(w, k3)
+            mul(h, k3, out=w)
+            add(W, w, out=w)
+            F(w, k4)
+            mul(2, k2, out=acc)
+            add(k1, acc, out=acc)
+            mul(2, k3, out=tmp)
+            add(acc, tmp, out=acc)
+            add(acc, k4, out=acc)
+            mul(h_sixth, acc, out=acc)
+        else:
+            F(W, k1)
+            mul(h, k1, out=acc)
+        add(W, acc, out=w)
+        # avoid crossing poles: a non-finite step keeps the previous value
+        np.isfinite(w, out=ok)
+        np.copyto(W, w, where=ok)
+        j = n + 1 - n0
+        buf[j] = W
+        if j + 1 == chunk or n + 1 == n_max:
+            reduce_block(buf[: j + 1], n0)
+            n0 = n + 2
+    return W
+
+
+def validation_grid(r_list, u_list, W0_list, dt_list) -> Dict[str, np.ndarray]:
+    """Every (r, u, W0, dt) combination as flat (B,) arrays, r slowest and dt fastest."""
+    R, U, W0, DT = np.meshgrid(np.asarray(r_list, dtype=np.float64), np.asarray(u_list, dtype=np.float64),
+                               np.asarray(W0_list, dtype=np.float64), np.asarray(dt_list, dtype=np.float64),
+                               indexing="ij")
+    return {"r": R.ravel(), "u": U.ravel(), "W0": W0.ravel(), "dt": DT.ravel()}
+
+
 def logistic_analytic(r: float, u: float, W0: float, t: np.ndarray) -> np.ndarray:
     # W(t) = (r/u) / (1 + C e^{-r t}), where C = (r/u - W0) / W0
     C = ((r / u) - W0) / W0
@@ -176,7 +417,25 @@ def fit_loglog(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float]:
     return float(p), float(b), float(r2)
 
 
+def convergence_fit(r: float, u: float, solver: str, dts, deltas) -> ConvergenceMetrics:
+    """ΔQ-vs-dt series (largest dt first) with its log-log fit on the positive finite pairs."""
+    order = np.argsort(np.asarray(dts, dtype=np.float64))[::-1]  # larger to smaller for plotting clarity
+    dts_arr = np.asarray(dts, dtype=np.float64)[order]
+    deltas_arr = np.asarray(deltas, dtype=np.float64)[order]
+    mask = np.isfinite(dts_arr) & np.isfinite(deltas_arr) & (dts_arr > 0) & (deltas_arr > 0)
+    if np.count_nonzero(mask) >= 2:
+        slope, intercept, r2 = fit_loglog(dts_arr[mask], deltas_arr[mask])
+    else:
+        slope, intercept, r2 = float("nan"), float("nan"), float("nan")
+    return ConvergenceMetrics(
+        r=r, u=u, solver=solver, dts=[float(x) for x in dts_arr], delta_Q_max_list=[float(x) for x in deltas_arr],
+        slope=slope, intercept=intercept, r2=r2
+    )
+
+
 def plot_solution_overlay(fig_path: str, t: np.ndarray, W_num: np.ndarray, W_an: np.ndarray, r: float, u: float, W0: float) -> None:
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(6.0, 4.0), dpi=150)
     plt.plot(t, W_num, "-", lw=1.4, label="Numeric", color="#1f77b4")
     plt.plot(t, W_an, "--", lw=1.4, label="Analytic", color="#ff7f0e")
@@ -191,10 +450,14 @@ def plot_solution_overlay(fig_path: str, t: np.ndarray, W_num: np.ndarray, W_an:
     plt.close()
 
 
-def plot_Q_drift(fig_path: str, t: np.ndarray, Q: np.ndarray, r: float, u: float, W0: float) -> float:
+def plot_Q_drift(fig_path: str, t: np.ndarray, Q: np.ndarray, r: float, u: float, W0: float,
+                 delta_Q_max: float | None = None) -> float:
+    import matplotlib.pyplot as plt
+
     Q0 = float(Q[0])
     drift = np.abs(Q - Q0)
-    delta_Q_max = float(np.nanmax(drift))
+    if delta_Q_max is None:  # a decimated trace can miss the true maximum; callers pass it
+        delta_Q_max = float(np.nanmax(drift))
     plt.figure(figsize=(6.0, 4.0), dpi=150)
     plt.plot(t, drift, "-", lw=1.4, color="#2ca02c")
     plt.xlabel("t")
@@ -210,6 +473,8 @@ def plot_Q_drift(fig_path: str, t: np.ndarray, Q: np.ndarray, r: float, u: float
 
 
 def plot_convergence(fig_path: str, dts: List[float], deltas: List[float], slope: float, r2: float) -> None:
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(6.0, 4.0), dpi=150)
     plt.plot(dts, deltas, "o-", lw=1.4, color="#d62728")
     plt.xscale("log")
@@ -226,17 +491,22 @@ def plot_convergence(fig_path: str, dts: List[float], deltas: List[float], slope
 
 def main():
     parser = argparse.ArgumentParser(description="Validate the Q invariant for the logistic on-site law.")
-    parser.add_argument("--r", type=float, required=True, help="Growth rate r")
-    parser.add_argument("--u", type=float, required=True, help="Saturation coefficient u")
+    parser.add_argument("--r", type=float, nargs="+", required=True, help="Growth rate(s) r (first is the primary)")
+    parser.add_argument("--u", type=float, nargs="+", required=True, help="Saturation coefficient(s) u (first is the primary)")
     parser.add_argument("--W0", type=float, nargs="+", required=True, help="Initial condition(s) W0 (one or more)")
     parser.add_argument("--T", type=float, default=40.0, help="Total time horizon")
     parser.add_argument("--dt", type=float, nargs="+", default=[1e-3], help="Time step(s) for integration")
     parser.add_argument("--solver", type=str, default="rk4", choices=["rk4", "euler"], help="Time-stepping scheme")
+    parser.add_argument("--trace_points", type=int, default=4000,
+                        help="Samples kept of the primary trajectory for figures (0 = every step)")
     parser.add_argument("--outdir", type=str, default=None, help="Base output dir override (figures/logs)")
+    add_figure_args(parser)
     args = parser.parse_args()
 
-    r = float(args.r)
-    u = float(args.u)
+    r_list = [float(x) for x in args.r]
+    u_list = [float(x) for x in args.u]
+    r = r_list[0]
+    u = u_list[0]
     W0_list = [float(x) for x in args.W0]
     dt_list = [float(x) for x in args.dt]
     T = float(args.T)
@@ -251,59 +521,45 @@ def main():
     Path(ARXIV_FIG_DIR).mkdir(parents=True, exist_ok=True)
     stamp = current_stamp()
 
-    run_metrics: List[RunMetrics] = []
-
-    # For the first W0 and finest dt, produce overlay and Q-drift figures
+    # For the first r, u, W0 and finest dt, produce overlay and Q-drift figures
     W0_primary = W0_list[0]
     dt_primary = min(dt_list)
 
-    t_p, W_num_p = integrate_numeric(r, u, W0_primary, T, dt_primary, solver=solver)
+    # Every (r, u, W0, dt) combination in one batch; only the primary row keeps its trajectory
+    grid = validation_grid(r_list, u_list, W0_list, dt_list)
+    primary = int(np.flatnonzero((grid["r"] == r) & (grid["u"] == u) & (grid["W0"] == W0_primary)
+                                 & (grid["dt"] == dt_primary))[0])
+    # drift and W range are reduced while integrating; only a decimated primary trace is kept
+    N_primary = max(1, int(round(T / dt_primary)))
+    stride = max(1, -(-N_primary // args.trace_points)) if args.trace_points > 0 else 1
+    batch = integrate_batch(grid["r"], grid["u"], grid["W0"], T, grid["dt"], solver=solver, keep=(primary,),
+                            stride=stride)
+
+    t_p, W_num_p = batch["trajectories"][primary]
     W_an_p = logistic_analytic(r, u, W0_primary, t_p)
     Q_p = Q_invariant(r, u, W_num_p, t_p)
-    delta_Q_max_p = float(np.nanmax(np.abs(Q_p - Q_p[0])))
-
-    sol_fig = ""
-    drift_fig = ""
+    delta_Q_max_p = float(batch["delta_Q_max"][primary])
     # Defer plotting until pass/fail is known
 
-    # Placeholders; will be assigned only on PASS
-    sol_fig_stable = ""
-    drift_fig_stable = ""
-    sol_fig_arxiv = ""
-    drift_fig_arxiv = ""
-
-    run_metrics.append(RunMetrics(r=r, u=u, solver=solver, dt=dt_primary, T=T, W0=W0_primary,
-                                  delta_Q_max=delta_Q_max_p, W_min=float(np.min(W_num_p)), W_max=float(np.max(W_num_p))))
-
-    # Convergence study on the first W0 across dt list
-    deltas = []
-    dts_sorted = sorted(dt_list, reverse=True)  # larger to smaller for plotting clarity
-    for dt in dts_sorted:
-        t_c, W_num_c = integrate_numeric(r, u, W0_primary, T, dt, solver=solver)
-        Q_c = Q_invariant(r, u, W_num_c, t_c)
-        deltaQ = float(np.nanmax(np.abs(Q_c - Q_c[0])))
-        deltas.append(deltaQ)
-        run_metrics.append(RunMetrics(r=r, u=u, solver=solver, dt=dt, T=T, W0=W0_primary,
-                                      delta_Q_max=deltaQ, W_min=float(np.min(W_num_c)), W_max=float(np.max(W_num_c))))
-
-    # Fit slope on positive finite pairs
-    dts_arr = np.array(dts_sorted, dtype=np.float64)
-    deltas_arr = np.array(deltas, dtype=np.float64)
+    run_metrics: List[RunMetrics] = [
+        RunMetrics(r=float(grid["r"][b]), u=float(grid["u"][b]), solver=solver, dt=float(grid["dt"][b]), T=T,
+                   W0=float(grid["W0"][b]), delta_Q_max=float(batch["delta_Q_max"][b]),
+                   W_min=float(batch["W_min"][b]), W_max=float(batch["W_max"][b]))
+        for b in range(grid["r"].size)
+    ]
+
+    # Convergence study across the dt list for every (r, u, W0); the primary one is gated
+    conv_all: List[ConvergenceMetrics] = []
+    for rr in r_list:
+        for uu in u_list:
+            for w0 in W0_list:
+                sel = (grid["r"] == rr) & (grid["u"] == uu) & (grid["W0"] == w0)
+                conv_all.append(convergence_fit(rr, uu, solver, grid["dt"][sel], batch["delta_Q_max"][sel]))
+    conv_metrics = conv_all[0]
+    slope, r2 = conv_metrics.slope, conv_metrics.r2
+    dts_arr = np.array(conv_metrics.dts, dtype=np.float64)
+    deltas_arr = np.array(conv_metrics.delta_Q_max_list, dtype=np.float64)
     mask = np.isfinite(dts_arr) & np.isfinite(deltas_arr) & (dts_arr > 0) & (deltas_arr > 0)
-    if np.count_nonzero(mask) >= 2:
-        slope, intercept, r2 = fit_loglog(dts_arr[mask], deltas_arr[mask])
-    else:
-        slope, intercept, r2 = float("nan"), float("nan"), float("nan")
-
-    conv_fig = ""
-    conv_fig_stable = ""
-    conv_fig_arxiv = ""
-    # Defer plotting of convergence until pass/fail is known
-
-    conv_metrics = ConvergenceMetrics(
-        r=r, u=u, solver=solver, dts=list(dts_arr), delta_Q_max_list=list(deltas_arr),
-        slope=slope, intercept=intercept, r2=r2
-    )
 
     # Acceptance criteria and pass/fail routing (repo pattern)
     drift_gate = 1e-8 if solver == "rk4" else 1e-5
@@ -311,6 +567,9 @@ def main():
     expected_order = 4 if solver == "rk4" else 1
     order_tol = 0.4
     drift_ok = math.isfinite(delta_Q_max_p) and (delta_Q_max_p <= drift_gate)
+    # informational: every (r, u, W0) at the finest dt under the same gate
+    finest = grid["dt"] == dt_primary
+    drift_ok_all = bool(np.all(np.isfinite(batch["delta_Q_max"][finest]) & (batch["delta_Q_max"][finest] <= drift_gate)))
     if np.count_nonzero(mask) >= 2 and math.isfinite(slope) and math.isfinite(r2):
         conv_ok = (r2 >= conv_r2_min) and (abs(slope - expected_order) <= order_tol)
     else:
@@ -326,25 +585,29 @@ def main():
     sol_fig_final = io_paths.figure_path(domain, sol_slug, failed=failed_flag)
     drift_fig_final = io_paths.figure_path(domain, drift_slug, failed=failed_flag)
 
-    plot_solution_overlay(sol_fig_final, t_p, W_num_p, W_an_p, r, u, W0_primary)
-    plot_Q_drift(drift_fig_final, t_p, Q_p, r, u, W0_primary)
+    figs = FigureService(args.figure_mode)
+    figs.submit(sol_fig_final, plot_solution_overlay, sol_fig_final, t_p, W_num_p, W_an_p, r, u, W0_primary)
+    figs.submit(drift_fig_final, plot_Q_drift, drift_fig_final, t_p, Q_p, r, u, W0_primary,
+                delta_Q_max=delta_Q_max_p)
 
     # Convergence (only if we have data to show)
     conv_fig_final: Path | None = None
     if np.count_nonzero(mask) >= 2:
         conv_slug = f"{stamp}_qVDM_convergence"
         conv_fig_final = io_paths.figure_path(domain, conv_slug, failed=failed_flag)
-        plot_convergence(conv_fig_final, list(dts_arr[mask]), list(deltas_arr[mask]), slope, r2)
+        figs.submit(conv_fig_final, plot_convergence, conv_fig_final, list(dts_arr[mask]), list(deltas_arr[mask]), slope, r2)
+    # arXiv copies below need the rendered files
+    figs.close()
 
     sol_fig_final_str = str(sol_fig_final)
     drift_fig_final_str = str(drift_fig_final)
     conv_fig_final_str = str(conv_fig_final) if conv_fig_final else ""
 
-    # Produce arXiv copies ONLY on PASS
+    # Produce arXiv copies ONLY on PASS (and only when figures were rendered this run)
     sol_fig_stable = ""  # retained for JSON schema; not used when using io_paths
     drift_fig_stable = ""
     conv_fig_stable = ""
-    if passed:
+    if passed and figs.renders:
         try:
             os.makedirs(ARXIV_FIG_DIR, exist_ok=True)
             sol_fig_arxiv = os.path.join(ARXIV_FIG_DIR, "qVDM_solution_overlay.png")
@@ -357,7 +620,7 @@ def main():
         except Exception:
             pass
     else:
-        # On failure, ensure arXiv placeholders remain blank
+        # On failure or deferred figures, ensure arXiv placeholders remain blank
         sol_fig_arxiv = ""
         drift_fig_arxiv = ""
         conv_fig_arxiv = ""
@@ -367,9 +630,11 @@ def main():
     payload: Dict[str, object] = {
         "version": "1.0",
         "timestamp_utc": stamp,
-        "params": {"r": r, "u": u, "T": T, "solver": solver, "W0_list": W0_list, "dt_list": dt_list},
+        "params": {"r": r, "u": u, "T": T, "solver": solver, "W0_list": W0_list, "dt_list": dt_list,
+                   "r_list": r_list, "u_list": u_list},
         "runs": [asdict(m) for m in run_metrics],
         "convergence": asdict(conv_metrics),
+        "convergence_all": [asdict(m) for m in conv_all],
         "figures": {
             "solution_overlay": sol_fig_final_str,
             "solution_overlay_stable": sol_fig_stable,
@@ -380,6 +645,7 @@ def main():
             "convergence": conv_fig_final_str,
             "convergence_stable": conv_fig_stable,
             "convergence_arxiv": conv_fig_arxiv,
+            "mode": figs.mode,
         },
         "acceptance": {
             "drift_gate": drift_gate,
@@ -387,6 +653,7 @@ def main():
             "convergence_r2_min": conv_r2_min,
             "order_tol": order_tol,
             "drift_ok": drift_ok,
+            "drift_ok_all": drift_ok_all,
             "convergence_ok": conv_ok,
             "passed": passed
         }
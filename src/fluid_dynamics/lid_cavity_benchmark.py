@@ -29,7 +29,6 @@ import importlib.util
 import sys
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 import common.io_paths as io_paths
 
@@ -649,6 +648,8 @@ def main():
     if (not np.isfinite(wlim)) or wlim <= 0.0:
         wlim = float(np.nanmax(np.abs(om))) if np.isfinite(np.nanmax(np.abs(om))) else 1e-12
 
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(1, 2, figsize=(12, 5), constrained_layout=True)
     ax0, ax1 = axes[0], axes[1]
 
@@ -16,6 +16,8 @@ CHANGE REASON:
 Outputs (defaults):
 - Figures → figures/fluid_dynamics/<timestamp>_taylor_green_benchmark.png
 - Logs    → logs/fluid_dynamics/<timestamp>_taylor_green_benchmark.json
+  (--no-figures writes <figure>.figspec.pkl instead; render later with
+   python -m src.common.figure_service figures/fluid_dynamics)
 """
 import argparse
 import json
@@ -26,7 +28,6 @@ from pathlib import Path
 import sys
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 import common.io_paths as io_paths
@@ -50,6 +51,7 @@ def _add_repo_root() -> None:
 _add_repo_root()
 
 from src.fluid_dynamics.fluids.lbm2d import LBM2D, LBMConfig, CS2  # noqa: E402
+from src.common.figure_service import FigureService, add_figure_args  # noqa: E402
 
 
 def init_taylor_green(sim: LBM2D, U0=0.05, k=2*math.pi):
@@ -66,6 +68,21 @@ def energy(ux, uy):
     return 0.5 * float(np.mean(ux**2 + uy**2))
 
 
+def plot_energy_decay(fig_path, ts, Es, slope, intercept, nu_fit, nu_th, rel_err):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(7, 5))
+    plt.semilogy(ts, Es, "o", ms=3, label="E(t) samples")
+    plt.semilogy(ts, np.exp(intercept + slope * ts), "r--",
+                 label=f"fit: nu_fit={nu_fit:.5f}, nu_th={nu_th:.5f}, rel_err={rel_err:.3%}")
+    plt.xlabel("t (lattice)")
+    plt.ylabel("E(t)")
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(fig_path, dpi=140)
+    plt.close()
+
+
 def main():
     ap = argparse.ArgumentParser(description="Taylor-Green vortex viscosity recovery (LBM→NS).")
     ap.add_argument("--nx", type=int, default=256)
@@ -76,6 +93,7 @@ def main():
     ap.add_argument("--steps", type=int, default=5000)
     ap.add_argument("--sample_every", type=int, default=50)
     ap.add_argument("--outdir", type=str, default=None, help="base output dir; defaults to the repository root (figures/, logs/)")
+    add_figure_args(ap)
     args = ap.parse_args()
 
     cfg = LBMConfig(nx=args.nx, ny=args.ny, tau=args.tau, periodic_x=True, periodic_y=True)
@@ -134,16 +152,8 @@ def main():
     fig_path = io_paths.figure_path(domain, slug, failed=not passed)
     log_path = io_paths.log_path(domain, slug, failed=not passed)
 
-    plt.figure(figsize=(7, 5))
-    plt.semilogy(ts, Es, "o", ms=3, label="E(t) samples")
-    plt.semilogy(ts, np.exp(intercept + slope * ts), "r--",
-                 label=f"fit: nu_fit={nu_fit:.5f}, nu_th={nu_th:.5f}, rel_err={rel_err:.3%}")
-    plt.xlabel("t (lattice)")
-    plt.ylabel("E(t)")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(fig_path, dpi=140)
-    plt.close()
+    figs = FigureService(args.figure_mode)
+    fig_out = figs.submit(fig_path, plot_energy_decay, fig_path, ts, Es, slope, intercept, nu_fit, nu_th, rel_err)
 
     payload = {
         "theory": "LBM→NS; Taylor-Green viscous decay E=E0 exp(-2 nu k^2 t)",
@@ -158,11 +168,12 @@ def main():
             "elapsed_sec": float(elapsed),
             "passed": passed
         },
-        "outputs": {"figure": str(fig_path), "log": str(log_path)},
+        "outputs": {"figure": str(fig_path), "figure_spec": None if figs.renders else str(fig_out), "log": str(log_path)},
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
     }
 
     io_paths.write_log(log_path, payload)
+    figs.close()
 
     print(json.dumps(payload["metrics"], indent=2))
 
@@ -15,33 +15,41 @@ Implements a leaky first-order memory filter with saturation and runs:
 - Lyapunov monotonicity for constant s (noise-free).
 - Reproducibility: identical sequences for the same seed.
 
+Ensembles: acceptance_ensemble runs the whole suite for every (seed, g, λ) in one call;
+run_filter_batch advances all rows together (vectorized noise draws and saturation) and
+fit_pole_from_step_batch / snr_db_batch compute the metrics for the whole batch. Row b
+reproduces the single-run experiments for (seed[b], g[b], lam[b]).
+
 CLI:
   python -m Prometheus_VDM.derivation.src.physics.memory_steering.memory_steering_acceptance \
       --seed 0 --steps 512 --g 0.12 --lam 0.08 --noise_std 0.0
+  # plus 200 seeds over a g/λ grid (summary under "ensemble" in the JSON)
+  ... --ensemble_seeds 200 --g_list 0.06 0.12 0.18 --lam_list 0.04 0.08
 
 Outputs:
 - JSON metrics: logs/memory_steering/<timestamp>_memory_steering_acceptance.json
 - Figures (PNG): figures/memory_steering/<timestamp>_memory_steering_acceptance_*.png
+  (--figure_mode async renders them in a process pool; --no-figures writes <figure>.figspec.pkl
+  specs to render later with python -m src.common.figure_service figures/memory_steering)
 """
 
 import argparse
 import json
 import math
 import os
+import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
-import matplotlib
-matplotlib.use("Agg")  # headless/CI safe
-import matplotlib.pyplot as plt
 
 SRC_ROOT = Path(__file__).resolve().parents[1]
 if str(SRC_ROOT) not in sys.path:
     sys.path.append(str(SRC_ROOT))
 
 from src.common import io_paths
+from src.common.figure_service import FigureService, add_figure_args
 
 DOMAIN = "memory_steering"
 
@@ -100,7 +108,171 @@ def snr_db(signal, noise):
         return float('inf')
     return 10.0 * math.log10(ps / pn)
 
-def step_response_experiment(seed, steps, g, lam):
+def _row_generators(rng, B):
+    """None, one Generator shared by all rows, or one Generator per row."""
+    if rng is None or isinstance(rng, np.random.Generator):
+        return rng
+    rngs = list(rng)
+    if len(rngs) != B:
+        raise ValueError(f"expected {B} generators (one per row), got {len(rngs)}")
+    return rngs
+
+def run_filter_batch(s, g, lam, M0=None, rng=None, noise_std=0.0, noise=None):
+    """
+    Run the filter for a batch of rows at once: M (B, T) with row b equal to
+    run_filter(s[b], g[b], lam[b], M0[b], ...).
+
+    Args:
+        s: input sequences, (T,) shared by all rows or (B, T)
+        g, lam, noise_std: scalars or (B,) per-row values
+        M0: None (fixed point of s[:, 0], as run_filter), scalar or (B,)
+        rng: None, one Generator (a single (B, T-1) draw), or a sequence of B Generators; a
+             per-row generator draws the same stream as run_filter's per-step rng.normal calls
+        noise: precomputed additive noise (B, T-1); replaces the rng / noise_std draws
+
+    Returns:
+        M: np.ndarray (B, T)
+    """
+    s = np.asarray(s, dtype=float)
+    g = np.asarray(g, dtype=float)
+    lam = np.asarray(lam, dtype=float)
+    sd = np.asarray(noise_std, dtype=float)
+    B = int(np.broadcast(g, lam, sd, s[..., 0], np.asarray(0.0 if M0 is None else M0)).size)
+    S = np.broadcast_to(s, (B, s.shape[-1]))
+    g, lam, sd = (np.broadcast_to(x, (B,)) for x in (g, lam, sd))
+    T = S.shape[1]
+    if M0 is None:
+        s0 = S[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            M0 = np.where((g + lam) > 0, g * s0 / (g + lam), s0)
+
+    gens = _row_generators(rng, B)
+    eps = None if noise is None else np.broadcast_to(np.asarray(noise, dtype=float), (B, T - 1))
+    if eps is None and gens is not None and np.any(sd > 0.0):
+        if isinstance(gens, np.random.Generator):
+            eps = gens.normal(0.0, sd[:, None], size=(B, T - 1))
+        else:
+            eps = np.zeros((B, T - 1))
+            for b, gen in enumerate(gens):
+                if sd[b] > 0.0:
+                    eps[b] = gen.normal(0.0, sd[b], size=T - 1)
+
+    # time-major buffers keep each step's row slice contiguous
+    a = 1.0 - lam - g
+    gS = np.ascontiguousarray((g[:, None] * S).T)
+    eps_t = None if eps is None else np.ascontiguousarray(eps.T)
+    Mt = np.empty((T, B), dtype=float)
+    Mt[0] = np.clip(np.broadcast_to(np.asarray(M0, dtype=float), (B,)), 0.0, 1.0)
+    nxt = np.empty(B, dtype=float)
+    for t in range(T - 1):
+        np.multiply(a, Mt[t], out=nxt)
+        nxt += gS[t]
+        if eps_t is not None:
+            nxt += eps_t[t]
+        np.maximum(nxt, 0.0, out=nxt)  # saturation to [0, 1] (np.clip is slower per call)
+        np.minimum(nxt, 1.0, out=Mt[t + 1])
+    return np.ascontiguousarray(Mt.T)
+
+def fit_pole_from_step_batch(M, s, g, lam, t_step):
+    """
+    fit_pole_from_step for every row of M (B, T) at once (closed-form masked least squares).
+
+    Returns:
+        p_fit, p_pred, M_star (B,) and resid (B, T); p_fit is NaN where fewer than 5 residuals
+        exceed 1e-10 or the post-step window is too short.
+    """
+    M = np.asarray(M, dtype=float)
+    B, T = M.shape
+    s1 = np.broadcast_to(np.asarray(s, dtype=float), (B, T))[:, -1]
+    g = np.broadcast_to(np.asarray(g, dtype=float), (B,))
+    lam = np.broadcast_to(np.asarray(lam, dtype=float), (B,))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        M_star = np.where((g + lam) > 0, g * s1 / (g + lam), s1)
+    p_pred = 1.0 - lam - g
+    resid = M - M_star[:, None]
+    p_fit = np.full(B, np.nan)
+    start, end = t_step + 2, T - 2
+    if end <= start + 5:
+        return p_fit, p_pred, M_star, resid
+    r = resid[:, start:end]
+    mask = np.abs(r) > 1e-10
+    x = np.arange(start, end, dtype=float)[None, :]
+    with np.errstate(divide="ignore"):
+        y = np.where(mask, np.log(np.abs(r)), 0.0)
+    n = mask.sum(axis=1)
+    sx = np.where(mask, x, 0.0).sum(axis=1)
+    sxx = np.where(mask, x * x, 0.0).sum(axis=1)
+    sy = y.sum(axis=1)
+    sxy = (np.where(mask, x, 0.0) * y).sum(axis=1)
+    ok = n >= 5
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # least-squares slope of log|resid| against t (the fit lstsq solves in fit_pole_from_step)
+        mx = sx / n
+        b = (sxy - mx * sy) / (sxx - mx * sx)
+    p_fit[ok] = np.exp(b[ok])
+    return p_fit, p_pred, M_star, resid
+
+def snr_db_batch(signal, noise):
+    """snr_db along the last axis (inf where the noise variance is ≤ 1e-20)."""
+    ps = np.var(signal, axis=-1)
+    pn = np.var(noise, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 10.0 * np.log10(ps / pn)
+    return np.where(pn <= 1e-20, np.inf, out)
+
+def _pyplot():
+    """Headless pyplot, imported on the first render so CLI and pool-worker startup stay light."""
+    import matplotlib
+    matplotlib.use("Agg")  # headless/CI safe
+    import matplotlib.pyplot as plt
+    return plt
+
+def render_step_response(fig_path, s, M, t_step, M_star, g, lam, p_fit, p_pred):
+    plt = _pyplot()
+    steps = len(M)
+    ts = np.arange(steps)
+    plt.figure(figsize=(7, 4))
+    plt.plot(ts, s, 'k--', label='s(t)')
+    plt.plot(ts, M, 'b-', label='M(t)')
+    plt.axvline(t_step, color='gray', alpha=0.3)
+    plt.hlines([M_star], 0, steps-1, colors='r', linestyles=':', label='M* (pred)')
+    plt.title(f"Step Response (g={g:.3f}, λ={lam:.3f}) | p_fit={p_fit:.3f}, p_pred={p_pred:.3f}")
+    plt.xlabel('t'); plt.ylabel('value'); plt.legend(loc='best')
+    plt.tight_layout(); plt.savefig(fig_path, dpi=150); plt.close()
+
+def render_canonical_void(fig_path, M, lam, g, seed, M_final):
+    plt = _pyplot()
+    steps = len(M)
+    ts = np.arange(steps)
+    plt.figure(figsize=(7, 3.5))
+    plt.plot(ts, M, 'b-', label='M(t)')
+    plt.hlines([0.6], 0, steps-1, colors='r', linestyles=':', label='0.6 target')
+    plt.title(f"Canonical Void Target | g=1.5λ, λ={lam:.3f}, g={g:.3f}, seed={seed}, M_final={M_final:.3f}")
+    plt.xlabel('t'); plt.ylabel('M'); plt.legend(loc='best')
+    plt.tight_layout(); plt.savefig(fig_path, dpi=150); plt.close()
+
+def render_noise_suppression(fig_path, s, M_full, M_signal, delta_snr):
+    plt = _pyplot()
+    t = np.arange(len(s))
+    plt.figure(figsize=(7, 4))
+    plt.plot(t, s, color='gray', alpha=0.5, label='s = signal + noise')
+    plt.plot(t, M_full, 'b-', label='M(s)')
+    plt.plot(t, M_signal, 'g--', label='M(signal)')
+    plt.title(f"Noise Suppression (ΔSNR={delta_snr:.2f} dB)")
+    plt.xlabel('t'); plt.ylabel('value'); plt.legend(loc='best')
+    plt.tight_layout(); plt.savefig(fig_path, dpi=150); plt.close()
+
+def render_lyapunov(fig_path, dF, frac_positive, median_dF):
+    plt = _pyplot()
+    t = np.arange(1, len(dF) + 1)
+    plt.figure(figsize=(7, 3.5))
+    plt.plot(t, dF, 'm-', alpha=0.7)
+    plt.axhline(0.0, color='k', linewidth=0.8)
+    plt.title(f"Lyapunov ΔF (frac>0 = {frac_positive:.3f}, median={median_dF:.3e})")
+    plt.xlabel('t'); plt.ylabel('ΔF')
+    plt.tight_layout(); plt.savefig(fig_path, dpi=150); plt.close()
+
+def step_response_experiment(seed, steps, g, lam, figs=None):
     rng = np.random.default_rng(seed)
     t_step = 64 if steps > 100 else max(4, steps // 4)
     s0, s1 = 0.2, 0.8
@@ -116,17 +288,10 @@ def step_response_experiment(seed, steps, g, lam):
     step_amp = abs((g * s1 / (g + lam)) - (g * s0 / (g + lam))) if (g + lam) > 0 else abs(s1 - s0)
     overshoot = float(max(0.0, np.max(M) - max(M_star, M0))) / (step_amp + 1e-12)
     # Plot
-    ts = np.arange(steps)
-    plt.figure(figsize=(7, 4))
-    plt.plot(ts, s, 'k--', label='s(t)')
-    plt.plot(ts, M, 'b-', label='M(t)')
-    plt.axvline(t_step, color='gray', alpha=0.3)
-    plt.hlines([M_star], 0, steps-1, colors='r', linestyles=':', label='M* (pred)')
-    plt.title(f"Step Response (g={g:.3f}, λ={lam:.3f}) | p_fit={p_fit:.3f}, p_pred={p_pred:.3f}")
-    plt.xlabel('t'); plt.ylabel('value'); plt.legend(loc='best')
+    figs = figs if figs is not None else FigureService("sync")
     slug = f"step_response_g{g:.3f}_lam{lam:.3f}"
     fig_path = io_paths.figure_path(DOMAIN, slug)
-    plt.tight_layout(); plt.savefig(fig_path, dpi=150); plt.close()
+    figs.submit(fig_path, render_step_response, fig_path, s, M, t_step, M_star, g, lam, p_fit, p_pred)
     return {
         "p_fit": p_fit,
         "p_pred": p_pred,
@@ -139,8 +304,9 @@ def step_response_experiment(seed, steps, g, lam):
         "pass_overshoot": overshoot <= 0.02
     }
 
-def canonical_void_experiment_multi(steps):
+def canonical_void_experiment_multi(steps, figs=None):
     """Test the 0.6 target for seeds {0,1,2}; deterministic here (no noise)."""
+    figs = figs if figs is not None else FigureService("sync")
     results = []
     lam = 0.1
     g = 1.5 * lam
@@ -150,15 +316,9 @@ def canonical_void_experiment_multi(steps):
         M = run_filter(s, g, lam, M0=0.0, rng=rng, noise_std=0.0)
         M_final = float(np.mean(M[int(0.9 * steps):]))
         # Plot each seed lightly; last one will be representative
-        ts = np.arange(steps)
-        plt.figure(figsize=(7, 3.5))
-        plt.plot(ts, M, 'b-', label='M(t)')
-        plt.hlines([0.6], 0, steps-1, colors='r', linestyles=':', label='0.6 target')
-        plt.title(f"Canonical Void Target | g=1.5λ, λ={lam:.3f}, g={g:.3f}, seed={seed}, M_final={M_final:.3f}")
-        plt.xlabel('t'); plt.ylabel('M'); plt.legend(loc='best')
         slug = f"canonical_void_seed{seed}_lam{lam:.3f}"
         fig_path = io_paths.figure_path(DOMAIN, slug)
-        plt.tight_layout(); plt.savefig(fig_path, dpi=150); plt.close()
+        figs.submit(fig_path, render_canonical_void, fig_path, M, lam, g, seed, M_final)
         results.append({
             "seed": seed, "lam": lam, "g": g, "target": 0.6, "M_final": M_final,
             "figure": str(fig_path),
@@ -167,7 +327,7 @@ def canonical_void_experiment_multi(steps):
     overall_pass = all(r["pass_target"] for r in results)
     return {"seeds": [0,1,2], "results": results, "overall_pass": overall_pass, "lam": lam, "g": g}
 
-def noise_suppression_experiment(seed, steps, g, lam, noise_std=0.05):
+def noise_suppression_experiment(seed, steps, g, lam, noise_std=0.05, figs=None):
     rng = np.random.default_rng(seed)
     t = np.arange(steps)
     # Base signal around 0.5 with amplitude 0.3, clipped to [0,1]
@@ -181,15 +341,10 @@ def noise_suppression_experiment(seed, steps, g, lam, noise_std=0.05):
     snr_in = snr_db(s_signal, np.clip(s - s_signal, -1e6, 1e6))
     snr_out = snr_db(M_signal, noise_out)
     # Plot
-    plt.figure(figsize=(7, 4))
-    plt.plot(t, s, color='gray', alpha=0.5, label='s = signal + noise')
-    plt.plot(t, M_full, 'b-', label='M(s)')
-    plt.plot(t, M_signal, 'g--', label='M(signal)')
-    plt.title(f"Noise Suppression (ΔSNR={snr_out - snr_in:.2f} dB)")
-    plt.xlabel('t'); plt.ylabel('value'); plt.legend(loc='best')
+    figs = figs if figs is not None else FigureService("sync")
     slug = f"noise_suppression_g{g:.3f}_lam{lam:.3f}"
     fig_path = io_paths.figure_path(DOMAIN, slug)
-    plt.tight_layout(); plt.savefig(fig_path, dpi=150); plt.close()
+    figs.submit(fig_path, render_noise_suppression, fig_path, s, M_full, M_signal, snr_out - snr_in)
     return {
         "snr_in_db": snr_in,
         "snr_out_db": snr_out,
@@ -208,7 +363,7 @@ def boundedness_experiment(seed, steps, g, lam):
         "pass_bounded": violations == 0
     }
 
-def lyapunov_experiment(seed, steps, g, lam):
+def lyapunov_experiment(seed, steps, g, lam, figs=None):
     rng = np.random.default_rng(seed)
     s = np.ones(steps) * 0.7
     M_star = g * 0.7 / (g + lam) if (g + lam) > 0 else 0.7
@@ -219,15 +374,10 @@ def lyapunov_experiment(seed, steps, g, lam):
     frac_positive = float(np.mean(dF > 1e-15))
     median_dF = float(np.median(dF))
     # Plot
-    t = np.arange(1, steps)
-    plt.figure(figsize=(7, 3.5))
-    plt.plot(t, dF, 'm-', alpha=0.7)
-    plt.axhline(0.0, color='k', linewidth=0.8)
-    plt.title(f"Lyapunov ΔF (frac>0 = {frac_positive:.3f}, median={median_dF:.3e})")
-    plt.xlabel('t'); plt.ylabel('ΔF')
+    figs = figs if figs is not None else FigureService("sync")
     slug = f"lyapunov_g{g:.3f}_lam{lam:.3f}"
     fig_path = io_paths.figure_path(DOMAIN, slug)
-    plt.tight_layout(); plt.savefig(fig_path, dpi=150); plt.close()
+    figs.submit(fig_path, render_lyapunov, fig_path, dF, frac_positive, median_dF)
     return {
         "frac_positive": frac_positive,
         "median_dF": median_dF,
@@ -248,6 +398,125 @@ def reproducibility_check(seed, steps, g, lam, noise_std=0.0):
         "pass_repro": max_abs_diff <= 1e-12
     }
 
+def ensemble_grid(seeds, g_list, lam_list):
+    """Every (seed, g, λ) combination as flat arrays, seed slowest and λ fastest."""
+    S, G, L = np.meshgrid(np.asarray(seeds, dtype=np.int64), np.asarray(g_list, dtype=float),
+                          np.asarray(lam_list, dtype=float), indexing="ij")
+    return {"seed": S.ravel(), "g": G.ravel(), "lam": L.ravel()}
+
+def _seed_draws(seeds, draw):
+    """draw(rng) for each distinct seed from a fresh default_rng(seed), gathered per row."""
+    uniq, inv = np.unique(seeds, return_inverse=True)
+    return np.stack([draw(np.random.default_rng(int(sd))) for sd in uniq])[inv]
+
+def acceptance_ensemble(seeds, g_list, lam_list, steps, noise_std=0.0, snr_noise_std=0.05):
+    """
+    The acceptance suite for every (seed, g, λ) in one call: each experiment runs as one
+    run_filter_batch over all rows and its metrics are computed for the whole batch. Row b
+    reproduces the single-run experiment with (seed[b], g[b], lam[b]); the canonical void
+    check uses g = 1.5 λ for each λ of the row.
+
+    Args:
+        seeds: RNG seeds (each drives the noise / random inputs of its rows)
+        g_list, lam_list: parameter grids
+        steps: sequence length T
+        noise_std: process noise for the reproducibility check
+        snr_noise_std: input noise for the noise-suppression check
+
+    Returns:
+        dict with the grid ('seed', 'g', 'lam'), per-check metric and pass arrays (B,), and
+        'summary': pass fraction per check plus 'overall_pass_fraction'.
+    """
+    grid = ensemble_grid(seeds, g_list, lam_list)
+    g, lam, seed = grid["g"], grid["lam"], grid["seed"]
+    B = g.size
+    out = dict(grid)
+
+    # Step response (deterministic)
+    t_step = 64 if steps > 100 else max(4, steps // 4)
+    s0, s1 = 0.2, 0.8
+    s = np.ones(steps) * s0
+    s[t_step:] = s1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        M0 = np.where((g + lam) > 0, g * s0 / (g + lam), s0)
+        step_amp = np.where((g + lam) > 0, np.abs(g * s1 / (g + lam) - g * s0 / (g + lam)), abs(s1 - s0))
+    M = run_filter_batch(s, g, lam, M0=M0)
+    p_fit, p_pred, M_star, _ = fit_pole_from_step_batch(M, s, g, lam, t_step)
+    M_final = M[:, int(0.9 * steps):].mean(axis=1)
+    overshoot = np.maximum(0.0, M.max(axis=1) - np.maximum(M_star, M0)) / (step_amp + 1e-12)
+    out.update(p_fit=p_fit, p_pred=p_pred, M_star_pred=M_star, M_final=M_final, overshoot=overshoot,
+               pass_pole=np.isfinite(p_fit) & (np.abs(p_fit - p_pred) <= 0.02),
+               pass_Mstar=np.abs(M_final - M_star) <= 1e-2,
+               pass_overshoot=overshoot <= 0.02)
+
+    # Canonical void target: g = 1.5 λ, s ≡ 1, M0 = 0
+    M = run_filter_batch(np.ones(steps), 1.5 * lam, lam, M0=0.0)
+    out["canonical_M_final"] = M[:, int(0.9 * steps):].mean(axis=1)
+    out["pass_target"] = np.abs(out["canonical_M_final"] - 0.6) <= 0.02
+
+    # Noise suppression: one input-noise draw per seed, shared by that seed's rows
+    t = np.arange(steps)
+    s_signal = 0.5 + 0.3 * np.sin(2 * np.pi * t / 128.0)
+    noise_in = _seed_draws(seed, lambda r: r.normal(0.0, snr_noise_std, size=steps))
+    s_noisy = np.clip(s_signal + noise_in, 0.0, 1.0)
+    M_full = run_filter_batch(s_noisy, g, lam)
+    M_signal = run_filter_batch(s_signal, g, lam)
+    snr_in = snr_db_batch(np.broadcast_to(s_signal, s_noisy.shape), np.clip(s_noisy - s_signal, -1e6, 1e6))
+    snr_out = snr_db_batch(M_signal, M_full - M_signal)
+    out.update(snr_in_db=snr_in, snr_out_db=snr_out, delta_snr_db=snr_out - snr_in,
+               pass_snr=(snr_out - snr_in) >= 3.0)
+
+    # Boundedness under uniform random input
+    M = run_filter_batch(_seed_draws(seed, lambda r: r.uniform(0.0, 1.0, size=steps)), g, lam)
+    out["violations"] = np.sum((M < -1e-12) | (M > 1.0 + 1e-12), axis=1)
+    out["pass_bounded"] = out["violations"] == 0
+
+    # Lyapunov monotonicity for constant input
+    with np.errstate(divide="ignore", invalid="ignore"):
+        M_star = np.where((g + lam) > 0, g * 0.7 / (g + lam), 0.7)
+    M = run_filter_batch(np.ones(steps) * 0.7, g, lam, M0=0.0)
+    dF = np.diff(0.5 * (M - M_star[:, None]) ** 2, axis=1)
+    out["frac_positive"] = np.mean(dF > 1e-15, axis=1)
+    out["median_dF"] = np.median(dF, axis=1)
+    out["pass_lyapunov"] = (out["frac_positive"] <= 0.01) & (out["median_dF"] < 0.0)
+
+    # Reproducibility: two passes, each drawing its noise from fresh per-seed generators
+    s_rep = np.ones(steps) * 0.3
+    passes = []
+    for _ in range(2):
+        eps = _seed_draws(seed, lambda r: r.normal(0.0, noise_std, size=steps - 1)) if noise_std > 0.0 else None
+        passes.append(run_filter_batch(s_rep, g, lam, noise=eps))
+    M1, M2 = passes
+    out["max_abs_diff"] = np.max(np.abs(M1 - M2), axis=1)
+    out["pass_repro"] = out["max_abs_diff"] <= 1e-12
+
+    checks = ["pass_pole", "pass_Mstar", "pass_overshoot", "pass_target", "pass_snr", "pass_bounded",
+              "pass_lyapunov", "pass_repro"]
+    out["overall_pass"] = np.logical_and.reduce([out[c] for c in checks])
+    out["summary"] = {c: float(np.mean(out[c])) for c in checks}
+    out["summary"]["overall_pass_fraction"] = float(np.mean(out["overall_pass"]))
+    out["summary"]["rows"] = B
+    return out
+
+def ensemble_summary(ens):
+    """JSON-ready digest of acceptance_ensemble: overall pass fractions and per-(g, λ) fractions over seeds."""
+    checks = [k for k in ens["summary"] if k.startswith("pass_")]
+    by_param = []
+    for g, lam in sorted(set(zip(ens["g"].tolist(), ens["lam"].tolist()))):
+        rows = (ens["g"] == g) & (ens["lam"] == lam)
+        entry = {"g": g, "lam": lam, "seeds": int(rows.sum())}
+        entry.update({c: float(np.mean(ens[c][rows])) for c in checks})
+        entry["overall_pass_fraction"] = float(np.mean(ens["overall_pass"][rows]))
+        entry["p_fit_mean"] = float(np.nanmean(ens["p_fit"][rows])) if np.any(np.isfinite(ens["p_fit"][rows])) else float("nan")
+        entry["delta_snr_db_mean"] = float(np.mean(ens["delta_snr_db"][rows]))
+        by_param.append(entry)
+    return {
+        "seeds": sorted(set(ens["seed"].tolist())),
+        "summary": ens["summary"],
+        "by_param": by_param,
+        "overall_pass": bool(np.all(ens["overall_pass"])),
+    }
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--seed", type=int, default=0)
@@ -255,17 +524,28 @@ def main():
     parser.add_argument("--g", type=float, default=0.12)
     parser.add_argument("--lam", type=float, default=0.08)
     parser.add_argument("--noise_std", type=float, default=0.0)
+    parser.add_argument("--ensemble_seeds", type=int, default=0,
+                        help="also run the suite over seeds seed..seed+N-1 for every (g, λ) of the grids (batched)")
+    parser.add_argument("--g_list", type=float, nargs="+", default=None, help="ensemble g grid (default: --g)")
+    parser.add_argument("--lam_list", type=float, nargs="+", default=None, help="ensemble λ grid (default: --lam)")
+    add_figure_args(parser)
     args = parser.parse_args()
 
     t0 = time.time()
+    figs = FigureService(args.figure_mode)
 
     # Run experiments
-    step_res = step_response_experiment(args.seed, args.steps, args.g, args.lam)
-    canon = canonical_void_experiment_multi(args.steps)
-    noise_res = noise_suppression_experiment(args.seed, args.steps, args.g, args.lam, noise_std=0.05)
+    step_res = step_response_experiment(args.seed, args.steps, args.g, args.lam, figs=figs)
+    canon = canonical_void_experiment_multi(args.steps, figs=figs)
+    noise_res = noise_suppression_experiment(args.seed, args.steps, args.g, args.lam, noise_std=0.05, figs=figs)
     bound_res = boundedness_experiment(args.seed, args.steps, args.g, args.lam)
-    lyap_res = lyapunov_experiment(args.seed, args.steps, args.g, args.lam)
+    lyap_res = lyapunov_experiment(args.seed, args.steps, args.g, args.lam, figs=figs)
     repro_res = reproducibility_check(args.seed, args.steps, args.g, args.lam, noise_std=args.noise_std)
+    ens_res = None
+    if args.ensemble_seeds > 0:
+        ens_res = ensemble_summary(acceptance_ensemble(
+            np.arange(args.seed, args.seed + args.ensemble_seeds), args.g_list or [args.g], args.lam_list or [args.lam],
+            args.steps, noise_std=args.noise_std))
 
     runtime = time.time() - t0
     p_pred = 1.0 - args.lam - args.g
@@ -282,8 +562,10 @@ def main():
         "boundedness": bound_res,
         "lyapunov": lyap_res,
         "reproducibility": repro_res,
-        "performance": {"runtime_s": runtime}
+        "performance": {"runtime_s": runtime, "figure_mode": figs.mode}
     }
+    if ens_res is not None:
+        metrics["ensemble"] = ens_res
 
     # Acceptance booleans
     passes = [
@@ -307,11 +589,15 @@ def main():
         },
         "overall_pass": all(passes)
     }
+    if ens_res is not None:
+        metrics["acceptance"]["checks"]["ensemble"] = ens_res["overall_pass"]
+        metrics["acceptance"]["overall_pass"] = all(passes) and ens_res["overall_pass"]
 
     # Save JSON
     log_slug = f"memory_steering_acceptance_{metrics['timestamp']}"
     out_json_path = io_paths.log_path(DOMAIN, log_slug, failed=not metrics["acceptance"]["overall_pass"])
     io_paths.write_log(out_json_path, metrics)
+    figs.close()
     out_json = str(out_json_path)
     print(f"[memory_steering] Acceptance {'PASS' if metrics['acceptance']['overall_pass'] else 'FAIL'}")
     print(f"Log saved: {out_json}")
@@ -30,14 +30,15 @@ Dimensionless groups used implicitly in the tests (see [write_ups/memory_steerin
 - We choose simple graph-native rulers (L, T, M0, R0) inside each test to demonstrate collapse
   and leave the physical alignment to φ’s (a, τ) to [write_ups/VDM_voxtrium_mapping.md](write_ups/VDM_voxtrium_mapping.md:44-80).
 
-Outputs (printed to stdout when run)
+Outputs (typed tables in a columnar results store under logs/memory_steering/, and the
+legacy CSV blocks printed to stdout)
 - Junction logistic:            “Theta*Delta_m, P(A)”
 - Curvature scaling:            “Theta*|grad m|, mean(kappa_path)”
 - Stability band:               “D_a, Lambda, Gamma, Retention, Fidelity_w, Fidelity_end, Fidelity_shuffle_end, Fidelity_edge_end, AUC_end, SNR_end”
 
 Usage
 - python3 VDM_rt/utils/memory_steering_experiments.py  > outputs/memory_steering_results.csv
-- The plotting helper (separate) converts the combined CSV into figures saved in outputs/.
+- The plotting helper (separate) loads the results store (or the legacy combined CSV) and saves figures.
 """
 
 # Classified dependency notice:
@@ -63,7 +64,10 @@ from vdm.memory_steering import (
     MEMORY_SOURCE,
     build_graph_laplacian,
     collect_junction_choices,
+    collect_junction_choices_batch,
     compute_dimensionless_groups,
+    edge_unit_directions,
+    sample_next_neighbor_heading_batch,
     transition_probs,
     update_memory,
     y_junction_adjacency,
@@ -73,7 +77,8 @@ SRC_ROOT = Path(__file__).resolve().parents[1]
 if str(SRC_ROOT) not in sys.path:
     sys.path.append(str(SRC_ROOT))
 
-from src.common import io_paths
+from src.common import io_paths, results_store
+from src.memory_steering.memory_steering_schema import STABILITY_COLUMNS
 
 
 # ---------------------------
@@ -112,11 +117,36 @@ def grid_neighbors(nx: int, ny: int, i: int) -> List[int]:
     return out
 
 
+def grid8_csr(nx: int, ny: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    8-neighbor grid (no wrap) as CSR neighbor lists plus node positions.
+    Nodes are row-major (i = y*nx + x); each node's neighbors are listed in increasing index.
+
+    Returns:
+        indptr (N+1,), indices (nnz,), pos (N, 2) with pos[i] = (x, y).
+    """
+    ys, xs = np.divmod(np.arange(nx * ny, dtype=np.int64), nx)
+    dy, dx = np.divmod(np.array([0, 1, 2, 3, 5, 6, 7, 8], dtype=np.int64), 3)
+    cx = xs[:, None] + (dx - 1)[None, :]
+    cy = ys[:, None] + (dy - 1)[None, :]
+    valid = (cx >= 0) & (cx < nx) & (cy >= 0) & (cy < ny)
+    indptr = np.zeros(nx * ny + 1, dtype=np.int64)
+    np.cumsum(valid.sum(axis=1), out=indptr[1:])
+    indices = (cy * nx + cx)[valid]
+    pos = np.stack([xs, ys], axis=1).astype(np.float64)
+    return indptr, indices, pos
+
+
 # ---------------------------
 # 1) Junction logistic collapse
 # ---------------------------
 
-def run_junction_logistic(theta: float = 2.0, delta_m_values: Sequence[float] = None, trials: int = 2000) -> Tuple[np.ndarray, np.ndarray]:
+def run_junction_logistic(
+    theta: float = 2.0,
+    delta_m_values: Sequence[float] = None,
+    trials: int = 2000,
+    method: str = "loop",
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Junction logistic collapse: P(A) ≈ σ(Θ Δm)
 
@@ -132,6 +162,10 @@ def run_junction_logistic(theta: float = 2.0, delta_m_values: Sequence[float] =
         theta: Θ (dimensionless steering strength)
         delta_m_values: sweep of Δm values in m-units (dimensionless)
         trials: Bernoulli samples for P(A) estimation
+        method: "loop" (default) is the historical per-trial sampler, so existing seeds reproduce
+            their published P(A) values; "binomial" draws all counts of the Δm sweep in one
+            rng.binomial call via collect_junction_choices_batch (same distribution, different
+            random stream).
 
     Returns:
         x: array of Θ Δm (abscissa of the collapse)
@@ -142,6 +176,16 @@ def run_junction_logistic(theta: float = 2.0, delta_m_values: Sequence[float] =
     A, J, a0, b0 = y_junction_adjacency(5, 5, 5)
     N = A.shape[0]
     rng = np.random.default_rng(123)
+    if method == "binomial":
+        d = np.asarray(delta_m_values, dtype=np.float64)
+        M = np.zeros((d.size, N), dtype=np.float64)
+        M[:, a0] = +0.5 * d
+        M[:, b0] = -0.5 * d
+        counts = collect_junction_choices_batch(A, M, J, (a0, b0), theta=theta, trials=trials, rng=rng)
+        return theta * d, counts[:, 0] / max(1, int(trials))
+    if method != "loop":
+        raise ValueError(f"unknown method {method!r}; expected 'loop' or 'binomial'")
+
     m = np.zeros(N, dtype=np.float64)
     xvals, pvals = [], []
     for d in delta_m_values:
@@ -159,6 +203,31 @@ def run_junction_logistic(theta: float = 2.0, delta_m_values: Sequence[float] =
 # 2) Curvature scaling
 # ---------------------------
 
+def _polyline_turns(pts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Shared kernel for the polyline curvature estimators, vectorized along the polyline and any
+    trailing ray axes. pts has shape (n, d) or (n, P, d); interior points i = 1..n-2 are returned.
+
+    Returns:
+        kmag: 2 sin(Δθ/2)/ℓ at interior points (0 where a segment has zero length)
+        v1n, v2n: unit incoming/outgoing segments (zero where undefined)
+        ok: mask of interior points with two non-degenerate segments
+    """
+    v1 = pts[1:-1] - pts[:-2]
+    v2 = pts[2:] - pts[1:-1]
+    n1 = np.linalg.norm(v1, axis=-1)
+    n2 = np.linalg.norm(v2, axis=-1)
+    ok = (n1 != 0) & (n2 != 0)
+    v1n = v1 / np.where(ok, n1, 1.0)[..., None]
+    v2n = v2 / np.where(ok, n2, 1.0)[..., None]
+    cosang = np.clip(np.sum(v1n * v2n, axis=-1), -1.0, 1.0)
+    dtheta = np.arccos(cosang)
+    ell = 0.5 * (n1 + n2)
+    ok &= ell != 0
+    kmag = np.where(ok, 2.0 * np.sin(0.5 * dtheta) / np.where(ok, ell, 1.0), 0.0)
+    return kmag, v1n, v2n, ok
+
+
 def polyline_curvature(pts: np.ndarray) -> np.ndarray:
     """
     Discrete curvature estimate along a polyline:
@@ -170,32 +239,16 @@ def polyline_curvature(pts: np.ndarray) -> np.ndarray:
     - In the derivation [write_ups/memory_steering.md](write_ups/memory_steering.md:1), rays obey r'' = ∇_⊥ ln n = Θ ∇_⊥ m
       (with n=exp(Θ m)). The magnitude of r'' along a path is proportional to |∇m| with a slope ∝ Θ. This function
       yields the ⟨κ_path⟩ metric used in the curvature scaling test ⟨κ_path⟩ ∝ Θ |∇m|.
+
+    - pts may be a single polyline (n, d) or a ray ensemble (n, P, d) such as the buffer from
+      integrate_rays; the result has shape (n,) or (n, P) respectively.
     """
+    pts = np.asarray(pts, dtype=np.float64)
     n = pts.shape[0]
+    kappa = np.zeros(pts.shape[:-1], dtype=np.float64)
     if n < 3:
-        return np.zeros(n, dtype=np.float64)
-    kappa = np.zeros(n, dtype=np.float64)
-    for i in range(1, n - 1):
-        p0 = pts[i - 1]
-        p1 = pts[i]
-        p2 = pts[i + 1]
-        v1 = p1 - p0
-        v2 = p2 - p1
-        # normalize
-        n1 = np.linalg.norm(v1)
-        n2 = np.linalg.norm(v2)
-        if n1 == 0 or n2 == 0:
-            kappa[i] = 0.0
-            continue
-        v1n = v1 / n1
-        v2n = v2 / n2
-        cosang = np.clip(np.dot(v1n, v2n), -1.0, 1.0)
-        dtheta = math.acos(cosang)
-        ell = 0.5 * (n1 + n2)
-        if ell == 0:
-            kappa[i] = 0.0
-        else:
-            kappa[i] = 2.0 * math.sin(0.5 * dtheta) / ell
+        return kappa
+    kappa[1:-1], _, _, _ = _polyline_turns(pts)
     return kappa
 
 def polyline_curvature_signed(pts: np.ndarray) -> np.ndarray:
@@ -209,42 +262,90 @@ def polyline_curvature_signed(pts: np.ndarray) -> np.ndarray:
 
     - This returns the signed bending, suitable for falsification via gradient/Θ sign flips:
           ⟨κ_signed⟩ ∝ Θ (∇m · n_⊥)
+
+    - Accepts (n, 2) or a ray ensemble (n, P, 2); returns (n,) or (n, P).
     """
+    pts = np.asarray(pts, dtype=np.float64)
     n = pts.shape[0]
+    kappa = np.zeros(pts.shape[:-1], dtype=np.float64)
     if n < 3:
-        return np.zeros(n, dtype=np.float64)
-    kappa = np.zeros(n, dtype=np.float64)
-    for i in range(1, n - 1):
-        p0 = pts[i - 1]
-        p1 = pts[i]
-        p2 = pts[i + 1]
-        v1 = p1 - p0
-        v2 = p2 - p1
-        n1 = np.linalg.norm(v1)
-        n2 = np.linalg.norm(v2)
-        if n1 == 0 or n2 == 0:
-            kappa[i] = 0.0
-            continue
-        v1n = v1 / n1
-        v2n = v2 / n2
-        # turning angle
-        cosang = float(np.clip(np.dot(v1n, v2n), -1.0, 1.0))
-        dtheta = math.acos(cosang)
-        ell = 0.5 * (n1 + n2)
-        if ell == 0:
-            kmag = 0.0
-        else:
-            kmag = 2.0 * math.sin(0.5 * dtheta) / ell
-        # orientation sign from 2D cross product z-component
-        cross_z = float(v1n[0] * v2n[1] - v1n[1] * v2n[0])
-        sgn = 0.0
-        if cross_z > 0:
-            sgn = +1.0
-        elif cross_z < 0:
-            sgn = -1.0
-        kappa[i] = sgn * kmag
+        return kappa
+    kmag, v1n, v2n, ok = _polyline_turns(pts)
+    # orientation sign from 2D cross product z-component
+    cross_z = v1n[..., 0] * v2n[..., 1] - v1n[..., 1] * v2n[..., 0]
+    kappa[1:-1] = np.where(ok, np.sign(cross_z) * kmag, 0.0)
     return kappa
 
+
+def integrate_rays(
+    x0: np.ndarray,
+    theta: float | np.ndarray,
+    g: np.ndarray,
+    dt: float,
+    nsteps: int,
+    h0: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ensemble ray-limit integrator for r'' = Θ ∇_⊥ m, advancing every ray together:
+        ḣ = Π_⊥(Θ ∇m) = Θ (∇m − (∇m·h) h),  ĥ renormalized each step,   ẋ = ĥ (unit speed).
+
+    Each step updates all rays as (P, 2) arrays and writes positions into a preallocated
+    (nsteps+1, P, 2) buffer, so pulses × Θ (× gradient sign) sweeps are one call.
+
+    Args:
+        x0: (P, 2) start positions.
+        theta: Θ, scalar or (P,) per-ray values.
+        g: ∇m, shape (2,) or (P, 2) per-ray gradients (constant in space).
+        dt: step size.
+        nsteps: number of steps.
+        h0: optional (P, 2) initial unit headings; default +x.
+
+    Returns:
+        traj: (nsteps+1, P, 2) positions.
+        npts: (P,) number of valid points per ray. A ray whose heading norm becomes zero or
+            non-finite stops there (its later rows repeat the last position), matching the
+            early break of the single-ray loop.
+    """
+    x = np.array(x0, dtype=np.float64).reshape(-1, 2)
+    P = x.shape[0]
+    nsteps = int(nsteps)
+    th = np.broadcast_to(np.asarray(theta, dtype=np.float64), (P,))[:, None]
+    gg = np.broadcast_to(np.asarray(g, dtype=np.float64), (P, 2))
+    if h0 is None:
+        h = np.tile(np.array([1.0, 0.0], dtype=np.float64), (P, 1))
+    else:
+        h = np.array(h0, dtype=np.float64).reshape(P, 2)
+
+    traj = np.empty((nsteps + 1, P, 2), dtype=np.float64)
+    traj[0] = x
+    npts = np.full(P, nsteps + 1, dtype=np.int64)
+    alive = np.ones(P, dtype=bool)
+    for t in range(nsteps):
+        gh = np.einsum("pd,pd->p", gg, h)[:, None]
+        h = h + dt * (th * (gg - gh * h))
+        nrm = np.linalg.norm(h, axis=1)
+        ok = (nrm != 0) & np.isfinite(nrm)
+        if not np.all(ok):
+            npts[alive & ~ok] = t + 1
+            alive &= ok
+        h = h / np.where(ok, nrm, 1.0)[:, None]
+        x = np.where(alive[:, None], x + dt * h, x)
+        traj[t + 1] = x
+    return traj, npts
+
+
+def mean_path_curvature(traj: np.ndarray, npts: np.ndarray) -> np.ndarray:
+    """
+    Per-ray ⟨κ_path⟩ over each ray's valid prefix of an integrate_rays buffer (NaN if < 3 points).
+    """
+    kappa = polyline_curvature(traj)
+    n = np.asarray(npts, dtype=np.int64)
+    mask = np.arange(traj.shape[0])[:, None] < n[None, :]
+    # the last valid point of a truncated ray is an endpoint (0), exactly as for the prefix alone
+    total = np.sum(np.where(mask, kappa, 0.0), axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(n >= 3, total / n, np.nan)
+
 def run_curvature_scaling(
     nx: int = 21,
     ny: int = 21,
@@ -292,69 +393,36 @@ def run_curvature_scaling(
         for y in range(ny):
             m[y * nx:(y + 1) * nx] = (y / max(1, ny - 1))
 
-        # 8-neighbor helper (no wrap)
-        def neighbors8(i: int) -> List[int]:
-            y, x = divmod(i, nx)
-            out = []
-            for dy in (-1, 0, 1):
-                for dx in (-1, 0, 1):
-                    if dx == 0 and dy == 0:
-                        continue
-                    xx, yy = x + dx, y + dy
-                    if 0 <= xx < nx and 0 <= yy < ny:
-                        out.append(yy * nx + xx)
-            return out
-
-        def dir_unit(i: int, j: int) -> np.ndarray:
-            yi, xi = divmod(i, nx)
-            yj, xj = divmod(j, nx)
-            v = np.array([xj - xi, yj - yi], dtype=np.float64)
-            n = np.linalg.norm(v)
-            return v / n if n > 0 else np.zeros(2, dtype=np.float64)
+        # 8-neighbor CSR graph with a per-edge table of unit step directions
+        indptr, indices, pos = grid8_csr(nx, ny)
+        dirs = edge_unit_directions(pos, indptr, indices)
 
         # Sources along a central row; initial heading along +x so ∇m is transverse
         src_y = ny // 2
         src_nodes = [src_y * nx + x for x in range(1, nx - 1)]  # avoid borders
+        steps = nx // 2
         for theta in theta_values:
-            for s in rng.choice(src_nodes, size=min(pulses, len(src_nodes)), replace=False):
-                path_nodes = [s]
-                last = -1
-                cur = s
-                h = np.array([1.0, 0.0], dtype=np.float64)  # initial heading (+x)
-                steps = nx // 2
-                for _ in range(steps):
-                    neigh = neighbors8(cur)
-                    if len(neigh) == 0:
-                        break
-                    # Heading-aware softmax: score = Θ m_j + heading_bias * cos(∠(h, step))
-                    scores = []
-                    for j in neigh:
-                        u = dir_unit(cur, j)
-                        cosang = float(np.clip(np.dot(u, h), -1.0, 1.0))
-                        scores.append(theta * m[j] + heading_bias * cosang)
-                    z = np.asarray(scores, dtype=np.float64) / max(temperature, 1e-6)
-                    z -= np.max(z)
-                    p = np.exp(z)
-                    ssum = p.sum()
-                    if not np.isfinite(ssum) or ssum <= 0:
-                        p = np.ones_like(p) / len(p)
-                    else:
-                        p /= ssum
-                    idx = int(rng.choice(len(neigh), p=p))
-                    nxt = int(neigh[idx])
-                    if nxt == cur:
-                        break
-                    last, cur = cur, nxt
-                    h = dir_unit(last, cur)
-                    path_nodes.append(cur)
-
-                # Compute curvature along the polyline
-                pts = np.array([[n % nx, n // nx] for n in path_nodes], dtype=np.float64)
-                if pts.shape[0] >= 3:
-                    kappa = polyline_curvature(pts)
-                    if kappa.size > 0:
-                        X_all.append(theta * grad_mag)
-                        Y_all.append(float(np.mean(kappa)))
+            cur = rng.choice(src_nodes, size=min(pulses, len(src_nodes)), replace=False).astype(np.int64)
+            h = np.tile(np.array([1.0, 0.0], dtype=np.float64), (cur.size, 1))  # initial heading (+x)
+            path = np.full((steps + 1, cur.size), -1, dtype=np.int64)
+            path[0] = cur
+            # All pulses advance together: score = Θ m_j + heading_bias * cos(∠(h, step)), softmax at T
+            for t in range(steps):
+                cur, h = sample_next_neighbor_heading_batch(
+                    cur, h, indptr, indices, m, theta, dirs,
+                    heading_bias=heading_bias, temperature=max(temperature, 1e-6), rng=rng,
+                )
+                path[t + 1] = cur
+
+            # Curvature along every polyline at once; a walker that stopped keeps its prefix
+            # (its node is frozen, so the trailing segments have zero length)
+            npts = np.sum(path >= 0, axis=0)
+            for t in range(1, steps + 1):
+                path[t] = np.where(path[t] < 0, path[t - 1], path[t])
+            kbar = mean_path_curvature(pos[path], npts)
+            keep = npts >= 3
+            X_all.extend([theta * grad_mag] * int(keep.sum()))
+            Y_all.extend(kbar[keep].tolist())
 
     else:
         # Continuous ray integrator in a domain of size (nx, ny)
@@ -362,29 +430,14 @@ def run_curvature_scaling(
         # Seeds: choose start positions along mid-height, avoid borders
         y0 = (ny - 1) * 0.5
         xs = rng.uniform(1.0, nx - 2.0, size=pulses)
-        for theta in theta_values:
-            for x0 in xs:
-                # Initialize position and heading
-                x = np.array([x0, y0], dtype=np.float64)
-                h = np.array([1.0, 0.0], dtype=np.float64)
-                pts = [x.copy()]
-                for _ in range(int(nsteps)):
-                    # ḣ = Π_⊥(Θ ∇m) = Θ(∇m - (∇m·h) h)
-                    dv = theta * (g - np.dot(g, h) * h)
-                    h = h + dt * dv
-                    nrm = float(np.linalg.norm(h))
-                    if nrm == 0 or not np.isfinite(nrm):
-                        break
-                    h = h / nrm
-                    # ẋ = ĥ (unit speed)
-                    x = x + dt * h
-                    pts.append(x.copy())
-                pts = np.asarray(pts, dtype=np.float64)
-                if pts.shape[0] >= 3:
-                    kappa = polyline_curvature(pts)
-                    if kappa.size > 0:
-                        X_all.append(theta * grad_mag)
-                        Y_all.append(float(np.mean(kappa)))
+        # One ensemble for all Θ values × pulses (Θ-major, matching the output order)
+        thetas = np.repeat(np.asarray(theta_values, dtype=np.float64), xs.size)
+        x0 = np.stack([np.tile(xs, len(theta_values)), np.full(thetas.size, y0)], axis=1)
+        traj, npts = integrate_rays(x0, thetas, g, dt, nsteps)
+        kbar = mean_path_curvature(traj, npts)
+        keep = npts >= 3
+        X_all.extend((thetas[keep] * grad_mag).tolist())
+        Y_all.extend(kbar[keep].tolist())
 
     return np.asarray(X_all), np.asarray(Y_all)
 # ---------------------------
@@ -487,54 +540,41 @@ def run_curvature_scaling_signed(
     y0 = (ny - 1) * 0.5
     xs_all = rng.uniform(1.0, nx - 2.0, size=pulses_per_x)
 
-    def ray_batch(theta_val: float, grad_sign: float = 1.0) -> Tuple[float, float]:
-        # Constant gradient vector (vertical), allow sign flip for falsification
-        g = np.array([0.0, grad_sign * grad_mag], dtype=np.float64)
-        kappas = []
-        for x0 in xs_all:
-            x = np.array([x0, y0], dtype=np.float64)
-            h = np.array([1.0, 0.0], dtype=np.float64)  # initial heading +x
-            pts = [x.copy()]
-            for _ in range(int(nsteps)):
-                dv = theta_val * (g - np.dot(g, h) * h)     # h' = Theta (g - (g·h)h)
-                h = h + dt * dv
-                nrm = float(np.linalg.norm(h))
-                if nrm == 0 or not np.isfinite(nrm):
-                    break
-                h = h / nrm
-                x = x + dt * h
-                pts.append(x.copy())
-            pts = np.asarray(pts, dtype=np.float64)
-            if pts.shape[0] >= 3:
-                kappa = polyline_curvature(pts)
-                if kappa.size > 0:
-                    kappas.append(float(np.mean(kappa)))
-        if len(kappas) == 0:
-            return (np.nan, np.nan)
-        arr = np.asarray(kappas, dtype=float)
-        return (float(np.mean(arr)), float(np.std(arr)/np.sqrt(max(1, arr.size))))
-
-    # Baseline (sign_id=0)
-    X_base, Y_mean_base, Y_se_base, sign_base = [], [], [], []
+    # Buckets: baseline (sign_id=0) for every X, then on ~3 midpoints the signed falsification
+    # runs with flipped gradient (sign_id=1) and flipped Theta (sign_id=2).
+    buckets: List[Tuple[float, float, float, int]] = []  # (X, Theta, grad_sign, sign_id)
     for X in x_values:
         theta = X / max(grad_mag, 1e-12)
-        mu, se = ray_batch(theta, grad_sign=+1.0)
-        X_base.append(X); Y_mean_base.append(mu); Y_se_base.append(se); sign_base.append(0)
-
-    # Signed falsification on ~3 midpoints
+        buckets.append((float(X), theta, +1.0, 0))
     mid_idx = np.linspace(0, len(x_values)-1, signed_check_mids, dtype=int)
-    X_flip, Y_mean_flip, Y_se_flip, sign_flip = [], [], [], []
     for idx in mid_idx:
         Xmid = float(x_values[idx])
         theta_mid = Xmid / max(grad_mag, 1e-12)
+        buckets.append((Xmid, theta_mid, -1.0, 1))
+        buckets.append((Xmid, -theta_mid, +1.0, 2))
+
+    # All buckets × seeds advance as one (P, 2) ensemble
+    nb, npulse = len(buckets), xs_all.size
+    thetas = np.repeat([b[1] for b in buckets], npulse)
+    g = np.zeros((nb * npulse, 2), dtype=np.float64)
+    g[:, 1] = np.repeat([b[2] for b in buckets], npulse) * grad_mag
+    x0 = np.stack([np.tile(xs_all, nb), np.full(nb * npulse, y0)], axis=1)
+    traj, npts = integrate_rays(x0, thetas, g, dt, nsteps)
+    kbar = mean_path_curvature(traj, npts).reshape(nb, npulse)
+    valid = (npts >= 3).reshape(nb, npulse)
 
-        # flip gradient (sign_id=1)
-        mu1, se1 = ray_batch(theta_mid, grad_sign=-1.0)
-        X_flip.append(Xmid); Y_mean_flip.append(mu1); Y_se_flip.append(se1); sign_flip.append(1)
-
-        # flip Theta (sign_id=2)
-        mu2, se2 = ray_batch(-theta_mid, grad_sign=+1.0)
-        X_flip.append(Xmid); Y_mean_flip.append(mu2); Y_se_flip.append(se2); sign_flip.append(2)
+    X_base, Y_mean_base, Y_se_base, sign_base = [], [], [], []
+    X_flip, Y_mean_flip, Y_se_flip, sign_flip = [], [], [], []
+    for b, (X, _, _, sid) in enumerate(buckets):
+        arr = kbar[b][valid[b]]
+        if arr.size == 0:
+            mu, se = np.nan, np.nan
+        else:
+            mu, se = float(np.mean(arr)), float(np.std(arr)/np.sqrt(max(1, arr.size)))
+        if sid == 0:
+            X_base.append(X); Y_mean_base.append(mu); Y_se_base.append(se); sign_base.append(0)
+        else:
+            X_flip.append(X); Y_mean_flip.append(mu); Y_se_flip.append(se); sign_flip.append(sid)
 
     # Concatenate
     X_all = np.asarray(list(X_base) + list(X_flip), dtype=float)
@@ -790,58 +830,100 @@ def run_stability_band(
 # Entry point
 # ---------------------------
 
+def produce_results() -> dict:
+    """
+    Run the three experiments and return typed columnar tables
+    {table: {column: np.ndarray}} for common.results_store.
+    """
+    tables = {}
+
+    # 1) Junction logistic
+    theta = 2.0
+    delta_m = np.linspace(-2.0, 2.0, 17)
+    X, P = run_junction_logistic(theta=theta, delta_m_values=delta_m, trials=2000)
+    tables["junction"] = {"x": np.asarray(X, float), "p_a": np.asarray(P, float)}
+
+    # 2) Curvature scaling (unsigned overview; small-bend regime)
+    Xc, Yc = run_curvature_scaling(
+        nx=21, ny=21,
+        theta_values=(0.5, 1.0, 2.0, 3.0, 4.0),
+        pulses=160, mode="ray", dt=0.10, nsteps=200
+    )
+    tables["curvature"] = {"x": np.asarray(Xc, float), "mean_kappa": np.asarray(Yc, float)}
+
+    # 2b) Curvature: calibration unit test + signed falsification (12 X values)
+    cal_res = calibrate_curvature_on_arcs(
+        R_values=(20.0, 40.0, 80.0), n_points=200, noise=0.0
+    )
+    cal = np.asarray(cal_res, float).reshape(-1, 4)
+    tables["curvature_calibration"] = {
+        "R": cal[:, 0], "kappa_mean": cal[:, 1], "kappa_std": cal[:, 2], "frac_error": cal[:, 3],
+    }
+
+    seed_val = 77
+    Xs, Ys, Yse, sign_id = run_curvature_scaling_signed(
+        nx=41, ny=41,
+        x_values=np.linspace(0.02, 0.30, 12),  # avoid heading saturation
+        pulses_per_x=96, dt=0.08, nsteps=400, signed_check_mids=3,
+        rng=np.random.default_rng(seed_val),
+    )
+    tables["curvature_signed"] = {
+        "x": Xs, "mean_kappa": Ys, "se_kappa": Yse,
+        "seed": np.full(Xs.size, seed_val, dtype=np.int64), "sign_id": sign_id.astype(np.int64),
+    }
+
+    # 3) Stability band (dose-controlled write→decay with discriminative metrics)
+    rows = run_stability_band(
+        nx=21, ny=21, T_write=5.0, T_decay=5.0, dt=0.2,
+        da_values=(0.5, 1.0, 1.5, 2.0), gamma_fixed=1.0, dose_model="scale_R",
+        delta_values=(0.05, 0.1, 0.2, 0.3),
+        kappa_values=(0.1, 0.3, 0.6, 1.0),
+        topk_frac=0.05, cfl_limit=0.9
+    )
+    sb = np.asarray(rows, float).reshape(-1, len(STABILITY_COLUMNS))
+    tables["stability"] = {name: sb[:, k] for k, name in enumerate(STABILITY_COLUMNS)}
+    return tables
+
+
+def print_results_csv(tables: dict) -> None:
+    """Legacy text view of the tables (the CSV blocks historically printed to stdout)."""
+    print("# Junction logistic (CSV): Theta*Delta_m, P(A)")
+    for x, p in zip(tables["junction"]["x"], tables["junction"]["p_a"]):
+        print(f"{x:.6f},{p:.6f}")
+
+    print("\n# Curvature scaling (CSV): Theta*|grad m|, mean(kappa_path)")
+    for x, y in zip(tables["curvature"]["x"], tables["curvature"]["mean_kappa"]):
+        print(f"{x:.6f},{y:.8f}")
+
+    cal = tables["curvature_calibration"]
+    print("\n# Curvature calibration test (CSV): R, kappa_mean, kappa_std, frac_error")
+    for R, km, ks, fe in zip(cal["R"], cal["kappa_mean"], cal["kappa_std"], cal["frac_error"]):
+        print(f"{R:.6f},{km:.8f},{ks:.8f},{fe:.6f}")
+
+    sg = tables["curvature_signed"]
+    print("\n# Curvature scaling signed (CSV): X, mean_kappa, se_kappa, seed, sign_id")
+    for x, mu, se, seed, sgn in zip(sg["x"], sg["mean_kappa"], sg["se_kappa"], sg["seed"], sg["sign_id"]):
+        print(f"{x:.6f},{mu:.8f},{se:.8f},{int(seed):d},{int(sgn)}")
+
+    sb = tables["stability"]
+    print("\n# Stability band (CSV|dose_model=scale_R): D_a, Lambda, Gamma, Retention, Fidelity_w, Fidelity_end, Fidelity_shuffle_end, Fidelity_edge_end, AUC_end, SNR_end, AUPRC_topk, BPER")
+    for row in zip(*(sb[name] for name in STABILITY_COLUMNS)):
+        print(",".join(f"{v:.6f}" for v in row))
+
+
 def main():
+    # Typed results go to a columnar store (plot_memory_steering loads it without text parsing):
+    # VDM_RESULTS_STORE_OUT overrides the default logs/memory_steering/<ts>_memory_steering_results.results.
     # Optional CSV sink: if VDM_RESULTS_CSV_OUT is set, tee stdout into that file.
     csv_out = os.environ.get("VDM_RESULTS_CSV_OUT", "").strip()
+    store_out = os.environ.get("VDM_RESULTS_STORE_OUT", "").strip()
 
-    def _produce():
-        # 1) Junction logistic
-        theta = 2.0
-        delta_m = np.linspace(-2.0, 2.0, 17)
-        X, P = run_junction_logistic(theta=theta, delta_m_values=delta_m, trials=2000)
-        print("# Junction logistic (CSV): Theta*Delta_m, P(A)")
-        for x, p in zip(X, P):
-            print(f"{x:.6f},{p:.6f}")
-
-        # 2) Curvature scaling (unsigned overview; small-bend regime)
-        Xc, Yc = run_curvature_scaling(
-            nx=21, ny=21,
-            theta_values=(0.5, 1.0, 2.0, 3.0, 4.0),
-            pulses=160, mode="ray", dt=0.10, nsteps=200
-        )
-        print("\n# Curvature scaling (CSV): Theta*|grad m|, mean(kappa_path)")
-        for x, y in zip(Xc, Yc):
-            print(f"{x:.6f},{y:.8f}")
-
-        # 2b) Curvature: calibration unit test + signed falsification (12 X values)
-        cal_res = calibrate_curvature_on_arcs(
-            R_values=(20.0, 40.0, 80.0), n_points=200, noise=0.0
-        )
-        print("\n# Curvature calibration test (CSV): R, kappa_mean, kappa_std, frac_error")
-        for (R, km, ks, fe) in cal_res:
-            print(f"{R:.6f},{km:.8f},{ks:.8f},{fe:.6f}")
-
-        Xs, Ys, Yse, sign_id = run_curvature_scaling_signed(
-            nx=41, ny=41,
-            x_values=np.linspace(0.02, 0.30, 12),  # avoid heading saturation
-            pulses_per_x=96, dt=0.08, nsteps=400, signed_check_mids=3
-        )
-        print("\n# Curvature scaling signed (CSV): X, mean_kappa, se_kappa, seed, sign_id")
-        seed_val = 77
-        for x, mu, se, sgn in zip(Xs, Ys, Yse, sign_id):
-            print(f"{x:.6f},{mu:.8f},{se:.8f},{seed_val:d},{int(sgn)}")
-
-        # 3) Stability band (dose-controlled write→decay with discriminative metrics)
-        rows = run_stability_band(
-            nx=21, ny=21, T_write=5.0, T_decay=5.0, dt=0.2,
-            da_values=(0.5, 1.0, 1.5, 2.0), gamma_fixed=1.0, dose_model="scale_R",
-            delta_values=(0.05, 0.1, 0.2, 0.3),
-            kappa_values=(0.1, 0.3, 0.6, 1.0),
-            topk_frac=0.05, cfl_limit=0.9
-        )
-        print("\n# Stability band (CSV|dose_model=scale_R): D_a, Lambda, Gamma, Retention, Fidelity_w, Fidelity_end, Fidelity_shuffle_end, Fidelity_edge_end, AUC_end, SNR_end, AUPRC_topk, BPER")
-        for (Da, Lam, Gam, Ret, Fid_w, Fid_e, Fid_s, Fid_edge, AUC_e, SNR_e, APk, BPER) in rows:
-            print(f"{Da:.6f},{Lam:.6f},{Gam:.6f},{Ret:.6f},{Fid_w:.6f},{Fid_e:.6f},{Fid_s:.6f},{Fid_edge:.6f},{AUC_e:.6f},{SNR_e:.6f},{APk:.6f},{BPER:.6f}")
+    tables = produce_results()
+    store = results_store.write_results(
+        Path(store_out) if store_out else io_paths.results_path("memory_steering", "memory_steering_results"),
+        tables,
+        meta={"script": "memory_steering_experiments", "memory_source": MEMORY_SOURCE},
+    )
 
     if csv_out:
         os.makedirs(os.path.dirname(csv_out), exist_ok=True)
@@ -859,9 +941,10 @@ def main():
         with open(csv_out, "w") as f:
             tee = Tee(sys.stdout, f)
             with contextlib.redirect_stdout(tee):
-                _produce()
+                print_results_csv(tables)
     else:
-        _produce()
+        print_results_csv(tables)
+    print(f"\n# Results store: {store}")
 
 
 if __name__ == "__main__":
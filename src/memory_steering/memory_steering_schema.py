@@ -0,0 +1,18 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from the author..
+See LICENSE file for full terms.
+
+Column layout of the memory-steering results tables, shared by the experiment runner
+(memory_steering_experiments) and the plotter (plot_memory_steering) without either
+importing the other.
+"""
+from __future__ import annotations
+
+# Stability-band table, in the column order of the legacy CSV block.
+STABILITY_COLUMNS = (
+    "da", "lam", "gam", "retention", "fid_w", "fid_end", "fid_shuffle_end",
+    "fid_edge_end", "auc_end", "snr_end", "auprc_topk", "bper",
+)
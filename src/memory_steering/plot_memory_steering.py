@@ -7,7 +7,8 @@ See LICENSE file for full terms.
 
 Plotting helper for memory-steering experiments.
 
-- Parses outputs/memory_steering_results.csv (supports 4- or 5-column stability).
+- Loads the columnar results store written by memory_steering_experiments (no text parsing),
+  or parses the legacy outputs/memory_steering_results.csv (supports 4- or 5-column stability).
 - Produces figures under figures/memory_steering/.
 - Prints a concise metrics summary that directly tests the three predictions:
   1) Junction logistic collapse
@@ -35,7 +36,8 @@ SRC_ROOT = Path(__file__).resolve().parents[1]
 if str(SRC_ROOT) not in sys.path:
     sys.path.append(str(SRC_ROOT))
 
-from src.common import io_paths
+from src.common import io_paths, results_store
+from src.memory_steering.memory_steering_schema import STABILITY_COLUMNS
 
 DOMAIN = "memory_steering"
 
@@ -99,7 +101,7 @@ def parse_results(src: str):
     Jp = np.asarray(Jp, float)
     Cx = np.asarray(Cx, float)
     Cy = np.asarray(Cy, float)
-    SB = np.asarray(SB, float) if len(SB) > 0 else np.zeros((0, 12), float)
+    SB = np.asarray(SB, float) if len(SB) > 0 else np.zeros((0, len(STABILITY_COLUMNS)), float)
     Sx = np.asarray(Sx, float)
     Smy = np.asarray(Smy, float)
     Sse = np.asarray(Sse, float)
@@ -108,6 +110,27 @@ def parse_results(src: str):
     return Jx, Jp, Cx, Cy, SB, Sx, Smy, Sse, Sseed, Ssign
 
 
+def load_results_store(src: str):
+    """Same arrays as parse_results, read directly from a columnar results store."""
+    t = results_store.load_results(src)
+
+    def col(table: str, name: str) -> np.ndarray:
+        return np.asarray(t.get(table, {}).get(name, np.zeros(0)), float)
+
+    Jx, Jp = col("junction", "x"), col("junction", "p_a")
+    Cx, Cy = col("curvature", "x"), col("curvature", "mean_kappa")
+    sb = t.get("stability", {})
+    if sb:
+        n = len(next(iter(sb.values())))
+        SB = np.stack([np.asarray(sb[c], float) if c in sb else np.full(n, np.nan)
+                       for c in STABILITY_COLUMNS], axis=1)
+    else:
+        SB = np.zeros((0, len(STABILITY_COLUMNS)), float)
+    Sx, Smy, Sse = col("curvature_signed", "x"), col("curvature_signed", "mean_kappa"), col("curvature_signed", "se_kappa")
+    Sseed, Ssign = col("curvature_signed", "seed"), col("curvature_signed", "sign_id")
+    return Jx, Jp, Cx, Cy, SB, Sx, Smy, Sse, Sseed, Ssign
+
+
 def fit_logistic(x: np.ndarray, p: np.ndarray):
     valid = (p > 0) & (p < 1) & np.isfinite(x) & np.isfinite(p)
     if valid.sum() < 2:
@@ -179,7 +202,10 @@ def plot_all(src: str = os.path.join("outputs", "memory_steering_results.csv"),
 
     figures_base = io_paths.FIGURES_ROOT / DOMAIN
 
-    Jx, Jp, Cx, Cy, SB, Sx, Smy, Sse, Sseed, Ssign = parse_results(src)
+    if results_store.is_results_store(src):
+        Jx, Jp, Cx, Cy, SB, Sx, Smy, Sse, Sseed, Ssign = load_results_store(src)
+    else:
+        Jx, Jp, Cx, Cy, SB, Sx, Smy, Sse, Sseed, Ssign = parse_results(src)
 
     # ---------- Plot 1: Junction logistic ----------
     k, b, R2_log, xgrid, pred = fit_logistic(Jx, Jp)
@@ -740,7 +766,8 @@ def plot_all(src: str = os.path.join("outputs", "memory_steering_results.csv"),
 
 
 if __name__ == "__main__":
-    src = os.environ.get(
+    # VDM_RESULTS_STORE (results store directory) takes precedence over the legacy CSV.
+    src = os.environ.get("VDM_RESULTS_STORE") or os.environ.get(
         "VDM_RESULTS_CSV",
         os.path.join(
             "Prometheus_VDM", "derivation", "src", "outputs", "logs",
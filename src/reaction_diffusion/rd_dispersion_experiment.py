@@ -15,7 +15,10 @@ Predictions:
   Discrete (periodic second-difference):  σ_d(m) = r − (4 D / dx^2) sin^2(π m / N)
 
 Method:
-  - Evolve the linearized PDE with periodic BCs from small random amplitude.
+  - Evolve the linearized PDE with periodic BCs from small random amplitude
+    (--scheme euler: explicit Euler under the diffusive CFL limit; --scheme etd: exact
+    exponential stepping of each rfft mode with the discrete symbol σ_d(m), one step per
+    recorded snapshot, so cost is O(record · N log N) with no CFL restriction).
   - Record snapshots and fit log |Û_m(t)| vs t for selected modes m.
   - Compare measured growth rates to σ_d(m) (primary) and σ_c(k) (reference).
 
@@ -33,16 +36,17 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 SRC_ROOT = Path(__file__).resolve().parents[1]
 if str(SRC_ROOT) not in sys.path:
     sys.path.append(str(SRC_ROOT))
 
 from src.common import io_paths
+from src.common.figure_service import FigureService, add_figure_args
+from src.reaction_diffusion.robust_fit import robust_linear_fit_batch
 
 
 def laplacian_periodic(u: np.ndarray, dx: float) -> np.ndarray:
@@ -54,55 +58,33 @@ def laplacian_periodic(u: np.ndarray, dx: float) -> np.ndarray:
 def robust_linear_fit(t: np.ndarray, y: np.ndarray, smooth_win: int = 5, mad_k: float = 3.0, max_iter: int = 3):
     """
     Robust linear fit y(t) ~ a * t + b with moving-average smoothing and MAD-based outlier rejection.
+    Single-series robust_linear_fit_batch (src.reaction_diffusion.robust_fit).
     Returns (a, R^2). If insufficient points, returns (nan, nan).
     """
     t = np.asarray(t, dtype=float).ravel()
     y = np.asarray(y, dtype=float).ravel()
-    n = t.size
-    if n < 2:
+    if t.size < 2:
         return float("nan"), float("nan")
+    a, r2 = robust_linear_fit_batch(t, y[None, :], smooth_win=smooth_win, mad_k=mad_k, max_iter=max_iter)
+    return float(a[0]), float(r2[0])
 
-    if smooth_win % 2 == 0:
-        smooth_win += 1
-    if n >= smooth_win and smooth_win > 1:
-        kernel = np.ones(smooth_win, dtype=float) / smooth_win
-        y_s = np.convolve(y, kernel, mode="same")
-    else:
-        y_s = y.copy()
-
-    mask = np.isfinite(y_s)
-    if mask.sum() < 2:
-        return float("nan"), float("nan")
 
-    a = float("nan")
-    b = float("nan")
-    for _ in range(max_iter):
-        tt = t[mask]
-        yy = y_s[mask]
-        if tt.size < 2:
-            break
-        coeffs = np.polyfit(tt, yy, 1)
-        a = float(coeffs[0]); b = float(coeffs[1])
-        pred = a * t + b
-        resid = y_s - pred
-        mad = float(np.median(np.abs(resid[mask])) + 1e-12)
-        new_mask = np.isfinite(y_s) & (np.abs(resid) <= mad_k * mad)
-        if new_mask.sum() < max(5, int(0.2 * n)):
-            break
-        if np.array_equal(new_mask, mask):
-            break
-        mask = new_mask
-
-    tt = t[mask]
-    yy = y_s[mask]
-    if tt.size >= 2 and np.isfinite(a):
-        pred = a * tt + b
-        ss_res = float(np.sum((yy - pred) ** 2))
-        ss_tot = float(np.sum((yy - np.mean(yy)) ** 2) + 1e-12)
-        r2 = 1.0 - ss_res / ss_tot
-    else:
-        a, r2 = float("nan"), float("nan")
-    return a, r2
+def linear_sim_schedule(N: int, L: float, D: float, r: float, T: float, cfl: float,
+                        record_slices: int, scheme: str = "euler") -> Tuple[float, float, int, int]:
+    """
+    Grid spacing and time stepping of run_linear_sim: (dx, dt, steps, out_every).
+    The run records steps // out_every snapshots.
+    """
+    dx = float(np.linspace(0.0, L, N, endpoint=False)[1])
+    if scheme == "etd":
+        steps = max(2, int(record_slices))
+        return dx, T / steps, steps, 1
+    # time step from diffusion CFL (linear)
+    dt_diff = cfl * dx * dx / (2.0 * D + 1e-12)
+    dt_reac = 0.2 / r if r > 0 else dt_diff
+    dt = min(dt_diff, dt_reac)
+    steps = int(max(2, math.ceil(T / dt)))
+    return dx, T / steps, steps, max(1, steps // record_slices)
 
 
 def run_linear_sim(
@@ -115,31 +97,59 @@ def run_linear_sim(
     seed: int,
     amp0: float = 1e-6,
     record_slices: int = 60,
+    scheme: str = "euler",
+    analyzer: Optional["StreamingDispersion"] = None,
 ):
     """
-    Explicit Euler on u_t = D u_xx + r u with periodic BCs. Start from small random noise.
+    Evolve u_t = D u_xx + r u with periodic BCs from small random noise.
+
+    scheme="euler": explicit Euler on the second-difference Laplacian.
+    scheme="etd": exponential time differencing in Fourier space. The linear operator is
+    diagonal in the rfft basis with symbol σ_d(m) = r − (4D/dx²) sin²(πm/N), so each
+    snapshot interval Δt is one exact step Û ← e^{σ_d Δt} Û.
+
+    If analyzer is given, each snapshot is fed to analyzer.update(t, u) (the ETD scheme
+    passes its coefficients to analyzer.update_spectrum(t, Û)) instead of being stored, and
+    snapshots is returned empty.
     Returns dict with x, dx, dt, steps, snapshots, snapshot_times.
     """
+    if scheme not in ("euler", "etd"):
+        raise ValueError(f"unknown scheme {scheme!r} (expected 'euler' or 'etd')")
     rng = np.random.default_rng(seed)
     x = np.linspace(0.0, L, N, endpoint=False)
-    dx = x[1] - x[0]
-    # time step from diffusion CFL (linear)
-    dt_diff = cfl * dx * dx / (2.0 * D + 1e-12)
-    dt_reac = 0.2 / r if r > 0 else dt_diff
-    dt = min(dt_diff, dt_reac)
-    steps = int(max(2, math.ceil(T / dt)))
-    dt = T / steps
+    dx, dt, steps, out_every = linear_sim_schedule(N, L, D, r, T, cfl, record_slices, scheme)
+    if scheme == "etd":
+        u0 = amp0 * rng.standard_normal(size=N).astype(float)
+        m = np.arange(N // 2 + 1)
+        sigma_d = r - (4.0 * D / (dx * dx)) * np.sin(np.pi * m / N) ** 2
+        prop = np.exp(sigma_d * dt)
+        U = np.fft.rfft(u0)
+        snapshots: List[np.ndarray] = []
+        snapshot_times: List[float] = []
+        for n in range(steps):
+            U *= prop
+            if analyzer is not None:
+                analyzer.update_spectrum((n + 1) * dt, U)
+            else:
+                snapshots.append(np.fft.irfft(U, n=N))
+            snapshot_times.append((n + 1) * dt)
+        return {
+            "x": x, "dx": dx, "dt": dt, "steps": steps,
+            "snapshots": snapshots, "snapshot_times": snapshot_times,
+        }
 
     u = amp0 * rng.standard_normal(size=N).astype(float)
     snapshots: List[np.ndarray] = []
     snapshot_times: List[float] = []
-    out_every = max(1, steps // record_slices)
 
     for n in range(steps):
         lap = laplacian_periodic(u, dx)
         u += dt * (D * lap + r * u)
         if (n + 1) % out_every == 0:
-            snapshots.append(u.copy())
+            if analyzer is not None:
+                analyzer.update((n + 1) * dt, u)
+            else:
+                snapshots.append(u.copy())
             snapshot_times.append((n + 1) * dt)
 
     return {
@@ -148,43 +158,92 @@ def run_linear_sim(
     }
 
 
-def analyze_dispersion(data: Dict, D: float, r: float, L: float, m_max: int, fit_frac: Tuple[float, float]):
-    """
-    Compute FFT of snapshots, fit growth rates for modes m=0..m_max, and compare to theory.
-    Returns dict with arrays and summary metrics.
-    """
-    snaps = data["snapshots"]
-    times = np.array(data["snapshot_times"], dtype=float)
-    N = snaps[0].size
-    dx = data["dx"]
-
-    # Build 1-sided (non-negative) mode list
-    m_vals = np.arange(0, min(m_max, N // 2) + 1, dtype=int)
-    k_vals = 2.0 * np.pi * m_vals / L
-
-    # Stack FFT amplitudes over time
-    amps = []
-    for u in snaps:
-        U = np.fft.rfft(u)  # length N//2+1
-        amps.append(np.abs(U))
-    amps = np.array(amps)  # shape [T_s, M]
-
+def fit_window(n_times: int, fit_frac: Tuple[float, float]) -> Tuple[int, int]:
+    """Snapshot index range [i0, i1) used for the growth-rate fits."""
     f0, f1 = fit_frac
-    i0 = int(max(0, min(len(times) - 2, round(f0 * len(times)))))
-    i1 = int(max(i0 + 2, min(len(times), round(f1 * len(times)))))
-    t_fit = times[i0:i1]
+    i0 = int(max(0, min(n_times - 2, round(f0 * n_times))))
+    i1 = int(max(i0 + 2, min(n_times, round(f1 * n_times))))
+    return i0, i1
 
-    sigma_meas = np.zeros_like(m_vals, dtype=float)
-    r2_meas = np.zeros_like(m_vals, dtype=float)
 
-    for j, m in enumerate(m_vals):
-        a = amps[i0:i1, j]
-        a = np.maximum(a, 1e-30)
-        y = np.log(a)
-        slope, r2 = robust_linear_fit(t_fit, y, smooth_win=5, mad_k=3.0, max_iter=3)
-        sigma_meas[j] = slope
-        r2_meas[j] = r2
+class StreamingDispersion:
+    """
+    Online log-amplitude fits for rfft modes m = 0..m_max.
+
+    Snapshots are consumed one at a time: only the first m_max+1 rfft coefficients are kept,
+    and for snapshots inside the fit window [i0, i1) the per-mode sums of t, t², y, t·y, y²
+    (y = log|Û_m|) are accumulated. The full rfft is kept deliberately: at O(N log N) it
+    beats a direct DFT of the kept modes (O(N·m_max) time and an (m_max+1, N) basis) for all
+    but a handful of modes. Spectral integrators pass their coefficients to update_spectrum
+    and skip the transform altogether. result() returns all slopes and R² from one vectorized
+    least-squares solve. State is O(m_max) regardless of how many snapshots are recorded.
+
+    Unlike analyze_dispersion, the fit is plain OLS (no moving-average smoothing or MAD
+    rejection); in the linear regime log|Û_m(t)| is a straight line, so the slopes agree.
+    """
 
+    def __init__(self, N: int, m_max: int, n_times: int, fit_frac: Tuple[float, float]):
+        self.N = int(N)
+        self.m_vals = np.arange(0, min(m_max, N // 2) + 1, dtype=int)
+        self.i0, self.i1 = fit_window(n_times, fit_frac)
+        M = self.m_vals.size
+        self.count = 0
+        self.n_fit = 0
+        self._t0 = None
+        self._y0 = np.zeros(M)
+        self._St = 0.0
+        self._Stt = 0.0
+        self._Sy = np.zeros(M)
+        self._Sty = np.zeros(M)
+        self._Syy = np.zeros(M)
+
+    def update(self, t: float, u: np.ndarray) -> None:
+        """Consume a real-space snapshot u (length N) at time t."""
+        if self.i0 <= self.count < self.i1:
+            self.update_spectrum(t, np.fft.rfft(u)[: self.m_vals.size])
+        else:
+            self.count += 1
+
+    def update_spectrum(self, t: float, U: np.ndarray) -> None:
+        """Consume a snapshot given by its rfft coefficients (at least m_max+1 of them)."""
+        i = self.count
+        self.count += 1
+        if not (self.i0 <= i < self.i1):
+            return
+        U = np.asarray(U)[: self.m_vals.size]
+        y = np.log(np.maximum(np.abs(U), 1e-30))
+        if self._t0 is None:
+            # shift origins to the first fitted sample to avoid cancellation in the sums
+            self._t0 = float(t)
+            self._y0 = y.copy()
+        tt = float(t) - self._t0
+        yy = y - self._y0
+        self.n_fit += 1
+        self._St += tt
+        self._Stt += tt * tt
+        self._Sy += yy
+        self._Sty += tt * yy
+        self._Syy += yy * yy
+
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(sigma_meas, r2_meas) per mode; NaN if fewer than 2 samples were fitted."""
+        M = self.m_vals.size
+        n = float(self.n_fit)
+        if n < 2:
+            return np.full(M, np.nan), np.full(M, np.nan)
+        stt = self._Stt - self._St * self._St / n
+        sty = self._Sty - self._St * self._Sy / n
+        syy = self._Syy - self._Sy * self._Sy / n
+        slope = sty / stt
+        ss_res = np.maximum(syy - slope * sty, 0.0)
+        r2 = 1.0 - ss_res / (syy + 1e-12)
+        return slope, r2
+
+
+def dispersion_summary(m_vals: np.ndarray, sigma_meas: np.ndarray, r2_meas: np.ndarray,
+                       D: float, r: float, L: float, N: int, dx: float) -> Dict:
+    """Theory curves, per-mode relative errors and summary metrics for measured rates."""
+    k_vals = 2.0 * np.pi * m_vals / L
     # Theoretical discrete and continuum rates
     sigma_disc = r - (4.0 * D / (dx * dx)) * (np.sin(np.pi * m_vals / N) ** 2)
     sigma_cont = r - D * (k_vals ** 2)
@@ -220,7 +279,46 @@ def analyze_dispersion(data: Dict, D: float, r: float, L: float, m_max: int, fit
     }
 
 
+def analyze_dispersion_streaming(analyzer: StreamingDispersion, data: Dict, D: float, r: float, L: float) -> Dict:
+    """analyze_dispersion counterpart for a run fed through a StreamingDispersion."""
+    sigma_meas, r2_meas = analyzer.result()
+    return dispersion_summary(analyzer.m_vals, sigma_meas, r2_meas, D, r, L, analyzer.N, data["dx"])
+
+
+def analyze_dispersion(data: Dict, D: float, r: float, L: float, m_max: int, fit_frac: Tuple[float, float]):
+    """
+    Compute FFT of snapshots, fit growth rates for modes m=0..m_max (one robust_linear_fit_batch
+    call), and compare to theory.
+    Returns dict with arrays and summary metrics.
+    """
+    snaps = data["snapshots"]
+    times = np.array(data["snapshot_times"], dtype=float)
+    N = snaps[0].size
+    dx = data["dx"]
+
+    # Build 1-sided (non-negative) mode list
+    m_vals = np.arange(0, min(m_max, N // 2) + 1, dtype=int)
+
+    # Stack FFT amplitudes over time
+    amps = []
+    for u in snaps:
+        U = np.fft.rfft(u)  # length N//2+1
+        amps.append(np.abs(U))
+    amps = np.array(amps)  # shape [T_s, M]
+
+    i0, i1 = fit_window(len(times), fit_frac)
+    t_fit = times[i0:i1]
+
+    # all modes in one batched robust fit: rows are modes, columns fit-window times
+    logs = np.log(np.maximum(amps[i0:i1, : m_vals.size], 1e-30)).T
+    sigma_meas, r2_meas = robust_linear_fit_batch(t_fit, logs, smooth_win=5, mad_k=3.0, max_iter=3)
+
+    return dispersion_summary(m_vals, sigma_meas, r2_meas, D, r, L, N, dx)
+
+
 def plot_and_save_dispersion(analysis: Dict, figure_path, title: str = "RD dispersion (linear regime)"):
+    import matplotlib.pyplot as plt
+
     m_vals = np.array(analysis["m_vals"], dtype=int)
     k_vals = np.array(analysis["k_vals"], dtype=float)
     sig_meas = np.array(analysis["sigma_meas"], dtype=float)
@@ -260,9 +358,13 @@ def main():
     parser.add_argument("--m_max", type=int, default=64, help="Max mode index m to fit (clamped by N//2).")
     parser.add_argument("--fit_start", type=float, default=0.1, help="fractional start of fit window")
     parser.add_argument("--fit_end", type=float, default=0.4, help="fractional end of fit window")
+    parser.add_argument("--scheme", choices=("euler", "etd"), default="euler", help="time integrator (etd: exact spectral stepping)")
+    parser.add_argument("--analysis", choices=("stream", "snapshots"), default="stream",
+                        help="stream: online per-mode fits, O(m_max) memory; snapshots: store fields, robust fits")
     parser.add_argument("--outdir", type=str, default=None, help="base output dir; defaults to the repository root (figures/, logs/)")
     parser.add_argument("--figure", type=str, default=None, help="override figure path; otherwise script_name_timestamp.png in outdir/figures")
     parser.add_argument("--log", type=str, default=None, help="override log path; otherwise script_name_timestamp.json in outdir/logs")
+    add_figure_args(parser)
     args = parser.parse_args()
 
     script_name = Path(__file__).stem
@@ -280,8 +382,18 @@ def main():
     log_override = Path(os.path.expandvars(args.log)).expanduser() if args.log else None
 
     t0 = time.time()
-    sim = run_linear_sim(args.N, args.L, args.D, args.r, args.T, args.cfl, args.seed, amp0=args.amp0, record_slices=args.record)
-    analysis = analyze_dispersion(sim, args.D, args.r, args.L, args.m_max, (args.fit_start, args.fit_end))
+    fit_frac = (args.fit_start, args.fit_end)
+    if args.analysis == "stream":
+        _, _, steps, out_every = linear_sim_schedule(args.N, args.L, args.D, args.r, args.T, args.cfl, args.record, args.scheme)
+        n_times = steps // out_every
+        analyzer = StreamingDispersion(args.N, args.m_max, n_times, fit_frac)
+        sim = run_linear_sim(args.N, args.L, args.D, args.r, args.T, args.cfl, args.seed, amp0=args.amp0,
+                             record_slices=args.record, scheme=args.scheme, analyzer=analyzer)
+        analysis = analyze_dispersion_streaming(analyzer, sim, args.D, args.r, args.L)
+    else:
+        sim = run_linear_sim(args.N, args.L, args.D, args.r, args.T, args.cfl, args.seed, amp0=args.amp0,
+                             record_slices=args.record, scheme=args.scheme)
+        analysis = analyze_dispersion(sim, args.D, args.r, args.L, args.m_max, fit_frac)
     elapsed = time.time() - t0
 
     acceptance = {
@@ -305,7 +417,9 @@ def main():
     else:
         log_path_obj = io_paths.log_path(domain, slug, failed=not passed)
 
-    plot_and_save_dispersion(analysis, figure_path_obj, title=f"RD dispersion (linear): D={args.D}, r={args.r}")
+    figs = FigureService(args.figure_mode)
+    fig_out = figs.submit(figure_path_obj, plot_and_save_dispersion, analysis, figure_path_obj,
+                          title=f"RD dispersion (linear): D={args.D}, r={args.r}")
 
     payload = {
         "theory": {
@@ -317,6 +431,7 @@ def main():
             "cfl": args.cfl, "seed": args.seed, "amp0": args.amp0,
             "record": args.record, "m_max": args.m_max,
             "fit_start": args.fit_start, "fit_end": args.fit_end,
+            "scheme": args.scheme, "analysis": args.analysis,
         },
         "metrics": {
             "med_rel_err": analysis["med_rel_err"],
@@ -342,10 +457,13 @@ def main():
         "elapsed_sec": elapsed,
     }
 
+    if not figs.renders:
+        payload["outputs"]["figure_spec"] = str(fig_out)
     io_paths.write_log(log_path_obj, payload)
+    figs.close()
 
     print(json.dumps({
-        "figure": str(figure_path_obj),
+        "figure": str(fig_out),
         "log": str(log_path_obj),
         "med_rel_err": payload["metrics"]["med_rel_err"],
         "r2_array": payload["metrics"]["r2_array"],
@@ -12,9 +12,16 @@ RD front-speed validation for Fisher-KPP:
 Theory:
     Minimal pulled-front speed c_th = 2 * sqrt(D * r)
 
+Integrators (--scheme):
+    euler  explicit Euler, dt ≤ cfl·dx²/(2D) (steps grow as N²)
+    cn     Crank–Nicolson diffusion with a cached tridiagonal LU (Neumann), Strang-split
+           with the exact logistic flow; dt is set by r only, so cost grows as N (needs scipy)
+
 Outputs (defaults):
     - figures/reaction_diffusion/<timestamp>_rd_front_speed_experiment.png
     - logs/reaction_diffusion/<timestamp>_rd_front_speed_experiment.json
+    With --no-figures (or --figure_mode defer) only <figure>.figspec.pkl is written; render it
+    later with python -m src.common.figure_service figures/reaction_diffusion.
 
 CLI example:
   python Prometheus_VDM/write_ups/physics/rd_front_speed_experiment.py \
@@ -26,17 +33,19 @@ import math
 import os
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 SRC_ROOT = Path(__file__).resolve().parents[1]
 if str(SRC_ROOT) not in sys.path:
     sys.path.append(str(SRC_ROOT))
 
 from src.common import io_paths
+from src.common.figure_service import FigureService, add_figure_args
+from src.reaction_diffusion.robust_fit import robust_linear_fit_batch
 
 
 def laplacian_neumann(u: np.ndarray, dx: float) -> np.ndarray:
@@ -50,6 +59,67 @@ def laplacian_neumann(u: np.ndarray, dx: float) -> np.ndarray:
     return lap
 
 
+def laplacian_neumann_rows(u: np.ndarray, dx: float, out: np.ndarray) -> np.ndarray:
+    """
+    Row-wise Neumann Laplacian along axis 1 of u[B, N], written into out (no allocation).
+    Same stencil and operation order as laplacian_neumann, so each row matches it bitwise.
+    """
+    h2 = dx * dx
+    mid = out[:, 1:-1]
+    np.multiply(u[:, 1:-1], 2.0, out=mid)
+    np.subtract(u[:, 2:], mid, out=mid)
+    np.add(mid, u[:, :-2], out=mid)
+    np.divide(mid, h2, out=mid)
+    out[:, 0] = (u[:, 1] - 2*u[:, 0] + u[:, 1]) / h2
+    out[:, -1] = (u[:, -2] - 2*u[:, -1] + u[:, -2]) / h2
+    return out
+
+
+@lru_cache(maxsize=None)
+def _lapack():
+    """scipy.linalg.lapack, imported on first use (keeps module import free of scipy)."""
+    try:
+        from scipy.linalg import lapack
+    except Exception as exc:
+        raise RuntimeError("scipy is required for scheme='cn'") from exc
+    return lapack
+
+
+@lru_cache(maxsize=32)
+def cn_neumann_factor(N: int, dx: float, D: float, dt: float):
+    """
+    Cached LU factors (LAPACK gttrf) of the Crank–Nicolson matrix I − (dt/2) D Δ_N,
+    with Δ_N the Neumann Laplacian of laplacian_neumann. Factored once per (N, dx, D, dt).
+    """
+    lapack = _lapack()
+    a = 0.5 * dt * D / (dx * dx)
+    dl = np.full(N - 1, -a)
+    d = np.full(N, 1.0 + 2.0 * a)
+    du = np.full(N - 1, -a)
+    # mirrored ghost points double the inward coupling at both ends
+    du[0] = -2.0 * a
+    dl[-1] = -2.0 * a
+    dl, d, du, du2, ipiv, info = lapack.dgttrf(dl, d, du)
+    if info != 0:
+        raise RuntimeError(f"Crank–Nicolson factorization failed (info={info})")
+    return dl, d, du, du2, ipiv
+
+
+def cn_neumann_step(u: np.ndarray, dx: float, D: float, dt: float) -> np.ndarray:
+    """One Crank–Nicolson diffusion step (Neumann): (I − dt/2 DΔ) u' = (I + dt/2 DΔ) u."""
+    rhs = u + (0.5 * dt * D) * laplacian_neumann(u, dx)
+    out, info = _lapack().dgttrs(*cn_neumann_factor(u.size, float(dx), float(D), float(dt)), rhs)
+    if info != 0:
+        raise RuntimeError(f"Crank–Nicolson solve failed (info={info})")
+    return out
+
+
+def logistic_flow(u: np.ndarray, r: float, tau: float) -> np.ndarray:
+    """Exact flow of u' = r u (1 − u) over time tau: u e^{rτ} / (1 + u (e^{rτ} − 1))."""
+    e = math.exp(r * tau)
+    return u * e / (1.0 + u * (e - 1.0))
+
+
 def front_position(x: np.ndarray, u: np.ndarray, level: float = 0.5) -> float:
     """Find x where u crosses 'level' via linear interpolation."""
     crossed = np.where((u[:-1] - level) * (u[1:] - level) <= 0)[0]
@@ -88,148 +158,106 @@ def front_position_near(x: np.ndarray, u: np.ndarray, level: float, x_guess: flo
     return float(xs[j])
 
 
+def front_position_window(
+    x: np.ndarray,
+    u: np.ndarray,
+    level: float,
+    x_guess: float,
+    i_guess: int,
+    half_width: int = 32,
+) -> Optional[Tuple[float, int]]:
+    """
+    Windowed front_position_near: search only segments [i_guess − w, i_guess + w], doubling w
+    until the nearest in-window crossing is closer to x_guess than any out-of-window crossing
+    could be. Returns the same crossing as front_position_near, at O(window) cost per call.
+
+    Returns:
+        (xf, i) with i the crossing segment index, or None if u has no crossing at all.
+    """
+    n_seg = u.size - 1
+    w = max(1, int(half_width))
+    while True:
+        lo = max(0, i_guess - w)
+        hi = min(n_seg, i_guess + w + 1)  # segments lo..hi-1 (points lo..hi)
+        dif = u[lo:hi + 1] - level
+        idx = np.flatnonzero(dif[:-1] * dif[1:] <= 0)
+        whole = lo == 0 and hi == n_seg
+        if idx.size:
+            u0 = u[lo + idx]
+            u1 = u[lo + idx + 1]
+            x0 = x[lo + idx]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                xs = np.where(u1 == u0, x0, x0 + (level - u0) / (u1 - u0) * (x[lo + idx + 1] - x0))
+            j = int(np.argmin(np.abs(xs - x_guess)))
+            d = abs(float(xs[j]) - x_guess)
+            # crossings left of the window lie at ≤ x[lo], right of it at ≥ x[hi]
+            margin = min(x_guess - x[lo] if lo > 0 else np.inf, x[hi] - x_guess if hi < n_seg else np.inf)
+            if whole or d < margin:
+                return float(xs[j]), int(lo + idx[j])
+        elif whole:
+            return None
+        w *= 2
+
+
+def gradient_peak(x: np.ndarray, u: np.ndarray, dx: float, lo: int = 0, hi: Optional[int] = None) -> float:
+    """
+    Position of max |∂x u| over points lo..hi-1 (central differences, one-sided at the domain
+    ends, as in the full-field tracker). Cost is O(hi − lo).
+    """
+    N = u.size
+    hi = N if hi is None else hi
+    k = np.arange(max(0, lo), min(N, hi))
+    kp = np.minimum(k + 1, N - 1)
+    km = np.maximum(k - 1, 0)
+    grad = (u[kp] - u[km]) / ((kp - km) * dx)
+    return float(x[k[np.argmax(np.abs(grad))]])
+
+
 def robust_linear_fit(t: np.ndarray, x: np.ndarray, smooth_win: int = 7, mad_k: float = 3.0, max_iter: int = 3):
     """
     Robust linear fit x(t) ~ a * t + b with simple moving-average smoothing and MAD-based outlier rejection.
+    Single-series robust_linear_fit_batch (src.reaction_diffusion.robust_fit).
     Returns (a, R^2). If insufficient points, returns (nan, nan).
     """
     t = np.asarray(t, dtype=float).ravel()
     x = np.asarray(x, dtype=float).ravel()
-    n = t.size
-    if n < 2:
+    if t.size < 2:
         return float("nan"), float("nan")
-
-    # Smooth x with moving average (odd window)
-    if smooth_win % 2 == 0:
-        smooth_win += 1
-    if n >= smooth_win and smooth_win > 1:
-        kernel = np.ones(smooth_win, dtype=float) / smooth_win
-        x_s = np.convolve(x, kernel, mode="same")
-    else:
-        x_s = x.copy()
-
-    mask = np.ones(n, dtype=bool)
-    a = float("nan")
-    b = float("nan")
-
-    for _ in range(max_iter):
-        tt = t[mask]
-        xx = x_s[mask]
-        if tt.size < 2:
-            break
-        coeffs = np.polyfit(tt, xx, 1)
-        a = float(coeffs[0])
-        b = float(coeffs[1])
-        pred = a * t + b
-        resid = x_s - pred
-        mad = float(np.median(np.abs(resid[mask])) + 1e-12)
-        new_mask = np.abs(resid) <= mad_k * mad
-        # Ensure we keep enough points
-        if new_mask.sum() < max(5, int(0.2 * n)):
-            break
-        # If mask stabilizes, stop
-        if np.array_equal(new_mask, mask):
-            break
-        mask = new_mask
-
-    # Final R^2 on kept points
-    tt = t[mask]
-    xx = x_s[mask]
-    if tt.size >= 2 and np.isfinite(a):
-        pred = a * tt + b
-        ss_res = float(np.sum((xx - pred) ** 2))
-        ss_tot = float(np.sum((xx - np.mean(xx)) ** 2) + 1e-12)
-        r2 = 1.0 - ss_res / ss_tot
-    else:
-        a, r2 = float("nan"), float("nan")
-    return a, r2
+    a, r2 = robust_linear_fit_batch(t, x[None, :], smooth_win=smooth_win, mad_k=mad_k, max_iter=max_iter)
+    return float(a[0]), float(r2[0])
 
 
-def run_sim(
-    N: int,
-    L: float,
-    D: float,
-    r: float,
-    T: float,
-    cfl: float,
-    seed: int,
-    level: float = 0.5,
-    x0: Optional[float] = None,
-    fit_frac: Tuple[float, float] = (0.2, 0.9),
-    noise_amp: float = 0.0,
-):
-    rng = np.random.default_rng(seed)
-    x = np.linspace(-L/2, L/2, N, endpoint=False)
-    dx = x[1] - x[0]
-    # stability-limited timestep (explicit Euler)
-    dt_diff = cfl * dx*dx / (2.0*D + 1e-12)
-    dt_reac = 0.2 / r if r > 0 else dt_diff
-    dt = min(dt_diff, dt_reac)
-    steps = int(max(2, math.ceil(T / dt)))
-    dt = T / steps
-
-    # Smooth step IC: left ~1, right ~0; place interface well inside domain
+def initial_front(x: np.ndarray, x0: float, noise_amp: float = 0.0, rng=None) -> np.ndarray:
+    """Smooth step IC (left ~1, right ~0) at x0 with optional gated noise behind the interface."""
     w = 2.0  # interface width
-    if x0 is None:
-        x0 = -L / 4.0
     u = 0.5 * (1.0 - np.tanh((x - x0) / w))
     # keep far-ahead region identically zero to avoid uniform logistic growth
     region_edge = x0 + 6.0 * w
     u[x > region_edge] = 0.0
     # optional: gated noise only on the left side of the interface
     if noise_amp > 0.0:
-        noise = noise_amp * rng.standard_normal(size=N)
+        rng = rng if rng is not None else np.random.default_rng()
+        noise = noise_amp * rng.standard_normal(size=x.size)
         noise[x > region_edge] = 0.0
         u += noise
-    u = np.clip(u, 0.0, 1.0)
+    return np.clip(u, 0.0, 1.0)
 
-    rec_t = []
-    rec_xf = []
-    rec_xg = []
-    snapshot_times = []
-    snapshots = []
-
-    out_every = max(1, steps // 400)
-    snap_every = max(1, steps // 6)
-    last_xf = None
 
-    for n in range(steps):
-        lap = laplacian_neumann(u, dx)
-        u += dt * (D * lap + r * u * (1.0 - u))
-        u = np.clip(u, 0.0, 1.0)
-
-        if n % out_every == 0:
-            t = (n+1) * dt
-            # real level crossing?
-            dif = u - level
-            has_cross = np.any(dif[:-1] * dif[1:] <= 0)
-            if has_cross:
-                if last_xf is None:
-                    xf = front_position(x, u, level)
-                else:
-                    xf = front_position_near(x, u, level, last_xf)
-                last_xf = xf
-                rec_t.append(t)
-                rec_xf.append(xf)
-                # gradient-peak tracker (cross-check)
-                grad = np.empty_like(u)
-                grad[1:-1] = (u[2:] - u[:-2]) / (2.0 * dx)
-                grad[0] = (u[1] - u[0]) / dx
-                grad[-1] = (u[-1] - u[-2]) / dx
-                xg = float(x[np.argmax(np.abs(grad))])
-                rec_xg.append(xg)
-            else:
-                # front has passed; if domain is fully invaded (> level), stop tracking
-                if float(np.min(u)) > level:
-                    break
-        if n % snap_every == 0:
-            snapshot_times.append((n+1) * dt)
-            snapshots.append(u.copy())
-
-    rec_t = np.array(rec_t)
-    rec_xf = np.array(rec_xf)
-
-    # Fit speed from late-time window
+def fit_front_speed(rec_t, rec_xf, rec_xg, c_th: float, fit_frac: Tuple[float, float] = (0.2, 0.9)) -> dict:
+    """
+    Front speed from a tracked trajectory: robust fit over the fit_frac window of the
+    level-crossing track (median-slope fallbacks) plus the gradient-peak cross-check.
+
+    Args:
+        rec_t, rec_xf, rec_xg: record times, level-crossing and gradient-peak positions.
+        c_th: theoretical speed 2√(D r) for rel_err.
+        fit_frac: (start, end) fractions of the record used for the fit.
+    Returns:
+        dict with c_meas, c_abs, rel_err, r2, c_meas_grad, c_abs_grad, rel_err_grad, r2_grad.
+    """
+    rec_t = np.asarray(rec_t, dtype=float)
+    rec_xf = np.asarray(rec_xf, dtype=float)
+    rec_xg = np.asarray(rec_xg, dtype=float)
     f0, f1 = fit_frac
     i0 = int(max(0, min(len(rec_t)-2, round(f0 * len(rec_t)))))
     i1 = int(max(i0+2, min(len(rec_t), round(f1 * len(rec_t)))))
@@ -257,7 +285,6 @@ def run_sim(
         c_meas, r2 = float("nan"), float("nan")
 
     # Final metrics after fit
-    c_th = 2.0 * math.sqrt(D * r)
     c_abs = abs(c_meas) if math.isfinite(c_meas) else float("nan")
     rel_err = abs(c_abs - c_th) / (abs(c_th) + 1e-12)
 
@@ -285,10 +312,170 @@ def run_sim(
     else:
         c_meas_grad = float("nan"); r2_grad = float("nan"); c_abs_grad = float("nan"); rel_err_grad = float("nan")
 
+    return {
+        "c_meas": c_meas,
+        "c_abs": c_abs,
+        "rel_err": rel_err,
+        "r2": r2,
+        "c_meas_grad": c_meas_grad,
+        "c_abs_grad": c_abs_grad,
+        "rel_err_grad": rel_err_grad,
+        "r2_grad": r2_grad,
+    }
+
+
+def run_sim(
+    N: int,
+    L: float,
+    D: float,
+    r: float,
+    T: float,
+    cfl: float,
+    seed: int,
+    level: float = 0.5,
+    x0: Optional[float] = None,
+    fit_frac: Tuple[float, float] = (0.2, 0.9),
+    noise_amp: float = 0.0,
+    scheme: str = "euler",
+    dt_cn: Optional[float] = None,
+    tracker: str = "window",
+    record_every: Optional[int] = None,
+    track_half_width: int = 32,
+    grad_window: Optional[float] = None,
+    comoving: bool = False,
+):
+    """
+    Integrate Fisher-KPP from a smooth step and track the front.
+
+    scheme="euler" is explicit Euler with the diffusive CFL limit. scheme="cn" Strang-splits
+    the exact logistic flow around a Crank–Nicolson diffusion step (cached tridiagonal LU),
+    with dt = dt_cn (default 0.05/r) independent of dx.
+
+    tracker="window" keeps a bracketing index window around the last crossing
+    (front_position_window, track_half_width cells, widened as needed) and takes the gradient
+    peak within grad_window (x units, default 8·√(D/r), a few front widths) of it, so each
+    record costs O(window) rather than O(N);
+    tracker="scan" is the full-field reference. The level-crossing track is identical for
+    both. record_every defaults to steps // 400; 1 records every step.
+
+    comoving=True integrates in a co-moving frame: whenever the tracked crossing drifts more
+    than N/16 cells from the domain centre, the field is shifted back by whole cells, padding
+    with the u=1 (behind) and u=0 (ahead) asymptotes, and a running offset keeps x_front in
+    absolute coordinates. T is then unbounded by L at fixed memory and cost per step.
+    """
+    if scheme not in ("euler", "cn"):
+        raise ValueError(f"unknown scheme {scheme!r} (expected 'euler' or 'cn')")
+    if tracker not in ("window", "scan"):
+        raise ValueError(f"unknown tracker {tracker!r} (expected 'window' or 'scan')")
+    rng = np.random.default_rng(seed)
+    x = np.linspace(-L/2, L/2, N, endpoint=False)
+    dx = x[1] - x[0]
+    if scheme == "cn":
+        # unconditionally stable diffusion; resolve the reaction time 1/r only
+        dt = dt_cn if dt_cn is not None else (0.05 / r if r > 0 else T / 400.0)
+    else:
+        # stability-limited timestep (explicit Euler)
+        dt_diff = cfl * dx*dx / (2.0*D + 1e-12)
+        dt_reac = 0.2 / r if r > 0 else dt_diff
+        dt = min(dt_diff, dt_reac)
+    steps = int(max(2, math.ceil(T / dt)))
+    dt = T / steps
+
+    if x0 is None:
+        x0 = -L / 4.0
+    u = initial_front(x, x0, noise_amp, rng)
+
+    rec_t = []
+    rec_xf = []
+    rec_xg = []
+    snapshot_times = []
+    snapshots = []
+
+    out_every = max(1, int(record_every)) if record_every is not None else max(1, steps // 400)
+    snap_every = max(1, steps // 6)
+    last_xf = None
+    last_i = -1
+    if grad_window is None:
+        grad_window = 8.0 * math.sqrt(D / r) if r > 0 else L
+    grad_cells = int(math.ceil(grad_window / dx))
+    # co-moving frame: x_abs = x + offset, shifted by whole cells to keep the front centred
+    offset = 0.0
+    x_abs = x
+    i_center = N // 2
+    shift_tol = max(1, N // 16)
+    snapshot_offsets = []
+
+    for n in range(steps):
+        if scheme == "cn":
+            u = logistic_flow(u, r, 0.5 * dt)
+            u = np.clip(cn_neumann_step(u, dx, D, dt), 0.0, 1.0)
+            u = logistic_flow(u, r, 0.5 * dt)
+        else:
+            lap = laplacian_neumann(u, dx)
+            u += dt * (D * lap + r * u * (1.0 - u))
+            u = np.clip(u, 0.0, 1.0)
+
+        if n % out_every == 0:
+            t = (n+1) * dt
+            if tracker == "window" and last_xf is not None:
+                hit = front_position_window(x_abs, u, level, last_xf, last_i, track_half_width)
+                has_cross = hit is not None
+                if has_cross:
+                    xf, last_i = hit
+                    xg = gradient_peak(x_abs, u, dx, last_i - grad_cells, last_i + grad_cells + 2)
+            else:
+                # real level crossing?
+                dif = u - level
+                has_cross = np.any(dif[:-1] * dif[1:] <= 0)
+                if has_cross:
+                    if last_xf is None:
+                        xf = front_position(x_abs, u, level)
+                    else:
+                        xf = front_position_near(x_abs, u, level, last_xf)
+                    last_i = int(np.clip(np.searchsorted(x_abs, xf, side="right") - 1, 0, N - 2))
+                    # gradient-peak tracker (cross-check)
+                    xg = gradient_peak(x_abs, u, dx)
+            if has_cross:
+                last_xf = xf
+                rec_t.append(t)
+                rec_xf.append(xf)
+                rec_xg.append(xg)
+                shift = last_i - i_center
+                if comoving and abs(shift) > shift_tol:
+                    if shift > 0:
+                        u[:-shift] = u[shift:]
+                        u[-shift:] = 0.0
+                    else:
+                        u[-shift:] = u[:shift]
+                        u[:-shift] = 1.0
+                    offset += shift * dx
+                    x_abs = x + offset
+                    last_i -= shift
+            else:
+                # front has passed; if domain is fully invaded (> level), stop tracking
+                if float(np.min(u)) > level:
+                    break
+        if n % snap_every == 0:
+            snapshot_times.append((n+1) * dt)
+            snapshots.append(u.copy())
+            snapshot_offsets.append(offset)
+
+    rec_t = np.array(rec_t)
+    rec_xf = np.array(rec_xf)
+
+    # Fit speed from late-time window
+    f0, f1 = fit_frac
+    c_th = 2.0 * math.sqrt(D * r)
+    fit = fit_front_speed(rec_t, rec_xf, rec_xg, c_th, fit_frac)
+    c_meas, c_abs, rel_err, r2 = fit["c_meas"], fit["c_abs"], fit["rel_err"], fit["r2"]
+    c_meas_grad, c_abs_grad = fit["c_meas_grad"], fit["c_abs_grad"]
+    rel_err_grad, r2_grad = fit["rel_err_grad"], fit["r2_grad"]
+
     return {
         "x": x,
         "snapshots": snapshots,
         "snapshot_times": snapshot_times,
+        "snapshot_offsets": snapshot_offsets,
         "rec_t": rec_t,
         "rec_xf": rec_xf,
         "rec_xg": rec_xg,
@@ -309,7 +496,231 @@ def run_sim(
     }
 
 
+def front_positions_rows(
+    x: np.ndarray,
+    u: np.ndarray,
+    level: np.ndarray,
+    x_guess: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized front_position / front_position_near over the rows of u[B, N].
+
+    Args:
+        x: (N,) grid.
+        u: (B, N) fields.
+        level: (B,) crossing levels.
+        x_guess: optional (B,) previous positions; NaN entries take the first crossing
+            (front_position), finite entries the crossing nearest the guess (front_position_near).
+    Returns:
+        (xf, has_cross): (B,) positions (NaN where a row has no crossing) and (B,) bool.
+    """
+    dif = u - level[:, None]
+    cross = dif[:, :-1] * dif[:, 1:] <= 0
+    has_cross = cross.any(axis=1)
+    u0, u1 = u[:, :-1], u[:, 1:]
+    den = u1 - u0
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        frac = np.where(den != 0, (level[:, None] - u0) / den, 0.0)
+    xs = x[:-1] + frac * (x[1:] - x[:-1])
+    first = np.argmax(cross, axis=1)
+    if x_guess is not None:
+        dist = np.where(cross, np.abs(xs - x_guess[:, None]), np.inf)
+        near = np.argmin(dist, axis=1)
+        first = np.where(np.isfinite(x_guess), near, first)
+    rows = np.arange(u.shape[0])
+    xf = np.where(has_cross, xs[rows, first], np.nan)
+    return xf, has_cross
+
+
+def run_sim_batch(
+    N: int,
+    L: float,
+    D,
+    r,
+    T: float,
+    cfl: float,
+    seed=0,
+    level=0.5,
+    x0=None,
+    fit_frac: Tuple[float, float] = (0.2, 0.9),
+    noise_amp: float = 0.0,
+) -> dict:
+    """
+    Batched run_sim: integrate B Fisher-KPP cases as one u[B, N] array.
+
+    D, r, level, seed and x0 broadcast to (B,); each row keeps its own stability-limited
+    dt and step count, its own record cadence and its own early stop, so row b reproduces
+    run_sim with the same arguments. Rows that have finished (step count reached) drop out of
+    the stepping slice; rows stopped early are frozen with dt=0. The Laplacian and update run
+    in place on preallocated buffers; level crossings and the gradient-peak tracker are
+    located for all recording rows at once. Snapshots are not kept.
+
+    Returns:
+        dict of per-row arrays: c_meas, c_abs, c_th, rel_err, r2, c_meas_grad, c_abs_grad,
+        rel_err_grad, r2_grad, dt, steps (B,); rec_t, rec_xf, rec_xg (B, R) NaN-padded with
+        n_rec (B,) valid entries; plus x, dx, D, r, level, fit_frac.
+    """
+    D, r, level, seed = np.broadcast_arrays(
+        np.asarray(D, dtype=float), np.asarray(r, dtype=float),
+        np.asarray(level, dtype=float), np.asarray(seed, dtype=np.int64),
+    )
+    D, r, level, seed = (np.atleast_1d(a).ravel().copy() for a in (D, r, level, seed))
+    B = D.size
+    if x0 is None:
+        x0 = -L / 4.0
+    x0 = np.broadcast_to(np.asarray(x0, dtype=float), (B,))
+
+    x = np.linspace(-L/2, L/2, N, endpoint=False)
+    dx = x[1] - x[0]
+    # per-row stability-limited timestep (explicit Euler), as in run_sim
+    dt_diff = cfl * dx*dx / (2.0*D + 1e-12)
+    dt_reac = np.where(r > 0, 0.2 / np.where(r > 0, r, 1.0), dt_diff)
+    dt = np.minimum(dt_diff, dt_reac)
+    steps = np.maximum(2, np.ceil(T / dt)).astype(np.int64)
+    dt = T / steps
+    out_every = np.maximum(1, steps // 400)
+
+    # Rows run in order of decreasing step count, so the rows still stepping at step n
+    # are always a leading slice u[:k] (a view) and finished rows cost nothing.
+    order = np.argsort(-steps, kind="stable")
+    steps_o, dt_o, out_every_o, level_o = steps[order], dt[order], out_every[order], level[order]
+    n_live = np.searchsorted(-steps_o, -np.arange(int(steps_o[0])), side="left")
+
+    u = np.empty((B, N), dtype=float)
+    for i, b in enumerate(order):
+        u[i] = initial_front(x, float(x0[b]), noise_amp, np.random.default_rng(int(seed[b])))
+
+    lap = np.empty_like(u)
+    react = np.empty_like(u)
+    tmp = np.empty_like(u)
+    D_col, r_col = D[order, None], r[order, None]
+    dt_col = dt_o[:, None].copy()
+
+    R = int(np.max((steps - 1) // out_every + 1))
+    rec_t = np.full((B, R), np.nan)
+    rec_xf = np.full((B, R), np.nan)
+    rec_xg = np.full((B, R), np.nan)
+    n_rec = np.zeros(B, dtype=np.int64)
+    last_xf = np.full(B, np.nan)
+    done = np.zeros(B, dtype=bool)
+
+    for n in range(int(steps_o[0])):
+        k = int(n_live[n])
+        if done[:k].all():
+            break
+        uk, lk, rk, tk = u[:k], lap[:k], react[:k], tmp[:k]
+        laplacian_neumann_rows(uk, dx, lk)
+        # u += dt * (D * lap + r * u * (1 - u)), same operation order as run_sim
+        np.multiply(r_col[:k], uk, out=rk)
+        np.subtract(1.0, uk, out=tk)
+        rk *= tk
+        lk *= D_col[:k]
+        lk += rk
+        lk *= dt_col[:k]
+        uk += lk
+        np.clip(uk, 0.0, 1.0, out=uk)
+
+        rows = np.flatnonzero(~done[:k] & (n % out_every_o[:k] == 0))
+        if rows.size == 0:
+            continue
+        ur = u[rows]
+        xf, has = front_positions_rows(x, ur, level_o[rows], last_xf[rows])
+        if has.any():
+            hit = rows[has]
+            j = n_rec[hit]
+            rec_t[hit, j] = (n + 1) * dt_o[hit]
+            rec_xf[hit, j] = xf[has]
+            # gradient-peak tracker (cross-check)
+            uh = ur[has]
+            grad = np.empty_like(uh)
+            grad[:, 1:-1] = (uh[:, 2:] - uh[:, :-2]) / (2.0 * dx)
+            grad[:, 0] = (uh[:, 1] - uh[:, 0]) / dx
+            grad[:, -1] = (uh[:, -1] - uh[:, -2]) / dx
+            rec_xg[hit, j] = x[np.argmax(np.abs(grad), axis=1)]
+            last_xf[hit] = xf[has]
+            n_rec[hit] += 1
+        # front has passed; if domain is fully invaded (> level), stop tracking that row
+        miss = rows[~has]
+        if miss.size:
+            stop = ur[~has].min(axis=1) > level_o[miss]
+            done[miss[stop]] = True
+            dt_col[miss[stop], 0] = 0.0
+
+    # back to caller order
+    inv = np.empty_like(order)
+    inv[order] = np.arange(B)
+    rec_t, rec_xf, rec_xg, n_rec = rec_t[inv], rec_xf[inv], rec_xg[inv], n_rec[inv]
+
+    c_th = 2.0 * np.sqrt(D * r)
+    keys = ("c_meas", "c_abs", "rel_err", "r2", "c_meas_grad", "c_abs_grad", "rel_err_grad", "r2_grad")
+    out = {k: np.full(B, np.nan) for k in keys}
+    for b in range(B):
+        m = int(n_rec[b])
+        fit = fit_front_speed(rec_t[b, :m], rec_xf[b, :m], rec_xg[b, :m], float(c_th[b]), fit_frac)
+        for k in keys:
+            out[k][b] = fit[k]
+
+    out.update({
+        "x": x,
+        "c_th": c_th,
+        "rec_t": rec_t,
+        "rec_xf": rec_xf,
+        "rec_xg": rec_xg,
+        "n_rec": n_rec,
+        "D": D,
+        "r": r,
+        "level": level,
+        "dx": dx,
+        "dt": dt,
+        "steps": steps,
+        "fit_frac": list(fit_frac),
+    })
+    return out
+
+
+ACCEPTANCE_REL_ERR = 0.05
+ACCEPTANCE_R2 = 0.98
+
+
+def passes_acceptance(data: dict) -> bool:
+    """Front-speed gate: rel_err ≤ 5% and R² ≥ 0.98."""
+    return bool((data["rel_err"] <= ACCEPTANCE_REL_ERR) and (np.isfinite(data["r2"]) and data["r2"] >= ACCEPTANCE_R2))
+
+
+def build_payload(params: dict, data: dict, elapsed: float, passed: bool, figure_path, log_path) -> dict:
+    """JSON log payload (theory, params, metrics, outputs, timestamp) for one run."""
+    return {
+        "theory": "Fisher-KPP front speed c=2*sqrt(D*r)",
+        "params": dict(params),
+        "metrics": {
+            "c_meas": data["c_meas"],
+            "c_abs": data["c_abs"],
+            "c_sign": (1.0 if (np.isfinite(data['c_meas']) and data['c_meas'] >= 0) else -1.0),
+            "c_th": data["c_th"],
+            "rel_err": data["rel_err"],
+            "r2": data["r2"],
+            "dx": data["dx"],
+            "dt": data["dt"],
+            "steps": data["steps"],
+            "elapsed_sec": elapsed,
+            "acceptance_rel_err": ACCEPTANCE_REL_ERR,
+            "passed": passed,
+            "c_meas_grad": data.get("c_meas_grad", float("nan")),
+            "c_abs_grad": data.get("c_abs_grad", float("nan")),
+            "rel_err_grad": data.get("rel_err_grad", float("nan")),
+            "r2_grad": data.get("r2_grad", float("nan"))
+        },
+        "outputs": {
+            "figure": str(figure_path) if figure_path is not None else None,
+            "log": str(log_path),
+        },
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
 def plot_and_save(data: dict, figure_path):
+    import matplotlib.pyplot as plt
+
     x = data["x"]
     snapshots = data["snapshots"]
     snapshot_times = data["snapshot_times"]
@@ -323,8 +734,9 @@ def plot_and_save(data: dict, figure_path):
     plt.figure(figsize=(10, 7))
     # Top: snapshots
     ax1 = plt.subplot(2, 1, 1)
-    for u, t in zip(snapshots, snapshot_times):
-        ax1.plot(x, u, lw=1, label=f"t={t:.1f}")
+    offsets = data.get("snapshot_offsets") or [0.0] * len(snapshots)
+    for u, t, off in zip(snapshots, snapshot_times, offsets):
+        ax1.plot(x + off, u, lw=1, label=f"t={t:.1f}")
     ax1.set_title("RD Fisher-KPP front evolution")
     ax1.set_xlabel("x")
     ax1.set_ylabel("u")
@@ -370,6 +782,12 @@ def main():
     parser.add_argument("--figure", type=str, default=None, help="override figure path; otherwise script_name_timestamp.png in outdir/figures")
     parser.add_argument("--log", type=str, default=None, help="override log path; otherwise script_name_timestamp.json in outdir/logs")
     parser.add_argument("--noise_amp", type=float, default=0.0, help="optional gated noise amplitude (applied only left of the front)")
+    parser.add_argument("--scheme", choices=("euler", "cn"), default="euler", help="time integrator (cn: Crank–Nicolson + exact logistic split)")
+    parser.add_argument("--dt_cn", type=float, default=None, help="time step for --scheme cn (default 0.05/r)")
+    parser.add_argument("--tracker", choices=("window", "scan"), default="window", help="front tracker (window: O(window) per record)")
+    parser.add_argument("--record_every", type=int, default=None, help="record the front every k steps (default steps//400)")
+    parser.add_argument("--comoving", action="store_true", help="co-moving frame: recentre the front so T is not bounded by L")
+    add_figure_args(parser)
     args = parser.parse_args()
 
     # Compute output paths based on script name and UTC timestamp
@@ -394,12 +812,15 @@ def main():
         x0=args.x0,
         fit_frac=(args.fit_start, args.fit_end),
         noise_amp=args.noise_amp,
+        scheme=args.scheme,
+        dt_cn=args.dt_cn,
+        tracker=args.tracker,
+        record_every=args.record_every,
+        comoving=args.comoving,
     )
     elapsed = time.time() - t0
 
-    acceptance_rel_err = 0.05
-    acceptance_r2 = 0.98
-    passed = (data["rel_err"] <= acceptance_rel_err) and (np.isfinite(data["r2"]) and data["r2"] >= acceptance_r2)
+    passed = passes_acceptance(data)
     if figure_override is not None:
         fig_path = figure_override
         fig_path.parent.mkdir(parents=True, exist_ok=True)
@@ -412,44 +833,25 @@ def main():
     else:
         log_path_obj = io_paths.log_path(domain, slug, failed=not passed)
 
-    plot_and_save(data, fig_path)
+    figs = FigureService(args.figure_mode)
+    fig_out = figs.submit(fig_path, plot_and_save, data, fig_path)
 
-    payload = {
-        "theory": "Fisher-KPP front speed c=2*sqrt(D*r)",
-        "params": {
-            "N": args.N, "L": args.L, "D": args.D, "r": args.r, "T": args.T,
-            "cfl": args.cfl, "seed": args.seed, "level": args.level,
-            "x0": args.x0, "fit_start": args.fit_start, "fit_end": args.fit_end,
-            "noise_amp": args.noise_amp
-        },
-        "metrics": {
-            "c_meas": data["c_meas"],
-            "c_abs": data["c_abs"],
-            "c_sign": (1.0 if (np.isfinite(data['c_meas']) and data['c_meas'] >= 0) else -1.0),
-            "c_th": data["c_th"],
-            "rel_err": data["rel_err"],
-            "r2": data["r2"],
-            "dx": data["dx"],
-            "dt": data["dt"],
-            "steps": data["steps"],
-            "elapsed_sec": elapsed,
-            "acceptance_rel_err": 0.05,
-            "passed": passed,
-            "c_meas_grad": data.get("c_meas_grad", float("nan")),
-            "c_abs_grad": data.get("c_abs_grad", float("nan")),
-            "rel_err_grad": data.get("rel_err_grad", float("nan")),
-            "r2_grad": data.get("r2_grad", float("nan"))
-        },
-        "outputs": {
-            "figure": str(fig_path),
-            "log": str(log_path_obj),
-        },
-        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    params = {
+        "N": args.N, "L": args.L, "D": args.D, "r": args.r, "T": args.T,
+        "cfl": args.cfl, "seed": args.seed, "level": args.level,
+        "x0": args.x0, "fit_start": args.fit_start, "fit_end": args.fit_end,
+        "noise_amp": args.noise_amp, "scheme": args.scheme, "dt_cn": args.dt_cn,
+        "tracker": args.tracker, "record_every": args.record_every,
+        "comoving": args.comoving
     }
+    payload = build_payload(params, data, elapsed, passed, fig_path, log_path_obj)
+    if not figs.renders:
+        payload["outputs"]["figure_spec"] = str(fig_out)
     io_paths.write_log(log_path_obj, payload)
+    figs.close()
 
     print(json.dumps({
-        "figure": str(fig_path),
+        "figure": str(fig_out),
         "log": str(log_path_obj),
         "c_meas": data["c_meas"],
         "c_abs": data["c_abs"],
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""
+r"""
 Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
 
 This research is protected under a dual-license to foster open academic
@@ -8,9 +8,15 @@ See LICENSE file for full terms.
 
 RD Fisher-KPP front-speed sweep runner.
 
-Runs multiple configurations of the experiment script and writes a CSV summary
+Runs multiple configurations of the experiment and writes a CSV summary
 under: logs/reaction_diffusion/<timestamp>_rd_front_speed_sweep.csv
 
+Cases run in-process: run_sim is imported directly and cases fan out over a
+ProcessPoolExecutor sized to the available cores. Each case returns its metrics
+as a dict, and CSV rows are streamed as cases finish. Per-case JSON logs are
+always written; per-case figures only with --figures. --subprocess restores the
+legacy one-interpreter-per-case runner.
+
 Usage (PowerShell, always in venv):
   & .\venv\Scripts\Activate.ps1
   python Prometheus_VDM/write_ups/physics/rd_front_speed_sweep.py
@@ -27,6 +33,11 @@ Optional flags:
   --seed 42
   --x0 -60
   --noise_amp 0.0
+  --scheme euler     (or cn: Crank–Nicolson + exact logistic split; not with --batched)
+  --workers 8        (default: available cores; 1 runs serially in-process)
+  --figures          (render per-case figures; off by default)
+  --subprocess       (legacy: one experiment subprocess per case)
+  --batched          (one run_sim_batch pass per grid size N; metrics only, no per-case logs)
 """
 import argparse
 import csv
@@ -35,14 +46,25 @@ import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from itertools import product
 from pathlib import Path
+from typing import Callable, Iterable, List, Optional
 
 SRC_ROOT = Path(__file__).resolve().parents[1]
 if str(SRC_ROOT) not in sys.path:
     sys.path.append(str(SRC_ROOT))
 
 from src.common import io_paths
+from src.reaction_diffusion.rd_front_speed_experiment import (
+    build_payload,
+    passes_acceptance,
+    plot_and_save,
+    run_sim,
+    run_sim_batch,
+)
+
+DOMAIN = "reaction_diffusion"
 
 
 def utc_stamp():
@@ -68,6 +90,8 @@ def run_one(python_exe, exp_path, params):
     ]
     if params.get("noise_amp", 0.0) and float(params["noise_amp"]) != 0.0:
         cmd += ["--noise_amp", str(params["noise_amp"])]
+    if params.get("scheme", "euler") != "euler":
+        cmd += ["--scheme", str(params["scheme"])]
 
     # Let the experiment auto-route outputs; we capture printed JSON
     res = subprocess.run(cmd, capture_output=True, text=True)
@@ -83,6 +107,133 @@ def run_one(python_exe, exp_path, params):
     return payload
 
 
+def available_workers() -> int:
+    """Cores this process may run on (affinity-aware where supported)."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:  # pragma: no cover - non-Linux
+        return max(1, os.cpu_count() or 1)
+
+
+def case_slug(params: dict) -> str:
+    """Per-case slug; distinct across a sweep so parallel cases never share a log path."""
+    return (
+        f"rd_front_speed_experiment_N{params['N']}_D{params['D']:g}_r{params['r']:g}"
+        f"_level{params['level']:g}"
+    )
+
+
+def run_case(params: dict, render_figure: bool = False) -> dict:
+    """
+    Run one sweep case in-process and return structured results:
+    {"params": ..., "metrics": ..., "figure": path|None, "log": path}.
+    Writes the per-case JSON log; renders the figure only if requested.
+    """
+    t0 = time.time()
+    data = run_sim(
+        params["N"], params["L"], params["D"], params["r"], params["T"], params["cfl"], params["seed"],
+        level=params["level"],
+        x0=params["x0"],
+        fit_frac=(params["fit_start"], params["fit_end"]),
+        noise_amp=params.get("noise_amp", 0.0),
+        scheme=params.get("scheme", "euler"),
+    )
+    elapsed = time.time() - t0
+    passed = passes_acceptance(data)
+    slug = case_slug(params)
+    fig_path = io_paths.figure_path(DOMAIN, slug, failed=not passed) if render_figure else None
+    log_path_obj = io_paths.log_path(DOMAIN, slug, failed=not passed)
+    if fig_path is not None:
+        plot_and_save(data, fig_path)
+    payload = build_payload(params, data, elapsed, passed, fig_path, log_path_obj)
+    io_paths.write_log(log_path_obj, payload)
+    return {
+        "params": dict(params),
+        "metrics": payload["metrics"],
+        "figure": payload["outputs"]["figure"],
+        "log": payload["outputs"]["log"],
+    }
+
+
+def run_sweep(
+    cases: Iterable[dict],
+    workers: Optional[int] = None,
+    render_figures: bool = False,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> List[dict]:
+    """
+    Fan cases out over a process pool and return their results in case order.
+
+    Args:
+        cases: parameter dicts accepted by run_case.
+        workers: pool size (default: available cores, capped at the number of cases);
+            1 runs serially in this process.
+        render_figures: render per-case figures.
+        on_result: optional callback invoked as each case finishes, in completion order
+            (e.g. to stream CSV rows).
+    """
+    cases = list(cases)
+    n_workers = min(workers or available_workers(), max(1, len(cases)))
+    results: List[Optional[dict]] = [None] * len(cases)
+
+    def _done(i: int, res: dict) -> None:
+        results[i] = res
+        if on_result is not None:
+            on_result(res)
+
+    if n_workers <= 1:
+        for i, params in enumerate(cases):
+            _done(i, run_case(params, render_figures))
+        return results
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = {pool.submit(run_case, params, render_figures): i for i, params in enumerate(cases)}
+        for fut in as_completed(futures):
+            _done(futures[fut], fut.result())
+    return results
+
+
+def run_sweep_batched(
+    cases: Iterable[dict],
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> List[dict]:
+    """
+    Run cases through run_sim_batch, one u[B, N] pass per group of cases sharing the grid
+    and fit settings (D, r, level and seed vary per row). Returns run_case-shaped results
+    without per-case logs or figures.
+    """
+    groups: dict = {}
+    for params in cases:
+        if params.get("scheme", "euler") != "euler":
+            raise ValueError("run_sweep_batched supports only the explicit Euler scheme")
+        key = (params["N"], params["L"], params["T"], params["cfl"], params["x0"],
+               params["fit_start"], params["fit_end"], params.get("noise_amp", 0.0))
+        groups.setdefault(key, []).append(params)
+
+    results: List[dict] = []
+    for (N, L, T, cfl, x0, f0, f1, noise_amp), group in groups.items():
+        data = run_sim_batch(
+            N, L,
+            [p["D"] for p in group], [p["r"] for p in group], T, cfl,
+            seed=[p["seed"] for p in group],
+            level=[p["level"] for p in group],
+            x0=x0,
+            fit_frac=(f0, f1),
+            noise_amp=noise_amp,
+        )
+        for b, params in enumerate(group):
+            row = {k: float(data[k][b]) for k in (
+                "c_meas", "c_abs", "c_th", "rel_err", "r2",
+                "c_meas_grad", "c_abs_grad", "rel_err_grad", "r2_grad",
+            )}
+            row["passed"] = passes_acceptance(row)
+            res = {"params": dict(params), "metrics": row, "figure": None, "log": None}
+            results.append(res)
+            if on_result is not None:
+                on_result(res)
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(description="Sweep Fisher-KPP front-speed cases and summarize results.")
     parser.add_argument("--Ds", nargs="+", type=float, default=[0.5, 1.0, 2.0])
@@ -96,6 +247,11 @@ def main():
     parser.add_argument("--seed", type=int, default=42)
     parser.add_argument("--x0", type=float, default=-60.0)
     parser.add_argument("--noise_amp", type=float, default=0.0)
+    parser.add_argument("--scheme", choices=("euler", "cn"), default="euler", help="time integrator for each case")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: available cores)")
+    parser.add_argument("--figures", action="store_true", help="render per-case figures")
+    parser.add_argument("--subprocess", action="store_true", help="legacy runner: one experiment subprocess per case")
+    parser.add_argument("--batched", action="store_true", help="one batched solver pass per grid size (no per-case logs)")
     args = parser.parse_args()
 
     here = Path(__file__).resolve()
@@ -103,44 +259,58 @@ def main():
     python_exe = sys.executable
 
     stamp = utc_stamp()
-    domain = "reaction_diffusion"
     slug = f"rd_front_speed_sweep_{stamp}"
-    csv_path = io_paths.log_path(domain, slug).with_suffix(".csv")
+    csv_path = io_paths.log_path(DOMAIN, slug).with_suffix(".csv")
 
     header = [
         "timestamp", "N", "L", "D", "r", "T", "cfl", "seed", "x0", "level",
-        "fit_start", "fit_end", "noise_amp",
+        "fit_start", "fit_end", "noise_amp", "scheme",
         "c_meas", "c_th", "rel_err", "r2",
         "c_meas_grad", "rel_err_grad", "r2_grad",
         "figure", "log", "passed"
     ]
 
     L = 200.0  # fixed domain length for this sweep
-    rows = []
-    for N, D, r, level in product(args.Ns, args.Ds, args.rs, args.levels):
-        params = dict(
+    cases = [
+        dict(
             N=N, L=L, D=D, r=r, T=args.T, cfl=args.cfl, seed=args.seed,
             x0=args.x0, level=level, fit_start=args.fit_start, fit_end=args.fit_end,
-            noise_amp=args.noise_amp
+            noise_amp=args.noise_amp, scheme=args.scheme
         )
-        payload = run_one(python_exe, exp_path, params)
-        m = payload.get("metrics", {})
-        rows.append([
-            stamp, N, L, D, r, args.T, args.cfl, args.seed, args.x0, level,
-            args.fit_start, args.fit_end, args.noise_amp,
-            m.get("c_meas"), m.get("c_th"), m.get("rel_err"), m.get("r2"),
-            m.get("c_meas_grad"), m.get("rel_err_grad"), m.get("r2_grad"),
-            payload.get("figure"), payload.get("log"), m.get("passed"),
-        ])
+        for N, D, r, level in product(args.Ns, args.Ds, args.rs, args.levels)
+    ]
 
     with open(csv_path, "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(header)
-        w.writerows(rows)
+        f.flush()
+
+        def write_row(res: dict) -> None:
+            p, m = res["params"], res.get("metrics", {})
+            w.writerow([
+                stamp, p["N"], p["L"], p["D"], p["r"], p["T"], p["cfl"], p["seed"], p["x0"], p["level"],
+                p["fit_start"], p["fit_end"], p["noise_amp"], p.get("scheme", "euler"),
+                m.get("c_meas"), m.get("c_th"), m.get("rel_err"), m.get("r2"),
+                m.get("c_meas_grad"), m.get("rel_err_grad"), m.get("r2_grad"),
+                res.get("figure"), res.get("log"), m.get("passed"),
+            ])
+            f.flush()
+
+        if args.subprocess:
+            for params in cases:
+                payload = run_one(python_exe, exp_path, params)
+                # the experiment prints a flat summary (no nested "metrics")
+                write_row({"params": params, "metrics": payload, "figure": payload.get("figure"),
+                           "log": payload.get("log")})
+            n_done = len(cases)
+        elif args.batched:
+            n_done = len(run_sweep_batched(cases, on_result=write_row))
+        else:
+            n_done = len(run_sweep(cases, workers=args.workers, render_figures=args.figures, on_result=write_row))
 
     print(json.dumps({
         "summary_csv": str(csv_path),
-        "cases": len(rows),
+        "cases": n_done,
         "logs_root": str(io_paths.LOGS_ROOT),
     }, indent=2))
 
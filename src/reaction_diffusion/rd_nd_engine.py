@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from the author..
+See LICENSE file for full terms.
+
+N-dimensional Fisher-KPP engine (2-D / 3-D planar and radially expanding fronts):
+    ∂t u = D ∇² u + r u (1 - u)
+
+Theory:
+    Planar pulled front: c_th = 2 * sqrt(D * r)
+    Radial front of radius R in d dimensions: c(R) ≈ c_th − (d − 1) D / R  (→ c_th as R grows)
+    Finite-time (Bramson) lag of a pulled front from steep data: −3/(2λt), λ = sqrt(r/D)
+
+Acceptance: planar runs use passes_acceptance (rel_err against c_th). Radial runs are gated
+on rel_err_radial against c_th_radial = c_th − (d − 1) D / R − 3/(2λt) at the fit-window
+median radius and time; over the default fit window both lags are several percent of c_th.
+
+Engine:
+    - laplacian_nd: in-place 2d+1-point stencil, Neumann (mirrored ghost, as laplacian_neumann)
+      or periodic boundaries, on any number of axes.
+    - scheme="euler": explicit Euler, dt ≤ cfl·dx²/(2dD).
+    - scheme="spectral": Strang split of the exact logistic flow around exact diffusion of the
+      discrete Laplacian in its eigenbasis (rfftn for periodic, DCT-I for Neumann; the latter
+      needs scipy). dt is set by r only (default 0.05/r).
+    - storage="memmap" (euler only): the field lives in two disk-backed buffers under a scratch
+      directory and is advanced slab by slab along axis 0 with one ghost plane each side, so
+      working memory is O(slab) for large 3-D grids.
+    - Front extraction: planar (transverse mean profile along axis 0) or radial (shell-averaged
+      profile about the domain centre); both tracked with front_position / front_position_near.
+
+run_sim_nd returns the run_sim result dict (profile coordinate as x, profiles as snapshots),
+so plot_and_save / build_payload / passes_acceptance from rd_front_speed_experiment apply.
+
+Outputs (defaults):
+    - figures/reaction_diffusion/<timestamp>_rd_nd_engine.png
+    - logs/reaction_diffusion/<timestamp>_rd_nd_engine.json
+
+CLI example:
+  python -m src.reaction_diffusion.rd_nd_engine --shape 256 256 --L 100 --geometry radial --scheme spectral --T 60
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+SRC_ROOT = Path(__file__).resolve().parents[1]
+if str(SRC_ROOT) not in sys.path:
+    sys.path.append(str(SRC_ROOT))
+
+from src.common import io_paths
+from src.common.figure_service import FigureService, add_figure_args
+from src.reaction_diffusion.rd_front_speed_experiment import (
+    build_payload,
+    fit_front_speed,
+    front_position,
+    front_position_near,
+    logistic_flow,
+    passes_acceptance,
+    plot_and_save,
+)
+
+
+def _axis_slice(ndim: int, axis: int, sl) -> tuple:
+    idx = [slice(None)] * ndim
+    idx[axis] = sl
+    return tuple(idx)
+
+
+def laplacian_nd(u: np.ndarray, dx: float, bc: str = "neumann", out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Isotropic N-D Laplacian written into out (allocated if None) without temporaries.
+    bc="neumann" mirrors the ghost point on every face (laplacian_neumann per axis);
+    bc="periodic" wraps (laplacian_periodic per axis).
+    """
+    if bc not in ("neumann", "periodic"):
+        raise ValueError(f"unknown bc {bc!r} (expected 'neumann' or 'periodic')")
+    out = np.empty_like(u) if out is None else out
+    nd = u.ndim
+    np.multiply(u, -2.0 * nd, out=out)
+    for a in range(nd):
+        S = lambda sl: _axis_slice(nd, a, sl)  # noqa: E731
+        mid = out[S(slice(1, -1))]
+        mid += u[S(slice(2, None))]
+        mid += u[S(slice(None, -2))]
+        # length-1 slices keep lo/hi as views (a bare index would copy in 1-D)
+        lo, hi = out[S(slice(0, 1))], out[S(slice(-1, None))]
+        if bc == "neumann":
+            lo += u[S(slice(1, 2))]
+            lo += u[S(slice(1, 2))]
+            hi += u[S(slice(-2, -1))]
+            hi += u[S(slice(-2, -1))]
+        else:
+            lo += u[S(slice(1, 2))]
+            lo += u[S(slice(-1, None))]
+            hi += u[S(slice(-2, -1))]
+            hi += u[S(slice(0, 1))]
+    out /= dx * dx
+    return out
+
+
+def diffusion_symbol(shape: Sequence[int], dx: float, bc: str) -> np.ndarray:
+    """
+    Eigenvalues of laplacian_nd in its eigenbasis, broadcast over the transform grid:
+    rfftn layout for periodic, DCT-I layout for Neumann.
+    """
+    nd = len(shape)
+    lam = 0.0
+    for a, n in enumerate(shape):
+        if bc == "periodic":
+            k = np.arange(n // 2 + 1) if a == nd - 1 else np.arange(n)
+            la = -(4.0 / (dx * dx)) * np.sin(np.pi * k / n) ** 2
+        else:
+            k = np.arange(n)
+            la = -(4.0 / (dx * dx)) * np.sin(np.pi * k / (2.0 * (n - 1))) ** 2
+        view = [1] * nd
+        view[a] = la.size
+        lam = lam + la.reshape(view)
+    return np.asarray(lam)
+
+
+def spectral_diffusion(u: np.ndarray, prop: np.ndarray, bc: str) -> np.ndarray:
+    """Exact diffusion step of the discrete Laplacian: u ← V e^{DΔt Λ} V⁻¹ u."""
+    if bc == "periodic":
+        return np.fft.irfftn(np.fft.rfftn(u) * prop, s=u.shape, axes=tuple(range(u.ndim)))
+    try:
+        from scipy import fft as sp_fft
+    except Exception as exc:
+        raise RuntimeError("scipy is required for scheme='spectral' with Neumann boundaries") from exc
+    return sp_fft.idctn(sp_fft.dctn(u, type=1) * prop, type=1)
+
+
+def initial_front_nd(coords: Sequence[np.ndarray], geometry: str, x0: float, R0: float,
+                     noise_amp: float = 0.0, rng=None, out: Optional[np.ndarray] = None,
+                     slab: int = 64) -> np.ndarray:
+    """
+    Smooth invaded region (u ~ 1) with a tanh edge of width 2: a half-space x < x0 along axis 0
+    (planar) or a ball of radius R0 about the centre (radial). Far-ahead cells are exactly zero.
+
+    With out given (e.g. an np.memmap) the field is written into it slab by slab along axis 0,
+    so only O(slab) of it is in memory; the noise stream is drawn in the same order either way.
+    """
+    shape = tuple(c.size for c in coords)
+    if noise_amp > 0.0 and rng is None:
+        rng = np.random.default_rng()
+    if out is None:
+        return _initial_front_block(coords, geometry, x0, R0, noise_amp, rng, 0, shape[0])
+    for i0, i1 in _slabs(shape[0], slab):
+        out[i0:i1] = _initial_front_block(coords, geometry, x0, R0, noise_amp, rng, i0, i1)
+    return out
+
+
+def _initial_front_block(coords: Sequence[np.ndarray], geometry: str, x0: float, R0: float,
+                         noise_amp: float, rng, i0: int, i1: int) -> np.ndarray:
+    """Rows i0:i1 (axis 0) of initial_front_nd."""
+    w = 2.0
+    sub = [coords[0][i0:i1]] + list(coords[1:])
+    grids = np.meshgrid(*sub, indexing="ij", sparse=True)
+    if geometry == "planar":
+        s = np.broadcast_to(grids[0] - x0, tuple(c.size for c in sub))
+    else:
+        s = np.sqrt(sum(g * g for g in grids)) - R0
+    u = 0.5 * (1.0 - np.tanh(s / w))
+    u[s > 6.0 * w] = 0.0
+    if noise_amp > 0.0:
+        noise = noise_amp * rng.standard_normal(size=u.shape)
+        noise[s > 6.0 * w] = 0.0
+        u += noise
+    return np.clip(u, 0.0, 1.0)
+
+
+class _RadialBins:
+    """
+    Shell bins of width dx about the domain centre. With cache=True the flat bin index of every
+    cell is kept (O(N) ints); otherwise bins are recomputed slab by slab along axis 0.
+    """
+
+    def __init__(self, coords: Sequence[np.ndarray], dx: float, cache: bool = True, slab: int = 64):
+        self.coords = coords
+        self.dx = dx
+        self.slab = slab
+        grids = np.meshgrid(*coords[1:], indexing="ij", sparse=True)
+        self.rt2 = sum(g * g for g in grids) if grids else np.zeros(())
+        rmax = math.sqrt(sum(float(np.max(c * c)) for c in coords))
+        self.nbins = int(rmax / dx) + 2
+        self.counts = np.zeros(self.nbins)
+        self.rsum = np.zeros(self.nbins)
+        cached = []
+        for i0, i1 in _slabs(coords[0].size, slab):
+            b, rr = self._bins(i0, i1)
+            self.counts += np.bincount(b.ravel(), minlength=self.nbins)
+            self.rsum += np.bincount(b.ravel(), weights=rr.ravel(), minlength=self.nbins)
+            if cache:
+                cached.append(b.ravel().astype(np.int32))
+        self.flat = np.concatenate(cached) if cache else None
+        # only shells fully inside the box give an unbiased profile
+        r_in = min(float(np.max(np.abs(c))) for c in coords)
+        self.valid = (self.counts > 0) & (np.arange(self.nbins) * dx < r_in)
+        self.radius = self.rsum[self.valid] / self.counts[self.valid]
+
+    def _bins(self, i0: int, i1: int):
+        x0 = self.coords[0][i0:i1].reshape((-1,) + (1,) * (len(self.coords) - 1))
+        rr = np.sqrt(x0 * x0 + self.rt2)
+        return (rr / self.dx).astype(np.int64), rr
+
+    def profile(self, u: np.ndarray) -> np.ndarray:
+        if self.flat is not None:
+            sums = np.bincount(self.flat, weights=np.asarray(u).ravel(), minlength=self.nbins)
+        else:
+            sums = np.zeros(self.nbins)
+            for i0, i1 in _slabs(u.shape[0], self.slab):
+                b, _ = self._bins(i0, i1)
+                sums += np.bincount(b.ravel(), weights=np.asarray(u[i0:i1]).ravel(), minlength=self.nbins)
+        return sums[self.valid] / self.counts[self.valid]
+
+
+def _slabs(n: int, size: int):
+    for i0 in range(0, n, size):
+        yield i0, min(n, i0 + size)
+
+
+def planar_profile(u: np.ndarray, slab: int = 64) -> np.ndarray:
+    """Transverse mean of u along axis 0 (slab-wise, so memmapped fields are streamed)."""
+    axes = tuple(range(1, u.ndim))
+    out = np.empty(u.shape[0])
+    for i0, i1 in _slabs(u.shape[0], slab):
+        out[i0:i1] = np.asarray(u[i0:i1]).mean(axis=axes) if axes else np.asarray(u[i0:i1])
+    return out
+
+
+def _euler_update(u_blk: np.ndarray, lap: np.ndarray, tmp: np.ndarray, D: float, r: float, dt: float) -> None:
+    """u += dt (D lap + r u (1 − u)) in place, then clip to [0, 1]."""
+    np.subtract(1.0, u_blk, out=tmp)
+    tmp *= u_blk
+    tmp *= r
+    lap *= D
+    lap += tmp
+    lap *= dt
+    u_blk += lap
+    np.clip(u_blk, 0.0, 1.0, out=u_blk)
+
+
+def euler_step_slabs(src: np.ndarray, dst: np.ndarray, dx: float, D: float, r: float, dt: float,
+                     bc: str = "neumann", slab: int = 32) -> None:
+    """
+    One explicit step from src into dst, slab by slab along axis 0. Each slab is read with one
+    ghost plane per side (mirror or wrap at the domain ends), so only O(slab) of the field is in
+    memory at a time; src and dst may be np.memmap buffers.
+    """
+    n = src.shape[0]
+    for i0, i1 in _slabs(n, slab):
+        lo = (1 if bc == "neumann" else n - 1) if i0 == 0 else i0 - 1
+        hi = (n - 2 if bc == "neumann" else 0) if i1 == n else i1
+        blk = np.concatenate([np.asarray(src[lo:lo + 1]), np.asarray(src[i0:i1]), np.asarray(src[hi:hi + 1])])
+        lap = laplacian_nd(blk, dx, bc)
+        core = blk[1:-1]
+        _euler_update(core, lap[1:-1], np.empty_like(core), D, r, dt)
+        dst[i0:i1] = core
+
+
+def run_sim_nd(
+    shape: Sequence[int],
+    L: float,
+    D: float,
+    r: float,
+    T: float,
+    cfl: float = 0.2,
+    seed: int = 0,
+    level: float = 0.1,
+    geometry: str = "radial",
+    bc: str = "neumann",
+    scheme: str = "euler",
+    x0: Optional[float] = None,
+    R0: float = 8.0,
+    fit_frac: Tuple[float, float] = (0.6, 0.9),
+    noise_amp: float = 0.0,
+    dt_spectral: Optional[float] = None,
+    storage: str = "memory",
+    scratch_dir: Optional[str] = None,
+    slab: int = 32,
+    record_every: Optional[int] = None,
+) -> dict:
+    """
+    Integrate N-D Fisher-KPP on [-L/2, L/2)^d (cubic cells, dx = L / shape[0]) and track the front.
+
+    Args:
+        shape: grid shape (2-D or 3-D; 1-D works too).
+        geometry: "planar" (front normal to axis 0, started at x0) or "radial" (ball of radius R0).
+        bc: "neumann" or "periodic" on every face.
+        scheme: "euler" or "spectral" (see module docstring).
+        storage: "memory" or "memmap" (euler only; buffers under scratch_dir, removed afterwards).
+        slab: axis-0 slab size for memmap stepping and profile extraction.
+        record_every: front record cadence in steps (default steps // 400).
+    Returns:
+        run_sim-style dict: x (profile coordinate), snapshots (profiles), rec_t, rec_xf, rec_xg,
+        c_meas, c_abs, c_th, rel_err, r2, *_grad, dx, dt, steps, level, fit_frac, plus
+        c_th_curv / rel_err_curv (curvature-corrected reference for radial fronts; equal to
+        c_th for planar), c_th_radial / rel_err_radial (c_th_curv less the Bramson lag; the
+        radial acceptance reference), geometry, shape and final_slice (a 2-D slice of the
+        final field).
+    """
+    if geometry not in ("planar", "radial"):
+        raise ValueError(f"unknown geometry {geometry!r} (expected 'planar' or 'radial')")
+    if scheme not in ("euler", "spectral"):
+        raise ValueError(f"unknown scheme {scheme!r} (expected 'euler' or 'spectral')")
+    if storage not in ("memory", "memmap"):
+        raise ValueError(f"unknown storage {storage!r} (expected 'memory' or 'memmap')")
+    if storage == "memmap" and scheme != "euler":
+        raise ValueError("storage='memmap' supports only scheme='euler'")
+
+    shape = tuple(int(n) for n in shape)
+    nd = len(shape)
+    dx = L / shape[0]
+    coords = [(-0.5 * n + np.arange(n)) * dx for n in shape]
+    rng = np.random.default_rng(seed)
+
+    if scheme == "spectral":
+        dt = dt_spectral if dt_spectral is not None else (0.05 / r if r > 0 else T / 400.0)
+    else:
+        dt_diff = cfl * dx * dx / (2.0 * nd * D + 1e-12)
+        dt_reac = 0.2 / r if r > 0 else dt_diff
+        dt = min(dt_diff, dt_reac)
+    steps = int(max(2, math.ceil(T / dt)))
+    dt = T / steps
+
+    if x0 is None:
+        x0 = -L / 4.0
+
+    if geometry == "radial":
+        bins = _RadialBins(coords, dx, cache=(storage == "memory"), slab=slab)
+        x_prof = bins.radius
+        profile = bins.profile
+    else:
+        x_prof = coords[0]
+        profile = lambda f: planar_profile(f, slab)  # noqa: E731
+
+    rec_t, rec_xf, rec_xg = [], [], []
+    snapshots, snapshot_times = [], []
+    out_every = max(1, int(record_every)) if record_every is not None else max(1, steps // 400)
+    snap_every = max(1, steps // 6)
+    last_xf = None
+    dxp = float(np.median(np.diff(x_prof))) if x_prof.size > 1 else dx
+
+    tmpdir = None
+    u = v = None
+    try:
+        if storage == "memmap":
+            tmpdir = tempfile.mkdtemp(prefix="rd_nd_", dir=scratch_dir)
+            u = np.lib.format.open_memmap(os.path.join(tmpdir, "u.npy"), mode="w+", dtype=float, shape=shape)
+            v = np.lib.format.open_memmap(os.path.join(tmpdir, "v.npy"), mode="w+", dtype=float, shape=shape)
+            initial_front_nd(coords, geometry, x0, R0, noise_amp, rng, out=u, slab=slab)
+        else:
+            u = initial_front_nd(coords, geometry, x0, R0, noise_amp, rng)
+            if scheme == "spectral":
+                prop = np.exp(D * dt * diffusion_symbol(shape, dx, bc))
+            else:
+                lap = np.empty_like(u)
+                tmp = np.empty_like(u)
+
+        for n in range(steps):
+            if storage == "memmap":
+                euler_step_slabs(u, v, dx, D, r, dt, bc, slab)
+                u, v = v, u
+            elif scheme == "spectral":
+                u = logistic_flow(u, r, 0.5 * dt)
+                u = np.clip(spectral_diffusion(u, prop, bc), 0.0, 1.0)
+                u = logistic_flow(u, r, 0.5 * dt)
+            else:
+                laplacian_nd(u, dx, bc, out=lap)
+                _euler_update(u, lap, tmp, D, r, dt)
+
+            rec_now = n % out_every == 0
+            snap_now = n % snap_every == 0
+            if not (rec_now or snap_now):
+                continue
+            prof = profile(u)
+            if rec_now:
+                dif = prof - level
+                if np.any(dif[:-1] * dif[1:] <= 0):
+                    xf = front_position(x_prof, prof, level) if last_xf is None else \
+                        front_position_near(x_prof, prof, level, last_xf)
+                    last_xf = xf
+                    rec_t.append((n + 1) * dt)
+                    rec_xf.append(xf)
+                    # gradient-peak tracker (cross-check) on the profile
+                    rec_xg.append(float(x_prof[np.argmax(np.abs(np.gradient(prof, dxp)))]))
+                elif float(np.min(prof)) > level:
+                    break
+            if snap_now:
+                snapshot_times.append((n + 1) * dt)
+                snapshots.append(prof)
+
+        mid = tuple([slice(None), slice(None)] + [shape[a] // 2 for a in range(2, nd)])
+        final_slice = np.array(u[mid]) if nd >= 2 else np.array(u)[None, :]
+    finally:
+        if tmpdir is not None:
+            u = v = None  # drop the memmaps (if they were opened) before removing their files
+            for name in ("u.npy", "v.npy"):
+                try:
+                    os.remove(os.path.join(tmpdir, name))
+                except OSError:
+                    pass
+            os.rmdir(tmpdir)
+
+    rec_t = np.array(rec_t)
+    rec_xf = np.array(rec_xf)
+    c_th = 2.0 * math.sqrt(D * r)
+    fit = fit_front_speed(rec_t, rec_xf, rec_xg, c_th, fit_frac)
+    # radial fronts lag the planar speed by (d − 1) D / R at radius R (fit-window median)
+    # and, like any pulled front, by the Bramson term 3/(2λt) at time t (fit-window median)
+    c_th_curv = c_th_radial = c_th
+    if geometry == "radial" and rec_xf.size:
+        i0 = int(round(fit_frac[0] * rec_xf.size))
+        i1 = max(i0 + 1, int(round(fit_frac[1] * rec_xf.size)))
+        R_fit = float(np.median(rec_xf[i0:i1]))
+        t_fit = float(np.median(rec_t[i0:i1]))
+        c_th_curv = c_th - (nd - 1) * D / max(R_fit, 1e-12)
+        c_th_radial = c_th_curv - 1.5 * math.sqrt(D / r) / max(t_fit, 1e-12)
+
+    data = {
+        "x": x_prof,
+        "snapshots": snapshots,
+        "snapshot_times": snapshot_times,
+        "rec_t": rec_t,
+        "rec_xf": rec_xf,
+        "rec_xg": rec_xg,
+        "c_th": c_th,
+        "c_th_curv": c_th_curv,
+        "rel_err_curv": abs(abs(fit["c_meas"]) - c_th_curv) / (abs(c_th_curv) + 1e-12),
+        "c_th_radial": c_th_radial,
+        "rel_err_radial": abs(abs(fit["c_meas"]) - c_th_radial) / (abs(c_th_radial) + 1e-12),
+        "dx": dx,
+        "dt": dt,
+        "steps": steps,
+        "level": level,
+        "fit_frac": list(fit_frac),
+        "geometry": geometry,
+        "shape": list(shape),
+        "final_slice": final_slice,
+    }
+    data.update(fit)
+    return data
+
+
+def passes_acceptance_nd(data: dict) -> bool:
+    """passes_acceptance for planar runs; radial runs are gated on rel_err_radial instead."""
+    if data.get("geometry") != "radial":
+        return passes_acceptance(data)
+    return passes_acceptance(dict(data, rel_err=data["rel_err_radial"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N-D Fisher-KPP fronts (planar or radial) with front-speed validation.")
+    parser.add_argument("--shape", type=int, nargs="+", default=[256, 256])
+    parser.add_argument("--L", type=float, default=100.0)
+    parser.add_argument("--D", type=float, default=1.0)
+    parser.add_argument("--r", type=float, default=0.25)
+    parser.add_argument("--T", type=float, default=60.0)
+    parser.add_argument("--cfl", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--level", type=float, default=0.1)
+    parser.add_argument("--geometry", choices=("planar", "radial"), default="radial")
+    parser.add_argument("--bc", choices=("neumann", "periodic"), default="neumann")
+    parser.add_argument("--scheme", choices=("euler", "spectral"), default="euler")
+    parser.add_argument("--x0", type=float, default=None, help="planar start position (default -L/4)")
+    parser.add_argument("--R0", type=float, default=8.0, help="radial start radius")
+    parser.add_argument("--fit_start", type=float, default=0.6)
+    parser.add_argument("--fit_end", type=float, default=0.9)
+    parser.add_argument("--noise_amp", type=float, default=0.0)
+    parser.add_argument("--storage", choices=("memory", "memmap"), default="memory")
+    parser.add_argument("--scratch_dir", type=str, default=None, help="directory for memmap buffers")
+    parser.add_argument("--outdir", type=str, default=None, help="base output dir; defaults to the repository root (figures/, logs/)")
+    add_figure_args(parser)
+    args = parser.parse_args()
+
+    domain = "reaction_diffusion"
+    slug = Path(__file__).stem
+
+    original_fig_root = io_paths.FIGURES_ROOT
+    original_log_root = io_paths.LOGS_ROOT
+    if args.outdir:
+        base_outdir = Path(os.path.expandvars(args.outdir)).expanduser()
+        io_paths.FIGURES_ROOT = base_outdir / "figures"
+        io_paths.LOGS_ROOT = base_outdir / "logs"
+
+    t0 = time.time()
+    data = run_sim_nd(
+        args.shape, args.L, args.D, args.r, args.T, args.cfl, args.seed,
+        level=args.level, geometry=args.geometry, bc=args.bc, scheme=args.scheme,
+        x0=args.x0, R0=args.R0, fit_frac=(args.fit_start, args.fit_end),
+        noise_amp=args.noise_amp, storage=args.storage, scratch_dir=args.scratch_dir,
+    )
+    elapsed = time.time() - t0
+
+    passed = passes_acceptance_nd(data)
+    fig_path = io_paths.figure_path(domain, slug, failed=not passed)
+    log_path_obj = io_paths.log_path(domain, slug, failed=not passed)
+    figs = FigureService(args.figure_mode)
+    fig_out = figs.submit(fig_path, plot_and_save, data, fig_path)
+
+    params = {k: v for k, v in vars(args).items() if k not in ("outdir", "scratch_dir", "figure_mode")}
+    payload = build_payload(params, data, elapsed, passed, fig_path, log_path_obj)
+    payload["theory"] = "Fisher-KPP front speed c=2*sqrt(D*r); radial c(R, t) ~ c - (d-1) D / R - 3 / (2 sqrt(r/D) t)"
+    payload["metrics"]["c_th_curv"] = data["c_th_curv"]
+    payload["metrics"]["rel_err_curv"] = data["rel_err_curv"]
+    payload["metrics"]["c_th_radial"] = data["c_th_radial"]
+    payload["metrics"]["rel_err_radial"] = data["rel_err_radial"]
+    if not figs.renders:
+        payload["outputs"]["figure_spec"] = str(fig_out)
+    io_paths.write_log(log_path_obj, payload)
+    figs.close()
+
+    print(json.dumps({
+        "figure": str(fig_out),
+        "log": str(log_path_obj),
+        "c_meas": data["c_meas"],
+        "c_th": data["c_th"],
+        "rel_err": data["rel_err"],
+        "rel_err_curv": data["rel_err_curv"],
+        "rel_err_radial": data["rel_err_radial"],
+        "r2": data["r2"],
+        "passed": passed,
+    }, indent=2))
+
+    io_paths.FIGURES_ROOT = original_fig_root
+    io_paths.LOGS_ROOT = original_log_root
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from the author..
+See LICENSE file for full terms.
+
+Batched robust linear fits shared by the RD experiments.
+
+robust_linear_fit_batch fits y_k(t) ~ a_k t + b_k for K series at once with the same recipe
+as the per-series robust_linear_fit in rd_front_speed_experiment / rd_dispersion_experiment:
+  - moving-average smoothing (odd window, zero-padded 'same' convolution),
+  - closed-form OLS on the kept points,
+  - MAD-based outlier rejection for up to max_iter rounds (a series stops early when its mask
+    stabilizes or would keep fewer than max(5, ⌊0.2 n⌋) points),
+  - R² on the final kept points.
+Series may be ragged (NaN-padded rows with per-row lengths); non-finite samples inside a
+series are never kept.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def _moving_average(Y: np.ndarray, win: int) -> np.ndarray:
+    """Row-wise np.convolve(y, ones(win)/win, mode='same') for odd win (zero padding)."""
+    h = win // 2
+    P = np.pad(Y, ((0, 0), (h, h)))
+    return np.lib.stride_tricks.sliding_window_view(P, win, axis=1).sum(axis=-1) / win
+
+
+def robust_linear_fit_batch(
+    t: np.ndarray,
+    Y: np.ndarray,
+    lengths: Optional[np.ndarray] = None,
+    smooth_win: int = 5,
+    mad_k: float = 3.0,
+    max_iter: int = 3,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Robust linear fits for all rows of Y.
+
+    Args:
+        t: (T,) shared or (K, T) per-row sample times.
+        Y: (K, T) series.
+        lengths: optional (K,) number of leading samples belonging to each row (ragged input);
+            default T for every row.
+        smooth_win: moving-average window (made odd; skipped for rows shorter than it).
+        mad_k: rejection threshold in units of the median absolute residual.
+        max_iter: maximum OLS/rejection rounds.
+    Returns:
+        (a, r2): (K,) slopes and R² (NaN where a row has fewer than 2 usable points).
+    """
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    K, T = Y.shape
+    t = np.broadcast_to(np.asarray(t, dtype=float), (K, T))
+    n = np.full(K, T, dtype=np.int64) if lengths is None else np.asarray(lengths, dtype=np.int64)
+    inside = np.arange(T)[None, :] < n[:, None]
+
+    if smooth_win % 2 == 0:
+        smooth_win += 1
+    Y0 = np.where(inside, Y, 0.0)
+    if smooth_win > 1 and T >= smooth_win:
+        smoothed = _moving_average(Y0, smooth_win)
+        Ys = np.where((n >= smooth_win)[:, None], smoothed, Y0)
+    else:
+        Ys = Y0
+    finite = inside & np.isfinite(Ys)
+    Ys = np.where(finite, Ys, 0.0)
+
+    # centre t per row for a well-conditioned closed-form solve
+    t_ref = np.where(inside, t, 0.0).sum(axis=1) / np.maximum(n, 1)
+    tc = np.where(inside, t - t_ref[:, None], 0.0)
+
+    mask = finite.copy()
+    a = np.full(K, np.nan)
+    b = np.full(K, np.nan)
+    active = mask.sum(axis=1) >= 2
+    keep_min = np.maximum(5, (0.2 * n).astype(np.int64))
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        w = mask[active].astype(float)
+        tt, yy = tc[active], Ys[active]
+        S = w.sum(axis=1)
+        St = (w * tt).sum(axis=1)
+        Sy = (w * yy).sum(axis=1)
+        Stt = (w * tt * tt).sum(axis=1)
+        Sty = (w * tt * yy).sum(axis=1)
+        den = S * Stt - St * St
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a_new = (S * Sty - St * Sy) / den
+            b_new = (Sy - a_new * St) / S
+        a[active] = a_new
+        b[active] = b_new
+
+        resid = yy - (a_new[:, None] * tt + b_new[:, None])
+        absr = np.where(mask[active], np.abs(resid), np.nan)
+        with np.errstate(invalid="ignore"):
+            mad = np.nanmedian(absr, axis=1) + 1e-12
+        new_mask = finite[active] & (np.abs(resid) <= mad_k * mad[:, None])
+
+        rows = np.flatnonzero(active)
+        too_few = new_mask.sum(axis=1) < keep_min[rows]
+        stable = np.all(new_mask == mask[rows], axis=1)
+        advance = ~(too_few | stable)
+        mask[rows[advance]] = new_mask[advance]
+        active[rows[~advance]] = False
+
+    # Final R² on kept points
+    w = mask.astype(float)
+    S = w.sum(axis=1)
+    ok = (S >= 2) & np.isfinite(a)
+    pred = a[:, None] * tc + b[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ss_res = (w * (Ys - np.where(ok[:, None], pred, 0.0)) ** 2).sum(axis=1)
+        mean = (w * Ys).sum(axis=1) / S
+        ss_tot = (w * (Ys - mean[:, None]) ** 2).sum(axis=1) + 1e-12
+        r2 = 1.0 - ss_res / ss_tot
+    a = np.where(ok, a, np.nan)
+    r2 = np.where(ok, r2, np.nan)
+    return a, r2
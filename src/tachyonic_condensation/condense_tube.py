@@ -13,10 +13,18 @@ This module implements a minimal, numerically stable first pass of Section 6-7 i
 - Find condensate amplitudes v_ℓ by minimizing V_eff^{tube} ≈ ½ m_ℓ^2 v_ℓ^2 + ¼ N4_ℓ v_ℓ^4
 - Compute post-condensation mass matrix in the diagonal approximation M^2_ℓ ≈ m_ℓ^2 + 3 N4_ℓ v_ℓ^2
 - Scan E(R) = E_bg(R) + V_eff^{tube}(v_ℓ(R)) over R to locate minima (Bordag Fig. 5 analogue)
+- energy_scan_parallel: the same scan with R points spread over a process pool and the
+  λ-independent mode data (κ-roots and ∫ r u_ℓ^4 dr) memoized on disk, so rescans with a
+  different λ or E_bg only redo the quartic rescale N4_ℓ = 2πλ ∫ r u_ℓ^4 dr;
+  with continuation=True each worker follows the κ-roots along its contiguous slice of
+  the R grid (track_kappas) instead of bracket-scanning every radius from scratch
+- Coupled sector: the full quartic tensor N4_{ℓ1ℓ2ℓ3ℓ4} restricted to the angular selection
+  rule ℓ1+ℓ2 = ℓ3+ℓ4 (build_quartic_tensor), a Newton minimization of V_eff with analytic
+  gradient/Hessian (find_condensate_coupled) and the full mass matrix (mass_matrix_coupled)
 
 Caveats:
-- This is the "diagonal-λ" baseline: N4 couplings are approximated as diagonal in mode index.
-  Off-diagonal overlap terms N4(ℓ_i) are set to zero for simplicity/robustness.
+- The scan functions use the "diagonal-λ" baseline: N4 couplings are approximated as diagonal
+  in mode index and off-diagonal overlap terms are set to zero; the coupled functions keep them.
 - The integral for N4_ℓ uses u_ℓ(r) normalized with u_ℓ(R) = 1 from
   [fum_rt/physics/cylinder_modes.py](fum_rt/physics/cylinder_modes.py:1).
 
@@ -43,12 +51,18 @@ Date: 2025-08-09
 
 from __future__ import annotations
 
+import hashlib
+import itertools
+import os
+import tempfile
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
-from .cylinder_modes import compute_kappas, mode_functions
+from .cylinder_modes import compute_kappas, mode_functions, track_kappas
+from .mode_tables import tabulated_mode_functions
 
 
 @dataclass
@@ -59,40 +73,101 @@ class ModeEntry:
     k_out: float
 
 
+_GL_NODES = 16
+_LAGUERRE_NODES = (32, 64, 128)
+
+
+def _gauss_legendre_adaptive(
+    f: Callable[[np.ndarray], np.ndarray],
+    a: float,
+    b: float,
+    rtol: float = 1e-12,
+    max_level: int = 40,
+) -> float:
+    """
+    ∫_a^b f by adaptive composite Gauss-Legendre: a panel is accepted once its 16-point
+    rule agrees with the sum of the rules on its two halves; all open panels of a level
+    are evaluated in one vectorized call of f.
+    """
+    x, w = np.polynomial.legendre.leggauss(_GL_NODES)
+
+    def rule(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        half = 0.5 * (hi - lo)
+        r = (0.5 * (hi + lo))[:, None] + half[:, None] * x[None, :]
+        return half * (f(r.ravel()).reshape(r.shape) @ w)
+
+    lo, hi = np.array([float(a)]), np.array([float(b)])
+    coarse = rule(lo, hi)
+    total = 0.0
+    for _ in range(max_level):
+        mid = 0.5 * (lo + hi)
+        left, right = rule(lo, mid), rule(mid, hi)
+        fine = left + right
+        scale = abs(total + float(fine.sum()))
+        done = np.abs(fine - coarse) <= rtol * scale
+        total += float(fine[done].sum())
+        if done.all():
+            return total
+        keep = ~done
+        lo = np.concatenate([lo[keep], mid[keep]])
+        hi = np.concatenate([mid[keep], hi[keep]])
+        coarse = np.concatenate([left[keep], right[keep]])
+    return total + float(coarse.sum())
+
+
+def _tail_rate(R: float, g: Callable[[np.ndarray], np.ndarray]) -> float:
+    """Decay rate β = -d/dr ln g at R⁺ (one-sided difference); 1/R if g does not decay there."""
+    h = 1e-4 * R
+    g0, g1 = g(np.array([R, R + h]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = float(-(np.log(g1) - np.log(g0)) / h)
+    if not np.isfinite(beta) or beta <= 0.0:
+        beta = 1.0 / R
+    return beta
+
+
 def _radial_integral_u4(
     R: float,
-    u: Callable[[float], float],
-    r_max_factor: float = 10.0,
-    dr: float = 1e-2,
+    u: Callable,
+    rtol: float = 1e-12,
+    tail_rate: Optional[float] = None,
 ) -> float:
     """
-    Compute integral I = ∫_0^∞ r [u(r)]^4 dr by truncating at r_max = r_max_factor * R.
+    Compute integral I = ∫_0^∞ r [u(r)]^4 dr for a vectorized mode function.
+
+      - [0, R]: adaptive Gauss-Legendre (u = I_ℓ branch, sharply peaked at R for large k_in R)
+      - [R, ∞): Gauss-Laguerre in t = β (r - R), i.e. ∫ e^{-t} [e^{t} r u^4] dt / β, with β the
+        decay rate of r u^4 just outside R; the node count is doubled (32 → 128) until two
+        rules agree to rtol
 
     Args:
       R: tube radius (sets normalization u(R) = 1 from mode_functions)
-      u: callable radial mode function u(r)
-      r_max_factor: how many radii to integrate outwards (default 10)
-      dr: radial step
+      u: radial mode function accepting arrays (mode_functions(...)['u'])
+      rtol: relative tolerance of both pieces
+      tail_rate: β override; default -d/dr ln(r u^4) at R⁺, estimated from u
 
     Returns:
-      I ~ ∫_0^{r_max} r u(r)^4 dr (float)
+      I (float)
     """
-    r_max = max(R * float(r_max_factor), 5.0 * R)
-    if r_max <= 0.0:
+    if R <= 0.0:
         return 0.0
-    # Create grid including R and up to r_max
-    n_steps = max(10, int(np.ceil(r_max / dr)))
-    rs = np.linspace(0.0, r_max, n_steps, dtype=np.float64)
-    vals = []
-    for r in rs:
-        try:
-            val = float(u(float(r)))
-            vals.append((r * (val ** 4)))
-        except Exception:
-            vals.append(0.0)
-    vals = np.asarray(vals, dtype=np.float64)
-    I = float(np.trapz(vals, rs))
-    return I
+
+    def g(r: np.ndarray) -> np.ndarray:
+        return r * np.asarray(u(r), dtype=np.float64) ** 4
+
+    inner = _gauss_legendre_adaptive(g, 0.0, R, rtol=rtol)
+
+    beta = _tail_rate(R, g) if tail_rate is None else float(tail_rate)
+    tail = float("nan")
+    for n in _LAGUERRE_NODES:
+        t, w = np.polynomial.laguerre.laggauss(n)
+        with np.errstate(over="ignore", invalid="ignore"):
+            est = float(np.sum(w * np.exp(t) * g(R + t / beta)) / beta)
+        if abs(est - tail) <= rtol * abs(inner + est):
+            tail = est
+            break
+        tail = est
+    return float(inner + tail)
 
 
 def build_quartic_diagonal(
@@ -113,16 +188,37 @@ def build_quartic_diagonal(
     Returns:
       mapping ell -> N4_ell (float >= 0)
     """
-    N4: Dict[int, float] = {}
+    return quartic_from_integrals(quartic_unit_integrals(R, modes), lam)
+
+
+def _mode_u(R: float, m: ModeEntry, tabulated: bool = False) -> Callable:
+    """Vectorized u_ℓ(r) of a mode, direct or from the cached Chebyshev table."""
+    root = {"ell": float(m.ell), "k_in": m.k_in, "k_out": m.k_out}
+    return (tabulated_mode_functions if tabulated else mode_functions)(R, root)["u"]
+
+
+def quartic_unit_integrals(R: float, modes: Sequence[ModeEntry], tabulated: bool = False) -> Dict[int, float]:
+    """
+    λ-independent part of the diagonal quartic couplings: ℓ -> ∫ r u_ℓ^4 dr.
+    tabulated=True evaluates u_ℓ from the cached mode tables (cheap on repeated calls).
+    """
+    I4: Dict[int, float] = {}
     for m in modes:
-        fns = mode_functions(R=R, root={"ell": float(m.ell), "k_in": m.k_in, "k_out": m.k_out})
-        u = fns["u"]
-        I = _radial_integral_u4(R, u)  # ∫ r u^4 dr
+        I4[int(m.ell)] = _radial_integral_u4(R, _mode_u(R, m, tabulated))  # ∫ r u^4 dr
+    return I4
+
+
+def quartic_from_integrals(I4: Dict[int, float], lam: float) -> Dict[int, float]:
+    """
+    Rescale unit integrals to N4_ℓ = (2π) λ ∫ r u_ℓ^4 dr (N4 is linear in λ).
+    """
+    N4: Dict[int, float] = {}
+    for ell, I in I4.items():
         N4_ell = float(2.0 * np.pi * lam * I)
         # numerical guard
         if not np.isfinite(N4_ell) or N4_ell < 0.0:
             N4_ell = 0.0
-        N4[int(m.ell)] = N4_ell
+        N4[int(ell)] = N4_ell
     return N4
 
 
@@ -219,6 +315,7 @@ def compute_modes_for_R(
     mu: float,
     c: float = 1.0,
     ell_max: int = 8,
+    tol: float = 1e-8,
 ) -> List[ModeEntry]:
     """
     Helper: compute ModeEntry list at fixed R using the cylinder solver.
@@ -226,7 +323,12 @@ def compute_modes_for_R(
     Returns:
       list of ModeEntry for ℓ = 0..ell_max, keeping the lowest κ-root per ℓ (if any).
     """
-    roots = compute_kappas(R=R, mu=mu, c=c, ell_max=ell_max, num_brackets=256)
+    roots = compute_kappas(R=R, mu=mu, c=c, ell_max=ell_max, num_brackets=256, tol=tol)
+    return lowest_modes(roots)
+
+
+def lowest_modes(roots: Sequence[Dict[str, float]]) -> List[ModeEntry]:
+    """ModeEntry per ℓ from compute_kappas roots, keeping the lowest κ-root of each ℓ."""
     # Option: pick at most one mode per ℓ (lowest κ)
     buckets: Dict[int, List[Dict[str, float]]] = {}
     for r in roots:
@@ -290,4 +392,488 @@ def energy_scan(
     if not np.any(mask):
         return {"R": Rs, "E": Es, "min_R": float("nan"), "min_E": float("nan")}
     idx = int(np.nanargmin(Es))
-    return {"R": Rs, "E": Es, "min_R": float(Rs[idx]), "min_E": float(Es[idx])}
\ No newline at end of file
+    return {"R": Rs, "E": Es, "min_R": float(Rs[idx]), "min_E": float(Es[idx])}
+
+
+# ---------------------------------------------------------------------------
+# Parallel, disk-memoized scan engine
+# ---------------------------------------------------------------------------
+
+MODE_CACHE_VERSION = 2
+MODE_SOLVERS = ("scan", "track")
+
+
+def mode_cache_path(
+    cache_dir, R: float, mu: float, c: float, ell_max: int, tol: float, solver: str = "scan"
+) -> Path:
+    """
+    Cache file for the mode data at one R, keyed exactly by (R, μ, c, ell_max, tol) and the
+    root solver: "scan" for independent compute_kappas solves, "track" for continuation roots.
+    """
+    if solver not in MODE_SOLVERS:
+        raise ValueError(f"solver must be one of {MODE_SOLVERS}, got {solver!r}")
+    key = "|".join([str(MODE_CACHE_VERSION), float(R).hex(), float(mu).hex(), float(c).hex(),
+                    str(int(ell_max)), float(tol).hex(), solver])
+    digest = hashlib.sha1(key.encode("ascii")).hexdigest()[:20]
+    return Path(cache_dir) / f"tube_modes_{digest}.npz"
+
+
+def _load_mode_data(path: Path) -> Optional[Dict[str, np.ndarray]]:
+    try:
+        with np.load(path) as z:
+            return {k: z[k] for k in z.files}
+    except Exception:
+        return None
+
+
+def _save_mode_data(path: Path, data: Dict[str, np.ndarray]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".npz.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **data)
+        os.replace(tmp, path)  # atomic, so concurrent scans never read a partial file
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def mode_data_for_R(
+    R: float,
+    mu: float,
+    c: float = 1.0,
+    ell_max: int = 8,
+    tol: float = 1e-8,
+    cache_dir=None,
+) -> Optional[Dict[str, np.ndarray]]:
+    """
+    λ-independent data for one radius: every κ-root from compute_kappas plus the lowest
+    mode per ℓ with its unit quartic integral ∫ r u_ℓ^4 dr.
+
+    Args:
+      R, mu, c, ell_max, tol: as in compute_modes_for_R
+      cache_dir: optional directory for the on-disk memo (read first, written after a miss)
+
+    Returns:
+      dict of arrays {'roots_ell', 'roots_kappa', 'roots_k_in', 'roots_k_out',
+                      'ell', 'kappa', 'k_in', 'k_out', 'I4'}, or None if the solve failed.
+    """
+    path = mode_cache_path(cache_dir, R, mu, c, ell_max, tol) if cache_dir is not None else None
+    if path is not None and path.is_file():
+        data = _load_mode_data(path)
+        if data is not None:
+            return data
+    try:
+        roots = compute_kappas(R=R, mu=mu, c=c, ell_max=ell_max, num_brackets=256, tol=tol)
+        data = _mode_data_from_roots(R, roots)
+    except Exception:
+        return None
+    if path is not None:
+        _save_mode_data(path, data)
+    return data
+
+
+def _mode_data_from_roots(R: float, roots: Sequence[Dict[str, float]]) -> Dict[str, np.ndarray]:
+    """mode_data_for_R arrays from compute_kappas-format roots."""
+    modes = lowest_modes(roots)
+    I4 = quartic_unit_integrals(R, modes)
+    return {
+        "roots_ell": np.array([r["ell"] for r in roots], dtype=np.float64),
+        "roots_kappa": np.array([r["kappa"] for r in roots], dtype=np.float64),
+        "roots_k_in": np.array([r["k_in"] for r in roots], dtype=np.float64),
+        "roots_k_out": np.array([r["k_out"] for r in roots], dtype=np.float64),
+        "ell": np.array([m.ell for m in modes], dtype=np.int64),
+        "kappa": np.array([m.kappa for m in modes], dtype=np.float64),
+        "k_in": np.array([m.k_in for m in modes], dtype=np.float64),
+        "k_out": np.array([m.k_out for m in modes], dtype=np.float64),
+        "I4": np.array([I4[m.ell] for m in modes], dtype=np.float64),
+    }
+
+
+def _mode_data_task(args: Tuple) -> Optional[Dict[str, np.ndarray]]:
+    return mode_data_for_R(*args)
+
+
+def _tracked_mode_data_task(args: Tuple) -> List[Optional[Dict[str, np.ndarray]]]:
+    """Mode data for an ordered slice of radii, κ-roots followed by continuation."""
+    Rs, mu, c, ell_max, tol, cache_dir = args
+    try:
+        tracked = track_kappas(Rs, mu, c=c, ell_max=ell_max, num_brackets=256, tol=tol)
+    except Exception:
+        # continuation failed as a whole: solve each radius independently
+        return [mode_data_for_R(R, mu, c, ell_max, tol, cache_dir) for R in Rs]
+    out: List[Optional[Dict[str, np.ndarray]]] = []
+    for R, roots in zip(Rs, tracked):
+        try:
+            data = _mode_data_from_roots(R, roots)
+        except Exception:
+            out.append(None)
+            continue
+        if cache_dir is not None:
+            _save_mode_data(mode_cache_path(cache_dir, R, mu, c, ell_max, tol, solver="track"), data)
+        out.append(data)
+    return out
+
+
+def mode_data_table(
+    R_grid: Sequence[float],
+    mu: float,
+    c: float = 1.0,
+    ell_max: int = 8,
+    tol: float = 1e-8,
+    workers: Optional[int] = None,
+    cache_dir=None,
+    continuation: bool = False,
+) -> List[Optional[Dict[str, np.ndarray]]]:
+    """
+    mode_data_for_R over R_grid (same order). Cached radii are read in-process; the
+    remaining ones are distributed over a process pool of `workers` (default: all CPUs).
+
+    With continuation=True the uncached radii are split into one contiguous slice per
+    worker and each slice is solved with track_kappas (pass a monotone R_grid). Tracked
+    roots are cached under their own key, so they never stand in for independent solves;
+    a continuation scan still reuses cached independent solves.
+    """
+    Rs = [float(R) for R in np.asarray(R_grid, dtype=np.float64)]
+    table: List[Optional[Dict[str, np.ndarray]]] = [None] * len(Rs)
+    todo = []
+    solvers = ("scan", "track") if continuation else ("scan",)
+    for i, R in enumerate(Rs):
+        data = None
+        for solver in solvers if cache_dir is not None else ():
+            path = mode_cache_path(cache_dir, R, mu, c, ell_max, tol, solver=solver)
+            data = _load_mode_data(path) if path.is_file() else None
+            if data is not None:
+                break
+        if data is None:
+            todo.append(i)
+        else:
+            table[i] = data
+    if not todo:
+        return table
+
+    workers = (os.cpu_count() or 1) if workers is None else int(workers)
+    if continuation:
+        slices = [s for s in np.array_split(np.asarray(todo), max(1, min(workers, len(todo)))) if s.size]
+        tasks = [([Rs[i] for i in s], mu, c, ell_max, tol, cache_dir) for s in slices]
+        if len(tasks) == 1:
+            results = _tracked_mode_data_task(tasks[0])
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+                results = [d for part in pool.map(_tracked_mode_data_task, tasks) for d in part]
+        for i, data in zip(todo, results):
+            table[i] = data
+        return table
+
+    tasks = [(Rs[i], mu, c, ell_max, tol, cache_dir) for i in todo]
+    if workers <= 1 or len(tasks) == 1:
+        results = [_mode_data_task(t) for t in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            chunk = max(1, len(tasks) // (4 * workers))
+            results = list(pool.map(_mode_data_task, tasks, chunksize=chunk))
+    for i, data in zip(todo, results):
+        table[i] = data
+    return table
+
+
+def energy_from_mode_data(
+    R: float,
+    data: Optional[Dict[str, np.ndarray]],
+    lam: float,
+    c: float = 1.0,
+    E_bg: Optional[Callable[[float], float]] = None,
+) -> float:
+    """E(R) from cached mode data: the quartic rescale plus the diagonal condensate energy."""
+    if data is None or data["ell"].size == 0:
+        return float("nan")
+    modes = [
+        ModeEntry(ell=int(ell), kappa=float(kappa), k_in=float(k_in), k_out=float(k_out))
+        for ell, kappa, k_in, k_out in zip(data["ell"], data["kappa"], data["k_in"], data["k_out"])
+    ]
+    N4 = quartic_from_integrals({int(ell): float(I) for ell, I in zip(data["ell"], data["I4"])}, lam)
+    v = find_condensate_diagonal(R=R, modes=modes, N4=N4, c=c)
+    return tube_energy_diagonal(modes=modes, N4=N4, v=v, c=c, E_bg=E_bg, R=R)
+
+
+def energy_scan_parallel(
+    R_grid: Sequence[float],
+    mu: float,
+    lam: float,
+    c: float = 1.0,
+    ell_max: int = 8,
+    E_bg: Optional[Callable[[float], float]] = None,
+    tol: float = 1e-8,
+    workers: Optional[int] = None,
+    cache_dir=None,
+    continuation: bool = False,
+) -> Dict[str, np.ndarray]:
+    """
+    energy_scan with the per-R mode solves run in a process pool and memoized on disk.
+
+    Args:
+      R_grid, mu, lam, c, ell_max, E_bg: as in energy_scan (E_bg is evaluated in-process,
+        so it may be any callable)
+      tol: κ-root tolerance (part of the cache key)
+      workers: pool size (default: all CPUs; ≤ 1 runs in-process)
+      cache_dir: directory for the mode memo; None disables it
+      continuation: follow κ-roots along R (track_kappas) instead of rescanning each radius
+
+    Returns:
+      dict { 'R': np.array, 'E': np.array, 'min_R': float, 'min_E': float }
+    """
+    Rs = np.asarray(R_grid, dtype=np.float64)
+    table = mode_data_table(Rs, mu, c=c, ell_max=ell_max, tol=tol, workers=workers, cache_dir=cache_dir,
+                            continuation=continuation)
+    Es = np.full_like(Rs, np.nan, dtype=np.float64)
+    for i, (R, data) in enumerate(zip(Rs, table)):
+        try:
+            Es[i] = energy_from_mode_data(float(R), data, lam, c=c, E_bg=E_bg)
+        except Exception:
+            Es[i] = np.nan
+    mask = np.isfinite(Es)
+    if not np.any(mask):
+        return {"R": Rs, "E": Es, "min_R": float("nan"), "min_E": float("nan")}
+    idx = int(np.nanargmin(Es))
+    return {"R": Rs, "E": Es, "min_R": float(Rs[idx]), "min_E": float(Es[idx])}
+
+
+# ---------------------------------------------------------------------------
+# Coupled (non-diagonal) quartic sector
+# ---------------------------------------------------------------------------
+#
+# With φ(r, θ) = Σ_ℓ v_ℓ u_ℓ(r) e^{iℓθ} the projection of (λ/4)|φ|^4 is
+#   V_4 = ¼ Σ N4_{abcd} v_a v_b v_c v_d,  N4_{abcd} = 2πλ ∫ r u_a u_b u_c u_d dr · [ℓ_a+ℓ_b = ℓ_c+ℓ_d],
+# since ∫ dθ e^{i(ℓ_a+ℓ_b-ℓ_c-ℓ_d)θ} = 2π δ. The diagonal baseline keeps only a=b=c=d.
+# The tensor is stored fully symmetrized (average over the three pairings of abcd), so
+#   ∇V = m² v + N4·vvv,   ∇²V = diag(m²) + 3 N4·vv,
+# and the Hessian at the minimum is the post-condensation mass matrix.
+
+_PANEL_LEVELS_MAX = 40
+_EPS_SOLVER = 1e-300
+
+
+def _shared_radial_nodes(R: float, us: Sequence[Callable]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One radial quadrature grid (nodes r, weights w·r) for every product u_a u_b u_c u_d.
+
+    Composite 16-point Gauss-Legendre on panels graded geometrically towards r = R from
+    both sides: inside down to a width ~1/β_max, outside from 1/β_max out to 40/β_min,
+    where β are the decay rates of r u_ℓ^4 just outside R (so the slowest product has
+    decayed by e^{-40} at the cut-off).
+    """
+    rates = np.array([_tail_rate(R, lambda r, u=u: r * np.asarray(u(r), dtype=np.float64) ** 4)
+                      for u in us])
+    beta_min, beta_max = float(rates.min()), float(rates.max())
+    levels_in = int(np.clip(np.ceil(np.log2(max(1.0, R * beta_max))) + 2, 2, _PANEL_LEVELS_MAX))
+    edges_in = np.concatenate([[0.0], R * (1.0 - 0.5 ** np.arange(1, levels_in + 1)), [R]])
+    levels_out = int(np.clip(np.ceil(np.log2(40.0 * beta_max / beta_min)) + 1, 1, _PANEL_LEVELS_MAX))
+    edges_out = R + np.concatenate([[0.0], 2.0 ** np.arange(levels_out) / beta_max])
+    edges = np.concatenate([edges_in, edges_out[1:]])
+
+    x, w = np.polynomial.legendre.leggauss(_GL_NODES)
+    lo, hi = edges[:-1], edges[1:]
+    half = 0.5 * (hi - lo)
+    r = ((0.5 * (hi + lo))[:, None] + half[:, None] * x[None, :]).ravel()
+    weights = (half[:, None] * w[None, :]).ravel() * r
+    return r, weights
+
+
+def quartic_unit_tensor(R: float, modes: Sequence[ModeEntry], tabulated: bool = False) -> np.ndarray:
+    """
+    λ-independent quartic tensor T_{abcd} = ∫ r u_a u_b u_c u_d dr · w_{abcd} over the modes
+    (in the given order), with w_{abcd} the fraction of the pairings (ab|cd), (ac|bd), (ad|bc)
+    obeying the angular selection rule ℓ1 + ℓ2 = ℓ3 + ℓ4. Only allowed entries are integrated:
+    one quadruple per multiset {a ≤ b ≤ c ≤ d}, all on a shared radial grid.
+    tabulated=True evaluates the modes from the cached Chebyshev tables.
+
+    Returns:
+      (M, M, M, M) fully symmetric array; T_{aaaa} = ∫ r u_a^4 dr
+    """
+    M = len(modes)
+    T = np.zeros((M, M, M, M), dtype=np.float64)
+    if M == 0:
+        return T
+    us = [_mode_u(R, m, tabulated) for m in modes]
+    r, w = _shared_radial_nodes(R, us)
+    U = np.stack([np.asarray(u(r), dtype=np.float64) for u in us])  # (M, Q)
+
+    ells = np.array([int(m.ell) for m in modes], dtype=np.int64)
+    quad = np.array(list(itertools.combinations_with_replacement(range(M), 4)), dtype=np.int64)
+    la, lb, lc, ld = (ells[quad[:, k]] for k in range(4))
+    weight = ((la + lb == lc + ld).astype(np.float64) + (la + lc == lb + ld) + (la + ld == lb + lc)) / 3.0
+    allowed = weight > 0.0
+    quad, weight = quad[allowed], weight[allowed]
+
+    vals = (U[quad[:, 0]] * U[quad[:, 1]] * U[quad[:, 2]] * U[quad[:, 3]]) @ w * weight
+    for perm in set(itertools.permutations(range(4))):
+        T[tuple(quad[:, k] for k in perm)] = vals
+    return T
+
+
+def build_quartic_tensor(
+    R: float,
+    modes: Sequence[ModeEntry],
+    lam: float,
+    c: float,
+) -> np.ndarray:
+    """
+    Full quartic coupling tensor N4_{abcd} = (2π) λ T_{abcd} (see quartic_unit_tensor).
+
+    Args:
+      R: radius
+      modes: list of ModeEntry; tensor axes follow this order
+      lam: quartic λ > 0
+      c: wave speed
+
+    Returns:
+      (M, M, M, M) symmetric array whose diagonal N4_{ℓℓℓℓ} is build_quartic_diagonal's N4_ℓ
+    """
+    N4 = 2.0 * np.pi * lam * quartic_unit_tensor(R, modes)
+    N4[~np.isfinite(N4)] = 0.0
+    return N4
+
+
+def quartic_potential(
+    v: np.ndarray,
+    m2: np.ndarray,
+    N4: np.ndarray,
+) -> Tuple[float, np.ndarray, np.ndarray]:
+    """
+    V(v) = ½ Σ m_a^2 v_a^2 + ¼ N4·vvvv with its analytic gradient and Hessian.
+
+    Returns:
+      (V, ∇V, ∇²V)
+    """
+    Nv = N4 @ v            # (M, M, M)
+    Nvv = Nv @ v           # (M, M)
+    Nvvv = Nvv @ v         # (M,)
+    V = 0.5 * float(np.dot(m2, v * v)) + 0.25 * float(np.dot(Nvvv, v))
+    grad = m2 * v + Nvvv
+    hess = np.diag(m2) + 3.0 * Nvv
+    return V, grad, hess
+
+
+def find_condensate_coupled(
+    modes: Sequence[ModeEntry],
+    N4: np.ndarray,
+    c: float,
+    v0: Optional[np.ndarray] = None,
+    tol: float = 1e-10,
+    max_iter: int = 200,
+) -> Dict[str, object]:
+    """
+    Minimize V_eff(v) = ½ Σ m_ℓ^2 v_ℓ^2 + ¼ N4·vvvv with the full tensor by damped Newton.
+
+    Steps use the Hessian with its eigenvalues replaced by max(|h|, δ) (descent even where
+    V is not convex) and an Armijo backtracking line search on V. A stationary point with a
+    negative Hessian eigenvalue (e.g. v = 0 with tachyonic modes) is left along that
+    eigenvector, so the result is a local minimum.
+
+    Args:
+      modes: list of ModeEntry (order of the tensor axes)
+      N4: (M, M, M, M) tensor from build_quartic_tensor
+      c: wave speed (m_ℓ^2 = - c^2 κ_ℓ^2)
+      v0: start (default: the diagonal-baseline amplitudes)
+      tol: convergence threshold on max |∇V|
+      max_iter: Newton iteration cap
+
+    Returns:
+      dict { 'ell': (M,) ints, 'v': (M,) amplitudes, 'V': float, 'grad_norm': float,
+             'iterations': int, 'converged': bool }
+    """
+    ells = np.array([int(m.ell) for m in modes], dtype=np.int64)
+    m2 = -(c ** 2) * np.array([m.kappa for m in modes], dtype=np.float64) ** 2
+    if v0 is None:
+        diag = np.einsum("aaaa->a", N4)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v = np.where((diag > 0.0) & (m2 < 0.0), np.sqrt(np.maximum(0.0, -m2 / diag)), 0.0)
+    else:
+        v = np.array(v0, dtype=np.float64)
+
+    V, grad, hess = quartic_potential(v, m2, N4)
+    converged = False
+    it = 0
+    for it in range(1, max_iter + 1):
+        h, Q = np.linalg.eigh(hess)
+        gnorm = float(np.max(np.abs(grad))) if grad.size else 0.0
+        if gnorm <= tol:
+            if h.size == 0 or h[0] >= -tol:
+                converged = True
+                break
+            # saddle: descend along the most negative curvature direction
+            step = Q[:, 0] * np.sqrt(-h[0] / max(float(np.max(np.abs(N4))), _EPS_SOLVER))
+        else:
+            delta = max(1e-8 * float(np.max(np.abs(h))), _EPS_SOLVER)
+            step = -Q @ ((Q.T @ grad) / np.maximum(np.abs(h), delta))
+        slope = float(np.dot(grad, step))
+        t = 1.0
+        while True:
+            v_new = v + t * step
+            V_new, g_new, h_new = quartic_potential(v_new, m2, N4)
+            if V_new <= V + 1e-4 * t * min(slope, 0.0) or t < 1e-12:
+                break
+            t *= 0.5
+        v, V, grad, hess = v_new, V_new, g_new, h_new
+    return {
+        "ell": ells,
+        "v": v,
+        "V": float(V),
+        "grad_norm": float(np.max(np.abs(grad))) if grad.size else 0.0,
+        "iterations": int(it),
+        "converged": bool(converged),
+    }
+
+
+def mass_matrix_coupled(
+    modes: Sequence[ModeEntry],
+    N4: np.ndarray,
+    v: np.ndarray,
+    c: float,
+) -> np.ndarray:
+    """
+    Post-condensation mass matrix with the full tensor (the Hessian of V_eff at v):
+      M^2_{ab} = m_a^2 δ_ab + 3 Σ_cd N4_{abcd} v_c v_d.
+
+    Returns:
+      (M, M) symmetric array; with diagonal N4 its diagonal is mass_matrix_diagonal's M2_ℓ
+    """
+    m2 = -(c ** 2) * np.array([m.kappa for m in modes], dtype=np.float64) ** 2
+    return quartic_potential(np.asarray(v, dtype=np.float64), m2, N4)[2]
+
+
+def condense_coupled_for_R(
+    R: float,
+    mu: float,
+    lam: float,
+    c: float = 1.0,
+    ell_max: int = 8,
+    E_bg: Optional[Callable[[float], float]] = None,
+    tol: float = 1e-8,
+) -> Optional[Dict[str, object]]:
+    """
+    Coupled condensation at one radius: modes → full N4 tensor → Newton minimum → mass matrix.
+
+    Returns:
+      None if no tachyonic modes were found, else the find_condensate_coupled dict plus
+      { 'N4': tensor, 'M2': mass matrix, 'M2_eigs': its eigenvalues, 'E': E_bg(R) + V }
+    """
+    modes = compute_modes_for_R(R=R, mu=mu, c=c, ell_max=ell_max, tol=tol)
+    if not modes:
+        return None
+    N4 = build_quartic_tensor(R, modes, lam, c)
+    sol = find_condensate_coupled(modes, N4, c)
+    M2 = mass_matrix_coupled(modes, N4, sol["v"], c)
+    E = float(sol["V"])
+    if E_bg is not None:
+        try:
+            E += float(E_bg(float(R)))
+        except Exception:
+            pass
+    sol.update({"N4": N4, "M2": M2, "M2_eigs": np.linalg.eigvalsh(M2), "E": E})
+    return sol
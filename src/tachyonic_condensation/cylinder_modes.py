@@ -34,8 +34,17 @@ APIs:
 - compute_kappas(R, mu, c=1.0, ell_max=12, kappa_max=None, num_brackets=512, tol=1e-8)
     Returns a list of dicts { 'ell', 'kappa', 'k_in', 'k_out' }.
 
+- track_kappas(R_grid, mu, c=1.0, ell_max=12, ...)
+    compute_kappas along an R grid by continuation (one batched secular evaluation per R
+    for all brackets, vectorised bisection, full bracket scans only when a root is lost
+    or appears).
+
+- secular_values(kappa, ells, R, mu, c)
+    Secular function on a whole (ℓ, κ) grid (scaled Bessels ive/kve, one ufunc call per family).
+
 - mode_functions(R, root)
-    Returns a dict with 'u_in(r)', 'u_out(r)', and 'u(r)' callables normalized so u(R) = 1.
+    Returns a dict with 'u_in(r)', 'u_out(r)', and 'u(r)' callables normalized so u(R) = 1;
+    they accept scalars or arrays.
 
 References:
 - [derivation/finite_tube_mode_analysis.md](derivation/finite_tube_mode_analysis.md:1)
@@ -48,124 +57,171 @@ Date: 2025-08-09
 
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Optional, Tuple
+import math
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
-try:
-    from scipy import optimize, special
-    _HAVE_SCIPY = True
-except Exception:
-    _HAVE_SCIPY = False
-    special = None
-    optimize = None
-
-
 _EPS = 1e-14
 
 
-def _iv(nu: int, x: float) -> float:
-    if not _HAVE_SCIPY:
-        raise RuntimeError("scipy is required for cylinder_modes")
-    return float(special.iv(nu, x))
+@lru_cache(maxsize=None)
+def _scipy():
+    """(scipy.optimize, scipy.special), imported on first use so importing this module stays cheap."""
+    try:
+        from scipy import optimize, special
+    except Exception as exc:
+        raise RuntimeError("scipy is required for cylinder_modes") from exc
+    return optimize, special
 
 
-def _kv(nu: int, x: float) -> float:
-    if not _HAVE_SCIPY:
-        raise RuntimeError("scipy is required for cylinder_modes")
-    return float(special.kv(nu, x))
+def secular_values(
+    kappa,
+    ells,
+    R: float,
+    mu: float,
+    c: float,
+) -> np.ndarray:
+    """
+    Secular function f_ℓ(κ) on a whole (ℓ, κ) grid:
+        f(κ) = (κ_in/κ_out) * (I'_ℓ / I_ℓ)(κ_in R) + (K'_ℓ / K_ℓ)(κ_out R)
 
+    The log-derivatives use the recurrences
+        I'_ℓ/I_ℓ = (I_{ℓ-1} + I_{ℓ+1}) / (2 I_ℓ),   K'_ℓ/K_ℓ = -(K_{ℓ-1} + K_{ℓ+1}) / (2 K_ℓ)
+    on exponentially scaled Bessels (ive/kve), whose scale factors cancel in each ratio, so
+    the values stay finite where I_ℓ would overflow. A single ive and a single kve call cover
+    the orders ℓ-1..ℓ+1 of every requested ℓ. Where the unscaled I_ℓ or K_ℓ falls below 1e-14
+    the historical ±1e6 surrogate is kept, so roots match the previous pointwise evaluator.
 
-def _ivp(nu: int, x: float) -> float:
+    Args:
+      kappa: κ values, shape (K,)
+      ells: angular momenta ℓ ≥ 0, shape (L,)
+      R, mu, c: radius, tachyon scale, wave speed
+
+    Returns:
+      (L, K) array; NaN where κ ≤ 0, κ_in^2 ≤ 0, a parameter is non-positive, or |f| > 1e12.
     """
-    Derivative d/dx I_ν(x). Prefer special.ivp if available; otherwise use
-    the stable relation d/dx I_ν = (I_{ν-1} + I_{ν+1})/2.
+    _, special = _scipy()
+    kappa = np.atleast_1d(np.asarray(kappa, dtype=np.float64))
+    ells = np.atleast_1d(np.asarray(ells, dtype=np.int64))
+    out = np.full((ells.size, kappa.size), np.nan)
+    if ells.size == 0 or R <= 0.0 or mu <= 0.0 or c <= 0.0:
+        return out
+    q2 = (mu / c) ** 2
+    k_in2 = q2 - kappa ** 2
+    ok = (kappa > 0.0) & (k_in2 > 0.0)
+    if not np.any(ok):
+        return out
+    k_in = np.sqrt(k_in2[ok])
+    k_out = np.sqrt(kappa[ok] ** 2 + 2.0 * q2)
+    x_in = np.maximum(k_in * R, _EPS)
+    x_out = np.maximum(k_out * R, _EPS)
+
+    orders = np.arange(int(ells.min()) - 1, int(ells.max()) + 2)
+    Ie = special.ive(orders[:, None], x_in[None, :])
+    Ke = special.kve(orders[:, None], x_out[None, :])
+    j = ells - orders[0]
+    out[:, ok] = _secular_combine(k_in, k_out, x_in, x_out,
+                                  Ie[j - 1], Ie[j], Ie[j + 1], Ke[j - 1], Ke[j], Ke[j + 1])
+    return out
+
+
+def _secular_pairs(kappa: np.ndarray, ells: np.ndarray, R, mu: float, c: float) -> np.ndarray:
     """
-    if not _HAVE_SCIPY:
-        raise RuntimeError("scipy is required for cylinder_modes")
-    if hasattr(special, "ivp"):
-        return float(special.ivp(nu, x))
-    # Fallback for older scipy: symmetric finite-difference via recurrence
-    return 0.5 * (special.iv(nu - 1, x) + special.iv(nu + 1, x))
-
-
-def _kvp(nu: int, x: float) -> float:
+    f_ℓ(κ) at the paired points (ells[i], kappa[i]) rather than on their grid, with R a scalar
+    or one radius per point; same arithmetic and guards as secular_values. Lets track_kappas
+    evaluate every bracket of a radius (or of a whole R grid) in one call.
     """
-    Derivative d/dx K_ν(x). Prefer special.kvp; otherwise use
-    d/dx K_ν = - (K_{ν-1} + K_{ν+1})/2.
+    _, special = _scipy()
+    kappa = np.asarray(kappa, dtype=np.float64)
+    ells = np.asarray(ells, dtype=np.int64)
+    R = np.broadcast_to(np.asarray(R, dtype=np.float64), kappa.shape)
+    out = np.full(kappa.shape, np.nan)
+    if kappa.size == 0 or mu <= 0.0 or c <= 0.0:
+        return out
+    q2 = (mu / c) ** 2
+    k_in2 = q2 - kappa ** 2
+    ok = (kappa > 0.0) & (k_in2 > 0.0) & (R > 0.0)
+    if not np.any(ok):
+        return out
+    k_in = np.sqrt(k_in2[ok])
+    k_out = np.sqrt(kappa[ok] ** 2 + 2.0 * q2)
+    x_in = np.maximum(k_in * R[ok], _EPS)
+    x_out = np.maximum(k_out * R[ok], _EPS)
+    orders = ells[ok][None, :] + np.arange(-1, 2)[:, None]
+    Ie = special.ive(orders, x_in[None, :])
+    Ke = special.kve(orders, x_out[None, :])
+    out[ok] = _secular_combine(k_in, k_out, x_in, x_out, Ie[0], Ie[1], Ie[2], Ke[0], Ke[1], Ke[2])
+    return out
+
+
+def _secular_combine(k_in, k_out, x_in, x_out, I_m, I_0, I_p, K_m, K_0, K_p) -> np.ndarray:
     """
-    if not _HAVE_SCIPY:
-        raise RuntimeError("scipy is required for cylinder_modes")
-    if hasattr(special, "kvp"):
-        return float(special.kvp(nu, x))
-    return -0.5 * (special.kv(nu - 1, x) + special.kv(nu + 1, x))
-
-
-def _dlnI(nu: int, x: float) -> float:
-    """Compute (I'_ν / I_ν)(x) with basic guarding."""
-    x = float(max(x, _EPS))
-    Iv = _iv(nu, x)
-    if abs(Iv) < _EPS:
-        return np.sign(_ivp(nu, x)) * 1e6  # large magnitude surrogate
-    return _ivp(nu, x) / Iv
-
-
-def _dlnK(nu: int, x: float) -> float:
-    """Compute (K'_ν / K_ν)(x) with basic guarding."""
-    x = float(max(x, _EPS))
-    Kv = _kv(nu, x)
-    if abs(Kv) < _EPS:
-        return -np.sign(_kvp(nu, x)) * 1e6  # large magnitude surrogate (note K decays)
-    return _kvp(nu, x) / Kv
+    f from scaled Bessels of orders ℓ-1, ℓ, ℓ+1 (k_in, k_out, x_in, x_out broadcast along the
+    last axis), with the small-Bessel surrogate and the |f| > 1e12 guard.
+    """
+    dI = I_m + I_p   # ∝ 2 I'_ℓ
+    dK = -(K_m + K_p)  # ∝ 2 K'_ℓ
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        dlnI = dI / (2.0 * I_0)
+        dlnK = dK / (2.0 * K_0)
+        # Same guard as the scalar path: where the unscaled I_ℓ or K_ℓ drops below _EPS
+        # the log-derivative is replaced by a large-magnitude surrogate
+        log_eps = np.log(_EPS)
+        tiny_I = np.log(np.abs(I_0)) + x_in < log_eps
+        tiny_K = np.log(np.abs(K_0)) - x_out < log_eps
+    dlnI = np.where(tiny_I, np.sign(dI) * 1e6, dlnI)
+    dlnK = np.where(tiny_K, -np.sign(dK) * 1e6, dlnK)
+    with np.errstate(invalid="ignore", over="ignore"):
+        val = (k_in / k_out) * dlnI + dlnK
+    # Guard absurd values that destabilize sign checks
+    val[~np.isfinite(val) | (np.abs(val) > 1e12)] = np.nan
+    return val
 
 
 def _secular_value(kappa: float, ell: int, R: float, mu: float, c: float) -> float:
     """
-    Evaluate the secular equation value:
-        f(κ) = (κ_in/κ_out) * (I'_ℓ / I_ℓ)(κ_in R) + (K'_ℓ / K_ℓ)(κ_out R)
-    Roots f(κ)=0 provide allowed κ for given (ℓ, R, μ, c).
-    Valid only when κ_in^2 >= 0.
+    Scalar f_ℓ(κ), same arithmetic and guards as secular_values; used by the brentq
+    refinements, where per-call array overhead would dominate.
     """
     if kappa <= 0.0 or R <= 0.0 or mu <= 0.0 or c <= 0.0:
         return np.nan
-    cinv = 1.0 / c
-    k_in2 = (mu * cinv) ** 2 - kappa ** 2
+    q2 = (mu / c) ** 2
+    k_in2 = q2 - kappa ** 2
     if k_in2 <= 0.0:
-        # Outside the domain where interior solution uses I_ℓ with real argument.
-        return np.nan
-    k_out2 = kappa ** 2 + 2.0 * (mu * cinv) ** 2
-    k_in = float(np.sqrt(k_in2))
-    k_out = float(np.sqrt(k_out2))
-    x_in = k_in * R
-    x_out = k_out * R
-
-    try:
-        val = (k_in / k_out) * _dlnI(ell, x_in) + _dlnK(ell, x_out)
-    except Exception:
         return np.nan
+    _, special = _scipy()
+    k_in = math.sqrt(k_in2)
+    k_out = math.sqrt(kappa ** 2 + 2.0 * q2)
+    x_in = max(k_in * R, _EPS)
+    x_out = max(k_out * R, _EPS)
+    I0 = float(special.ive(ell, x_in))
+    K0 = float(special.kve(ell, x_out))
+    dI = float(special.ive(ell - 1, x_in) + special.ive(ell + 1, x_in))
+    dK = -float(special.kve(ell - 1, x_out) + special.kve(ell + 1, x_out))
+    log_eps = math.log(_EPS)
+    if I0 == 0.0 or math.log(abs(I0)) + x_in < log_eps:
+        dlnI = math.copysign(1e6, dI) if dI != 0.0 else 0.0
+    else:
+        dlnI = dI / (2.0 * I0)
+    if K0 == 0.0 or math.log(abs(K0)) - x_out < log_eps:
+        dlnK = -math.copysign(1e6, dK) if dK != 0.0 else 0.0
+    else:
+        dlnK = dK / (2.0 * K0)
+    val = (k_in / k_out) * dlnI + dlnK
     # Guard absurd values that destabilize sign checks
-    if not np.isfinite(val) or abs(val) > 1e12:
+    if not math.isfinite(val) or abs(val) > 1e12:
         return np.nan
-    return float(val)
+    return val
 
 
-def _find_roots_for_ell(
-    ell: int,
-    R: float,
-    mu: float,
-    c: float,
-    kappa_max: Optional[float],
-    num_brackets: int,
-    tol: float,
-) -> List[float]:
+def _kappa_grid(mu: float, c: float, kappa_max: Optional[float], num_brackets: int) -> np.ndarray:
     """
-    Search for roots of f(κ) over κ ∈ (0, κ_max^{eff}) by sign bracketing.
+    Bracketing grid over κ ∈ (0, κ_max^{eff}].
 
     κ_in^2 = μ^2/c^2 - κ^2 must be ≥ 0, so κ ≤ μ/c. We clamp κ_max to < μ/c.
     """
-    if not _HAVE_SCIPY:
-        raise RuntimeError("scipy is required for cylinder_modes")
-
     kappa_cap = (mu / c) * 0.999
     if kappa_max is None or not np.isfinite(kappa_max):
         kappa_max_eff = kappa_cap
@@ -173,33 +229,69 @@ def _find_roots_for_ell(
         kappa_max_eff = min(float(kappa_max), kappa_cap)
         if kappa_max_eff <= 1e-9:
             kappa_max_eff = kappa_cap
+    return np.linspace(1e-9, kappa_max_eff, num_brackets + 1)
+
+
+def _root_brackets(
+    ells: Sequence[int],
+    R: float,
+    mu: float,
+    c: float,
+    kappa_max: Optional[float],
+    num_brackets: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sign-change cells of f_ℓ(κ) on the bracketing grid for every ℓ in ells, from one
+    secular_values call (NaNs break bracketing across invalid regions).
+
+    Returns:
+      (ℓ, a, b, fa, fb) per cell, ordered by ℓ then κ
+    """
+    ells = np.asarray(ells, dtype=np.int64)
+    grid = _kappa_grid(mu, c, kappa_max, num_brackets)
+    F = secular_values(grid, ells, R, mu, c)
+    f0, f1 = F[:, :-1], F[:, 1:]
+    valid = np.isfinite(f0) & np.isfinite(f1)
+    with np.errstate(invalid="ignore"):
+        hit = valid & ((f0 == 0.0) | (f1 == 0.0) | (np.sign(f0) != np.sign(f1)))
+    rows, cols = np.nonzero(hit)
+    return ells[rows], grid[cols], grid[cols + 1], f0[rows, cols], f1[rows, cols]
+
+
+def _find_roots_grid(
+    ells: Sequence[int],
+    R: float,
+    mu: float,
+    c: float,
+    kappa_max: Optional[float],
+    num_brackets: int,
+    tol: float,
+) -> Dict[int, List[float]]:
+    """
+    Roots of f_ℓ(κ) for every ℓ in ells: the (ℓ, κ) grid is evaluated in one
+    secular_values call, sign-change brackets are located with array ops, and only
+    the bracketed intervals are refined (scalar brentq).
 
-    kappas = []
-    grid = np.linspace(1e-9, kappa_max_eff, num_brackets + 1)
-    fvals = []
-    for x in grid:
-        fv = _secular_value(x, ell, R, mu, c)
-        # Replace NaNs with None to break bracketing across invalid regions
-        fvals.append(fv if np.isfinite(fv) else None)
-
-    for i in range(len(grid) - 1):
-        f0 = fvals[i]
-        f1 = fvals[i + 1]
-        if f0 is None or f1 is None:
-            continue
-        if f0 == 0.0:
-            root = grid[i]
-        elif f1 == 0.0:
-            root = grid[i + 1]
-        elif np.sign(f0) == np.sign(f1):
-            continue
+    Returns:
+      mapping ℓ -> ascending κ-roots
+    """
+    optimize = _scipy()[0]
+    ells = [int(ell) for ell in ells]
+    roots: Dict[int, List[float]] = {ell: [] for ell in ells}
+    if not ells:
+        return roots
+    for ell, a, b, fa, fb in zip(*(v.tolist() for v in _root_brackets(ells, R, mu, c, kappa_max, num_brackets))):
+        if fa == 0.0:
+            root = a
+        elif fb == 0.0:
+            root = b
         else:
-            a, b = grid[i], grid[i + 1]
             try:
                 root = optimize.brentq(
-                    lambda x: _secular_value(x, ell, R, mu, c),
+                    _secular_value,
                     a,
                     b,
+                    args=(ell, R, mu, c),
                     xtol=tol,
                     rtol=tol,
                     maxiter=200,
@@ -207,9 +299,23 @@ def _find_roots_for_ell(
             except Exception:
                 continue
         # Deduplicate near-equal roots
-        if len(kappas) == 0 or abs(root - kappas[-1]) > 1e-6:
-            kappas.append(float(root))
-    return kappas
+        found = roots[ell]
+        if len(found) == 0 or abs(root - found[-1]) > 1e-6:
+            found.append(float(root))
+    return roots
+
+
+def _find_roots_for_ell(
+    ell: int,
+    R: float,
+    mu: float,
+    c: float,
+    kappa_max: Optional[float],
+    num_brackets: int,
+    tol: float,
+) -> List[float]:
+    """Search for roots of f(κ) over κ ∈ (0, κ_max^{eff}) by sign bracketing (single ℓ)."""
+    return _find_roots_grid([ell], R, mu, c, kappa_max, num_brackets, tol)[int(ell)]
 
 
 def compute_kappas(
@@ -236,21 +342,18 @@ def compute_kappas(
     Returns:
       list of dict: { 'ell', 'kappa', 'k_in', 'k_out' } for each root found (kappa > 0).
     """
-    if not _HAVE_SCIPY:
-        raise RuntimeError("scipy is required for cylinder_modes")
+    _scipy()  # fail fast without scipy
 
+    ells = list(range(int(max(0, ell_max)) + 1))
+    roots = _find_roots_grid(ells, R, mu, c, kappa_max, num_brackets, tol)
+    return _root_entries(roots, mu, c)
+
+
+def _root_entries(roots: Dict[int, List[float]], mu: float, c: float) -> List[Dict[str, float]]:
+    """compute_kappas-style records for {ℓ: κ-roots}, ordered by ℓ then κ."""
     results: List[Dict[str, float]] = []
-    for ell in range(int(max(0, ell_max)) + 1):
-        roots = _find_roots_for_ell(
-            ell=ell,
-            R=R,
-            mu=mu,
-            c=c,
-            kappa_max=kappa_max,
-            num_brackets=num_brackets,
-            tol=tol,
-        )
-        for kappa in roots:
+    for ell in sorted(roots):
+        for kappa in roots[ell]:
             k_in = float(np.sqrt(max(0.0, (mu / c) ** 2 - kappa ** 2)))
             k_out = float(np.sqrt(max(0.0, kappa ** 2 + 2.0 * (mu / c) ** 2)))
             results.append(
@@ -264,16 +367,207 @@ def compute_kappas(
     return results
 
 
+def _bisect_brackets(
+    ells: np.ndarray,
+    R: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    fa: np.ndarray,
+    fb: np.ndarray,
+    mu: float,
+    c: float,
+    tol: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bisect sign-change brackets [a, b] (one per row, values fa, fb, radius R) together, one
+    _secular_pairs call per halving over the rows still wider than tol·(1 + |κ|).
+
+    Returns:
+      (roots, ok): the bracket endpoint with the smaller |f| (exact zeros included), and a
+      mask that is False where a midpoint value was NaN.
+    """
+    a, b, fa, fb = a.copy(), b.copy(), fa.copy(), fb.copy()
+    ok = np.ones(a.shape, dtype=bool)
+    idx = np.nonzero(((b - a) > tol * (1.0 + np.abs(a))) & (fa != 0.0) & (fb != 0.0))[0]
+    while idx.size:
+        m = 0.5 * (a[idx] + b[idx])
+        fm = _secular_pairs(m, ells[idx], R[idx], mu, c)
+        bad = ~np.isfinite(fm)
+        ok[idx[bad]] = False
+        left = np.sign(fm) != np.sign(fa[idx])  # crossing in [a, m] (or f(m) = 0)
+        i_l, i_r = idx[left & ~bad], idx[~left & ~bad]
+        b[i_l], fb[i_l] = m[left & ~bad], fm[left & ~bad]
+        a[i_r], fa[i_r] = m[~left & ~bad], fm[~left & ~bad]
+        idx = idx[~bad]
+        idx = idx[((b[idx] - a[idx]) > tol * (1.0 + np.abs(a[idx]))) & (fb[idx] != 0.0)]
+    # like brentq, return the endpoint with the smaller |f|: at a surrogate jump that is the
+    # side where I_ℓ is still resolved, so mode_functions can normalise the root
+    roots = np.where(np.abs(fa) <= np.abs(fb), a, b)
+    return roots, ok
+
+
+def track_kappas(
+    R_grid: Sequence[float],
+    mu: float,
+    c: float = 1.0,
+    ell_max: int = 12,
+    kappa_max: Optional[float] = None,
+    num_brackets: int = 512,
+    tol: float = 1e-8,
+    rescan_every: int = 32,
+    stats: Optional[Dict[str, int]] = None,
+) -> List[List[Dict[str, float]]]:
+    """
+    compute_kappas along an ordered R grid by continuation, in two passes.
+
+    Tracking pass (sequential in R): every root is bracketed about its estimate at the
+    previous radius (half-width twice its last step, at least two cells of the bracketing
+    grid, widened ×4 up to twice) and the narrow bracket is cut in four. The parity endpoints
+    of every ℓ, the candidate brackets and the cut points of a radius are evaluated in one
+    _secular_pairs call. A full bracket scan for ℓ is done only when
+      - a branch is lost (no sign change even after widening) or two of its brackets overlap
+        (merging roots),
+      - the endpoint sign parity sign f(κ_lo)·sign f(κ_hi) disagrees with (-1)^{#roots},
+        i.e. a root entered or left the κ interval,
+      - every `rescan_every` radii (catches root pairs born together, which parity misses).
+
+    Refinement pass: the tracked brackets of the whole grid are bisected together to width
+    tol·(1 + κ) (_bisect_brackets). Many roots of the clamped secular function are jumps of
+    the small-Bessel surrogate rather than smooth zeros, and brentq bisects those too, so
+    this takes no more evaluations than per-root brentq and avoids its per-call overhead.
+    A branch whose bisection meets a NaN, or whose refined roots come within 1e-6 of each
+    other, is re-solved by a full scan at that radius.
+
+    Args:
+      R_grid: radii in scan order (monotone grids track best)
+      mu, c, ell_max, kappa_max, num_brackets, tol: as in compute_kappas
+      rescan_every: periodic full-scan interval (≤ 0 disables)
+      stats: optional dict, filled with counts 'full_scans' and 'tracked' (ℓ-branches refined)
+
+    Returns:
+      per-R lists in compute_kappas format.
+    """
+    _scipy()  # fail fast without scipy
+    ells = np.arange(int(max(0, ell_max)) + 1)
+    grid = _kappa_grid(mu, c, kappa_max, num_brackets)
+    lo, hi = float(grid[0]), float(grid[-1])
+    dk = float(grid[1] - grid[0])
+    counts = {"full_scans": 0, "tracked": 0}
+    widen = 4.0 ** np.arange(3)  # narrow bracket, then widened ×4 up to twice
+    cut = np.arange(1, 4) / 4.0
+    ends, ends_ell = np.repeat([lo, hi], ells.size), np.tile(ells, 2)  # parity endpoints
+
+    Rs = [float(x) for x in np.asarray(R_grid, dtype=np.float64)]
+    blocks = []  # per radius: (ℓ, a, b, fa, fb) of every root bracket, sorted by ℓ then κ
+    # current root estimates, sorted by ℓ then κ, and their next bracket half-widths
+    est, est_ell, half = np.zeros(0), np.zeros(0, dtype=np.int64), np.zeros(0)
+    for i, R in enumerate(Rs):
+        if i == 0 or (rescan_every > 0 and i % rescan_every == 0):
+            rescan = ells
+            keep = np.zeros(est.size, dtype=bool)
+            a = b = fa = fb = mid = est
+        else:
+            n_p, n_l = est.size, ells.size
+            ea = np.maximum(lo, est[:, None] - half[:, None] * widen[None, :])
+            eb = np.minimum(hi, est[:, None] + half[:, None] * widen[None, :])
+            xc = ea[:, :1] + (eb[:, :1] - ea[:, :1]) * cut[None, :]
+            # row layout per root: 3 left ends, 3 right ends, the cut points of the narrow bracket
+            pts = np.concatenate([ea, eb, xc], axis=1)
+            F = _secular_pairs(np.concatenate([ends, pts.ravel()]),
+                               np.concatenate([ends_ell, np.repeat(est_ell, pts.shape[1])]), R, mu, c)
+            f_lo, f_hi = F[:n_l], F[n_l:2 * n_l]
+            F = F[2 * n_l:].reshape(n_p, pts.shape[1])
+            fa3, fb3, fc = F[:, :3], F[:, 3:6], F[:, 6:]
+            with np.errstate(invalid="ignore"):
+                sc = np.isfinite(fa3) & np.isfinite(fb3) & ((fa3 == 0.0) | (fb3 == 0.0) | (np.sign(fa3) != np.sign(fb3)))
+            found = sc.any(axis=1)
+            pick = np.argmax(sc, axis=1)
+            rows = np.arange(n_p)
+            a, b = ea[rows, pick], eb[rows, pick]
+            fa, fb = fa3[rows, pick], fb3[rows, pick]
+
+            # cut the narrow brackets down to their first sub-interval with a crossing
+            nr = np.nonzero(found & (pick == 0))[0]
+            x = np.concatenate([a[nr, None], xc[nr], b[nr, None]], axis=1)
+            f = np.concatenate([fa[nr, None], fc[nr], fb[nr, None]], axis=1)
+            f0, f1 = f[:, :-1], f[:, 1:]
+            with np.errstate(invalid="ignore"):
+                hit = np.isfinite(f0) & np.isfinite(f1) & ((f0 == 0.0) | (f1 == 0.0) | (np.sign(f0) != np.sign(f1)))
+            sub = np.nonzero(hit.any(axis=1))[0]  # NaN cut points: keep the whole bracket
+            col = np.argmax(hit[sub], axis=1)
+            nr = nr[sub]
+            a[nr], b[nr], fa[nr], fb[nr] = x[sub, col], x[sub, col + 1], f0[sub, col], f1[sub, col]
+
+            # lost roots and overlapping brackets (merging roots) of a branch
+            bad = np.zeros(n_l, dtype=bool)
+            bad[est_ell[~found]] = True
+            same = est_ell[1:] == est_ell[:-1]
+            bad[est_ell[1:][same & (b[:-1] >= a[1:])]] = True
+            # parity: a root crossing either end of the κ interval flips sign f(lo)·sign f(hi)
+            n_roots = np.bincount(est_ell, minlength=n_l)
+            counts["tracked"] += int(np.count_nonzero(n_roots))
+            with np.errstate(invalid="ignore"):
+                parity = np.isfinite(f_lo) & np.isfinite(f_hi) & (f_lo != 0.0) & (f_hi != 0.0)
+                bad |= parity & ((np.sign(f_lo) * np.sign(f_hi) < 0) != (n_roots % 2 == 1))
+            rescan = np.nonzero(bad)[0]
+            keep = ~bad[est_ell]
+            mid = 0.5 * (a + b)
+
+        if rescan.size:
+            counts["full_scans"] += int(rescan.size)
+            scan = _root_brackets(rescan, R, mu, c, kappa_max, num_brackets)
+        else:
+            scan = (np.zeros(0, dtype=np.int64),) + (np.zeros(0),) * 4
+        blk = [np.concatenate([v[keep], w]) for v, w in zip((est_ell, a, b, fa, fb), scan)]
+        new_half = np.concatenate([np.maximum(2.0 * np.abs(mid[keep] - est[keep]), 2.0 * dk),
+                                   np.full(scan[0].size, 2.0 * dk)])
+        order = np.lexsort((blk[1], blk[0]))
+        blk = [v[order] for v in blk]
+        blocks.append(blk)
+        est_ell, est, half = blk[0], 0.5 * (blk[1] + blk[2]), new_half[order]
+
+    # refinement pass over every bracket of the grid
+    sizes = [blk[0].size for blk in blocks]
+    r_idx = np.repeat(np.arange(len(Rs)), sizes)
+    ell_all = np.concatenate([blk[0] for blk in blocks])
+    refined, ok = _bisect_brackets(
+        ell_all, np.asarray(Rs, dtype=np.float64)[r_idx],
+        *(np.concatenate([blk[j] for blk in blocks]) for j in range(1, 5)), mu, c, tol,
+    )
+    # branches with a NaN or with roots closer than the compute_kappas dedup distance
+    same = (r_idx[1:] == r_idx[:-1]) & (ell_all[1:] == ell_all[:-1])
+    close = np.nonzero(same & (np.diff(refined) <= 1e-6))[0]
+    redo = set(zip(r_idx[~ok].tolist(), ell_all[~ok].tolist()))
+    redo.update(zip(r_idx[close].tolist(), ell_all[close].tolist()))
+
+    solved: List[Dict[int, List[float]]] = [{} for _ in Rs]
+    for i, ell, kappa in zip(r_idx.tolist(), ell_all.tolist(), refined.tolist()):
+        if (i, ell) not in redo:
+            solved[i].setdefault(ell, []).append(kappa)
+    for i, ell in sorted(redo):
+        counts["full_scans"] += 1
+        solved[i].update(_find_roots_grid([ell], Rs[i], mu, c, kappa_max, num_brackets, tol))
+    out = [_root_entries(roots, mu, c) for roots in solved]
+    if stats is not None:
+        stats.update(counts)
+    return out
+
+
 def mode_functions(
     R: float,
     root: Dict[str, float],
-) -> Dict[str, Callable[[float], float]]:
+) -> Dict[str, Callable]:
     """
     Construct piecewise radial mode functions normalized so u(R) = 1.
 
     Inside (r < R):  u_in(r) = A I_ℓ(k_in r), with A = 1 / I_ℓ(k_in R).
     Outside (r > R): u_out(r) = B K_ℓ(k_out r), with B = 1 / K_ℓ(k_out R).
 
+    The callables accept scalars (returning float) or arrays (returning arrays of the same
+    shape). They are evaluated through the exponentially scaled ive/kve as ratios, e.g.
+      u_out(r) = kve(ℓ, k_out r) / kve(ℓ, k_out R) · exp(-k_out (r - R)),
+    so large arguments neither overflow nor underflow before the ratio is taken.
+
     Args:
       R: tube radius
       root: dict from compute_kappas entry, requires 'ell', 'k_in', 'k_out'.
@@ -281,6 +575,7 @@ def mode_functions(
     Returns:
       dict with callables: { 'u_in', 'u_out', 'u' }
     """
+    special = _scipy()[1]
     ell = int(root["ell"])
     k_in = float(root["k_in"])
     k_out = float(root["k_out"])
@@ -288,29 +583,38 @@ def mode_functions(
     x_in_R = max(_EPS, k_in * R)
     x_out_R = max(_EPS, k_out * R)
 
-    I_R = _iv(ell, x_in_R)
-    K_R = _kv(ell, x_out_R)
-    if abs(I_R) < _EPS or abs(K_R) < _EPS:
+    I_R = float(special.ive(ell, x_in_R))  # I_ℓ(x) e^{-x}
+    K_R = float(special.kve(ell, x_out_R))  # K_ℓ(x) e^{x}
+    # same test as |I_ℓ(k_in R)| < ε or |K_ℓ(k_out R)| < ε, done in log space
+    log_eps = math.log(_EPS)
+    log_I = math.log(I_R) + x_in_R if I_R > 0.0 else -math.inf
+    log_K = math.log(K_R) - x_out_R if K_R > 0.0 else -math.inf
+    if log_I < log_eps or log_K < log_eps or not (math.isfinite(I_R) and math.isfinite(K_R)):
         raise FloatingPointError("Unstable normalization at r=R: I_ℓ or K_ℓ ~ 0")
 
-    A = 1.0 / I_R
-    B = 1.0 / K_R
-
-    def u_in(r: float) -> float:
-        rr = float(max(0.0, r))
-        return float(A * _iv(ell, max(_EPS, k_in * rr)))
-
-    def u_out(r: float) -> float:
-        rr = float(max(0.0, r))
-        return float(B * _kv(ell, max(_EPS, k_out * rr)))
-
-    def u(r: float) -> float:
-        rr = float(max(0.0, r))
-        if rr <= R:
-            return u_in(rr)
-        return u_out(rr)
-
-    return {"u_in": u_in, "u_out": u_out, "u": u}
+    def _wrap(fn):
+        def evaluate(r):
+            rr = np.maximum(np.asarray(r, dtype=np.float64), 0.0)
+            out = fn(rr)
+            return float(out) if out.ndim == 0 else out
+        return evaluate
+
+    def _u_in(rr: np.ndarray) -> np.ndarray:
+        x = np.maximum(_EPS, k_in * rr)
+        return special.ive(ell, x) / I_R * np.exp(x - x_in_R)
+
+    def _u_out(rr: np.ndarray) -> np.ndarray:
+        x = np.maximum(_EPS, k_out * rr)
+        return special.kve(ell, x) / K_R * np.exp(x_out_R - x)
+
+    def _u(rr: np.ndarray) -> np.ndarray:
+        inside = rr <= R
+        out = np.empty(rr.shape, dtype=np.float64)
+        out[inside] = _u_in(rr[inside])
+        out[~inside] = _u_out(rr[~inside])
+        return out
+
+    return {"u_in": _wrap(_u_in), "u_out": _wrap(_u_out), "u": _wrap(_u)}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,203 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+Tabulated tube mode functions: each radial mode u_ℓ(r) from
+[cylinder_modes.mode_functions](cylinder_modes.py:1) is sampled once on piecewise Chebyshev
+grids and then served from the interpolating polynomials, so repeated evaluations (overlap
+integrals, λ rescans, plots) cost a small polynomial evaluation instead of Bessel calls.
+
+Construction (per mode):
+- [0, R] (I_ℓ branch) and [R, r_cut] (K_ℓ branch) are tabulated separately, since u is only
+  C¹ at r = R; r_cut = R + 50/k_out, beyond which u_out < e^{-50} and evaluation falls back
+  to the direct Bessel form.
+- Each piece is covered by degree-16 Chebyshev panels; a panel is accepted when its
+  coefficient tail 2(|c_14| + |c_15| + |c_16|) is below tol, otherwise it is bisected.
+  All panels share one coefficient array, so an evaluation is a single vectorized pass.
+- The interpolant is evaluated by Clenshaw's recurrence on its Chebyshev coefficients: the
+  same polynomial as the barycentric form through the samples, at a third of the cost of
+  the Bessel calls (the barycentric form was slower than the Bessels in NumPy).
+- error_bound is the largest accepted tail estimate (absolute; u ≤ u(R) = 1), checked at
+  build time against direct evaluation at the panel midpoints between nodes.
+
+Tables live in an LRU cache keyed by (ℓ, k_in, k_out, R, tol).
+
+APIs:
+- mode_table(R, root, tol=1e-13) -> ModeTable (cached)
+- tabulated_mode_functions(R, root, tol=1e-13)
+    Drop-in for mode_functions: { 'u_in', 'u_out', 'u' } backed by the cached table.
+- clear_mode_tables()
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from .cylinder_modes import mode_functions
+
+_DEGREE = 16
+_MAX_SPLITS = 40
+_CUTOFF_DECAY = 50.0
+MODE_TABLE_CACHE_SIZE = 256
+
+_NODES = np.cos(np.pi * np.arange(_DEGREE + 1) / _DEGREE)  # second-kind Chebyshev points, +1 → -1
+
+
+def _chebyshev_coefficients(values: np.ndarray) -> np.ndarray:
+    """Chebyshev coefficients of the interpolant through values (..., n+1) at the nodes."""
+    n = values.shape[-1] - 1
+    ext = np.concatenate([values, values[..., -2:0:-1]], axis=-1)
+    c = np.real(np.fft.fft(ext, axis=-1))[..., : n + 1] / n
+    c[..., 0] *= 0.5
+    c[..., -1] *= 0.5
+    return c
+
+
+def _clenshaw(x: np.ndarray, coeffs: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """
+    Σ_k c_k T_k(x) at local coordinates x (N,) in [-1, 1], where point i uses the panel
+    idx[i] of coeffs (n+1, P).
+    """
+    b1 = np.zeros_like(x)
+    b2 = np.zeros_like(x)
+    x2 = 2.0 * x
+    for k in range(coeffs.shape[0] - 1, 0, -1):
+        b1, b2 = x2 * b1 - b2 + coeffs[k].take(idx), b1
+    return x * b1 - b2 + coeffs[0].take(idx)
+
+
+def _tabulate(f: Callable[[np.ndarray], np.ndarray], a: float, b: float, tol: float
+              ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Degree-16 Chebyshev panels of f on [a, b], bisected until each coefficient tail is
+    below tol. Returns (edges (P+1,), coefficients (17, P), per-panel error estimates (P,)).
+    """
+    done: List[Tuple[float, float, np.ndarray, float]] = []
+    stack: List[Tuple[float, float, int]] = [(a, b, 0)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        values = np.asarray(f(0.5 * (lo + hi) + 0.5 * (hi - lo) * _NODES), dtype=np.float64)
+        c = _chebyshev_coefficients(values)
+        error = 2.0 * float(np.sum(np.abs(c[-3:])))
+        if error > tol and depth < _MAX_SPLITS:
+            mid = 0.5 * (lo + hi)
+            stack.extend([(mid, hi, depth + 1), (lo, mid, depth + 1)])
+            continue
+        done.append((lo, hi, c, error))
+    done.sort(key=lambda p: p[0])
+    P = len(done)
+    edges = np.array([p[0] for p in done] + [done[-1][1]])
+    coeffs = np.ascontiguousarray(np.stack([p[2] for p in done], axis=1))
+    errors = np.array([p[3] for p in done])
+    # guard the coefficient-tail estimate with direct checks between the nodes
+    x_mid = np.tile(np.cos(np.pi * (np.arange(_DEGREE) + 0.5) / _DEGREE), P)
+    panel = np.repeat(np.arange(P), _DEGREE)
+    lo, hi = edges[panel], edges[panel + 1]
+    measured = np.abs(_clenshaw(x_mid, coeffs, panel) - f(0.5 * (lo + hi) + 0.5 * (hi - lo) * x_mid))
+    errors = np.maximum(errors, measured.reshape(P, _DEGREE).max(axis=1))
+    return edges, coeffs, errors
+
+
+class ModeTable:
+    """
+    Piecewise-Chebyshev table of one normalized tube mode u_ℓ(r) (u(R) = 1).
+
+    Attributes:
+      ell, k_in, k_out, R: the mode
+      edges: panel boundaries on [0, r_cut] (R is always one of them)
+      error_bound: estimated max |u_table - u| over [0, r_cut] (exact beyond r_cut)
+    """
+
+    def __init__(self, R: float, ell: int, k_in: float, k_out: float, tol: float = 1e-13):
+        self.R = float(R)
+        self.ell = int(ell)
+        self.k_in = float(k_in)
+        self.k_out = float(k_out)
+        self.tol = float(tol)
+        self._direct = mode_functions(self.R, {"ell": float(self.ell), "k_in": self.k_in, "k_out": self.k_out})
+        self.r_cut = self.R + _CUTOFF_DECAY / max(self.k_out, 1e-300)
+        e_in, c_in, err_in = _tabulate(self._direct["u_in"], 0.0, self.R, self.tol)
+        e_out, c_out, err_out = _tabulate(self._direct["u_out"], self.R, self.r_cut, self.tol)
+        self.edges = np.concatenate([e_in, e_out[1:]])
+        self._coeffs = np.ascontiguousarray(np.concatenate([c_in, c_out], axis=1))
+        self._n_inner = c_in.shape[1]
+        self.error_bound = float(max(err_in.max(), err_out.max()))
+
+    @property
+    def num_nodes(self) -> int:
+        """Total number of stored Chebyshev coefficients (= samples)."""
+        return int(self._coeffs.size)
+
+    def _interp(self, r: np.ndarray, first: int, stop: int) -> np.ndarray:
+        """Interpolate with panels first..stop-1 (r must lie inside them)."""
+        idx = np.clip(np.searchsorted(self.edges, r, side="left") - 1, first, stop - 1)
+        lo, hi = self.edges[idx], self.edges[idx + 1]
+        return _clenshaw((2.0 * r - (lo + hi)) / (hi - lo), self._coeffs, idx)
+
+    def _u_in(self, r: np.ndarray) -> np.ndarray:
+        inside = r <= self.R
+        out = np.empty(r.shape, dtype=np.float64)
+        out[inside] = self._interp(r[inside], 0, self._n_inner)
+        out[~inside] = self._direct["u_in"](r[~inside])
+        return out
+
+    def _u_out(self, r: np.ndarray) -> np.ndarray:
+        tab = (r >= self.R) & (r <= self.r_cut)
+        out = np.empty(r.shape, dtype=np.float64)
+        out[tab] = self._interp(r[tab], self._n_inner, self._coeffs.shape[1])
+        out[~tab] = self._direct["u_out"](r[~tab])
+        return out
+
+    def _u(self, r: np.ndarray) -> np.ndarray:
+        tab = r <= self.r_cut
+        out = np.empty(r.shape, dtype=np.float64)
+        out[tab] = self._interp(r[tab], 0, self._coeffs.shape[1])
+        out[~tab] = self._direct["u_out"](r[~tab])
+        return out
+
+    def functions(self) -> Dict[str, Callable]:
+        """Callables { 'u_in', 'u_out', 'u' } with the mode_functions calling convention."""
+
+        def _wrap(fn):
+            def evaluate(r):
+                rr = np.maximum(np.asarray(r, dtype=np.float64), 0.0)
+                out = fn(rr.ravel()).reshape(rr.shape)
+                return float(out) if out.ndim == 0 else out
+            return evaluate
+
+        return {"u_in": _wrap(self._u_in), "u_out": _wrap(self._u_out), "u": _wrap(self._u)}
+
+
+@lru_cache(maxsize=MODE_TABLE_CACHE_SIZE)
+def _cached_table(ell: int, k_in: float, k_out: float, R: float, tol: float) -> ModeTable:
+    return ModeTable(R, ell, k_in, k_out, tol)
+
+
+def mode_table(R: float, root: Dict[str, float], tol: float = 1e-13) -> ModeTable:
+    """
+    Cached ModeTable for a compute_kappas root (keys 'ell', 'k_in', 'k_out').
+
+    Args:
+      R: tube radius
+      root: compute_kappas entry (or any dict with 'ell', 'k_in', 'k_out')
+      tol: absolute interpolation tolerance (u(R) = 1 sets the scale)
+
+    Returns:
+      ModeTable shared by all calls with the same (ℓ, k_in, k_out, R, tol)
+    """
+    return _cached_table(int(root["ell"]), float(root["k_in"]), float(root["k_out"]), float(R), float(tol))
+
+
+def tabulated_mode_functions(R: float, root: Dict[str, float], tol: float = 1e-13) -> Dict[str, Callable]:
+    """mode_functions backed by the cached table: same callables, interpolated."""
+    return mode_table(R, root, tol).functions()
+
+
+def clear_mode_tables() -> None:
+    """Drop every cached table."""
+    _cached_table.cache_clear()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.common import figure_service
+from src.common.figure_service import FigureService
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def write_summary(path, values, label="y"):
+    """Stand-in renderer: writes the data it was handed instead of a PNG."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"{label}:{float(np.sum(values)):.6f}")
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_rendering_modes_write_the_figure(tmp_path, mode):
+    paths = [tmp_path / f"fig{i}.png" for i in range(3)]
+    with FigureService(mode, workers=2) as figs:
+        for i, p in enumerate(paths):
+            assert figs.submit(p, write_summary, p, np.arange(1.0, i + 2.0), label=mode) == p
+    assert [p.read_text() for p in paths] == [f"{mode}:1.000000", f"{mode}:3.000000", f"{mode}:6.000000"]
+    assert not list(tmp_path.glob("*" + figure_service.SPEC_SUFFIX))
+
+
+def test_defer_persists_specs_and_renders_on_demand(tmp_path):
+    fig = tmp_path / "runs" / "20250101_000000_demo.png"
+    with FigureService("defer") as figs:
+        spec = figs.submit(fig, write_summary, fig, np.full(4, 0.5), label="later")
+        assert not figs.renders
+    assert spec == figure_service.spec_path(fig) and spec.is_file()
+    assert not fig.exists()
+
+    rendered = figure_service.render_deferred([tmp_path])
+    assert rendered == [str(fig)]
+    assert fig.read_text() == "later:2.000000"
+    assert not spec.exists()
+
+
+def test_rejects_unknown_mode_and_renders_nested_functions_sync(tmp_path):
+    with pytest.raises(ValueError):
+        FigureService("eager")
+
+    def nested(path):
+        path.write_text("nested")
+
+    fig = tmp_path / "x.png"
+    with pytest.warns(RuntimeWarning, match="synchronously"):
+        assert FigureService("defer").submit(fig, nested, fig) == fig
+    assert fig.read_text() == "nested"
+    assert not figure_service.spec_path(fig).exists()
+
+
+def test_entry_point_run_by_path_defers_figures(tmp_path):
+    script = PROJECT_ROOT / "src" / "conservation_law" / "qfum_validate.py"
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT), MPLBACKEND="Agg")
+    env.pop(figure_service.ENV_MODE, None)
+    subprocess.run(
+        [sys.executable, str(script), "--r", "0.15", "--u", "0.25", "--W0", "0.12", "--T", "1",
+         "--dt", "0.01", "--no-figures", "--outdir", str(tmp_path)],
+        cwd=tmp_path, env=env, capture_output=True, text=True, check=True,
+    )
+    assert len(list((tmp_path / "logs").rglob("*_qVDM_metrics.json"))) == 1
+    specs = figure_service.find_specs([tmp_path / "figures"])
+    assert len(specs) == 2
+    with open(specs[0], "rb") as f:
+        assert pickle.load(f)["source"] == str(script.resolve())
+
+    rendered = figure_service.render_deferred([tmp_path / "figures"])
+    assert len(rendered) == 2
+    assert all(Path(p).is_file() for p in rendered)
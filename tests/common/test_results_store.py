@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from src.common import results_store
+
+
+def test_round_trip_is_typed_and_lazy(tmp_path):
+    root = tmp_path / "run.results"
+    results_store.write_results(root, {
+        "junction": {"x": np.linspace(-1, 1, 5), "p_a": np.full(5, 0.5)},
+        "signed": {"sign_id": np.array([0, 1, 2], dtype=np.int64)},
+    }, meta={"seed": 7})
+    assert results_store.is_results_store(root)
+
+    tables = results_store.load_results(root)
+    assert isinstance(tables["junction"]["x"], np.memmap)
+    assert np.allclose(tables["junction"]["x"], np.linspace(-1, 1, 5))
+    assert tables["signed"]["sign_id"].dtype == np.int64
+    assert results_store.read_manifest(root)["meta"] == {"seed": 7}
+
+    # appending a table keeps the existing ones
+    results_store.write_results(root, {"extra": {"y": np.arange(3.0)}})
+    manifest = json.loads((root / results_store.MANIFEST).read_text())
+    assert set(manifest["tables"]) == {"junction", "signed", "extra"}
+    assert results_store.load_results(root, tables=["extra"], mmap=False)["extra"]["y"].tolist() == [0.0, 1.0, 2.0]
+
+
+def test_ragged_table_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        results_store.write_results(tmp_path / "bad.results", {"t": {"a": np.zeros(3), "b": np.zeros(4)}})
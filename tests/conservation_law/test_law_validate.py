@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.common import io_paths
+from src.conservation_law import law_validate as lv
+from src.conservation_law.qfum_validate import integrate_batch
+
+
+def test_logistic_law_matches_qfum_batch():
+    law = lv.get_law("logistic")
+    grid = lv.law_grid(law, {"r": [0.15, 0.3], "u": [0.25]}, [0.12, 0.62], [0.04, 0.02])
+    res = lv.run_solver(law, grid, 5.0, "rk4", chunk=16)
+    ref = integrate_batch(grid["r"], grid["u"], grid["W0"], 5.0, grid["step"], solver="rk4")
+    np.testing.assert_allclose(res["delta_Q_max"], ref["delta_Q_max"], rtol=1e-6, atol=1e-15)
+    np.testing.assert_array_equal(res["W_max"], ref["W_max"])
+    assert np.all(res["W_err_max"] < 1e-8)
+
+
+def test_observed_orders_across_solvers():
+    report = lv.validate_law(lv.get_law("bernoulli"), {"a": [0.3], "b": [1.0]}, [0.2, 0.9], 5.0,
+                             dt_list=(0.04, 0.02, 0.01), tol_list=(1e-5, 1e-6, 1e-7, 1e-8))
+    acc = report["acceptance"]
+    assert acc["passed"]
+    for solver, order in [("euler", 1), ("heun", 2), ("implicit_midpoint", 2), ("rk4", 4)]:
+        assert abs(acc[solver]["median_slope"] - order) < 0.1
+    assert abs(acc["rk45"]["median_slope"] - 1.0) < 0.3
+    assert len(report["runs"]) == 4 * 2 * 3 + 2 * 4
+
+
+def test_wrong_invariant_fails_and_logs_to_failed_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_paths, "LOGS_ROOT", tmp_path / "logs")
+    logistic = lv.get_law("logistic")
+    # ln W alone is not conserved: the drift does not shrink with dt
+    wrong = lv.OnSiteLaw("logistic_lnW", ("r", "u"), logistic.rhs, lambda W, t, p: np.log(W))
+    report = lv.validate_law(wrong, {"r": [0.15], "u": [0.25]}, [0.12], 10.0, solvers=("rk4",))
+    assert not report["acceptance"]["passed"]
+    assert report["runs"][0]["W_err_max"] is None
+
+    path = lv.write_report(report)
+    assert path.parent == tmp_path / "logs" / "conservation_law" / "failed_runs"
+    assert json.loads(path.read_text())["law"] == "logistic_lnW"
+
+
+def test_get_law_resolves_module_attribute_and_rejects_unknown(monkeypatch):
+    custom = lv.OnSiteLaw("custom_decay", ("k",), lambda W, p: -p["k"] * W, lambda W, t, p: np.log(W) + p["k"] * t)
+    monkeypatch.setattr(lv, "CUSTOM_LAW", custom, raising=False)
+    assert lv.get_law("src.conservation_law.law_validate:CUSTOM_LAW") is custom
+    with pytest.raises(TypeError):
+        lv.get_law("src.conservation_law.law_validate:LAWS")
+    with pytest.raises(KeyError):
+        lv.get_law("no_such_law")
+    with pytest.raises(ValueError):
+        lv.law_grid(lv.get_law("decay"), {}, [1.0], [0.1])
+
+
+def test_ungated_and_non_proportional_solvers_fail():
+    # rk4 never rises above the noise floor on this ladder; rk45's median slope is ≈ 0.66
+    report = lv.validate_law(lv.get_law("logistic"), {"r": [0.15, 0.3], "u": [0.25]}, [0.3], T=5.0)
+    acc = report["acceptance"]
+    assert acc["rk4"]["gated"] is False and acc["rk4"]["order_ok"] is None
+    assert acc["rk45"]["gated"] and not acc["rk45"]["order_ok"]
+    assert acc["euler"]["order_ok"] and not acc["passed"]
+
+    report = lv.validate_law(lv.get_law("logistic"), {"r": [0.15, 0.3], "u": [0.25]}, [0.3], T=5.0,
+                             solvers=("euler", "rk4"), allow_ungated=True)
+    assert report["acceptance"]["passed"]
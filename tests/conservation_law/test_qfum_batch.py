@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from src.conservation_law.qfum_validate import (
+    Q_invariant,
+    integrate_batch,
+    integrate_numeric,
+    integrate_streaming,
+    validation_grid,
+)
+
+
+def test_validation_grid_orders_dt_fastest():
+    g = validation_grid([0.1, 0.2], [0.5], [0.12, 0.62], [0.02, 0.01])
+    assert g["r"].tolist() == [0.1] * 4 + [0.2] * 4
+    assert g["W0"].tolist() == [0.12, 0.12, 0.62, 0.62] * 2
+    assert g["dt"].tolist() == [0.02, 0.01] * 4
+
+
+@pytest.mark.parametrize("solver", ["rk4", "euler"])
+def test_batch_methods_match_integrate_numeric(solver):
+    g = validation_grid([0.15, 0.3], [0.25, 1.0], [0.12, 0.62], [0.04, 0.02, 0.01])
+    T = 3.0
+    rows = integrate_batch(g["r"], g["u"], g["W0"], T, g["dt"], solver=solver, keep=(0, 5), chunk=64, method="rows")
+    lock = integrate_batch(g["r"], g["u"], g["W0"], T, g["dt"], solver=solver, keep=(0, 5), chunk=64, method="lockstep")
+
+    for key in ("delta_Q_max", "W_min", "W_max", "W_final"):
+        np.testing.assert_array_equal(rows[key], lock[key])
+    assert rows["steps"].tolist() == [75, 150, 300] * 8
+
+    for b in range(g["r"].size):
+        t, W = integrate_numeric(g["r"][b], g["u"][b], g["W0"][b], T, g["dt"][b], solver=solver)
+        assert lock["W_final"][b] == W[-1]
+        assert lock["W_min"][b] == W.min() and lock["W_max"][b] == W.max()
+        ref = float(np.nanmax(np.abs(Q_invariant(g["r"][b], g["u"][b], W, t) - Q_invariant(g["r"][b], g["u"][b], W[0], 0.0))))
+        assert lock["delta_Q_max"][b] == ref
+        if b in (0, 5):
+            for res in (rows, lock):
+                t_k, W_k = res["trajectories"][b]
+                np.testing.assert_array_equal(t_k, t)
+                np.testing.assert_array_equal(W_k, W)
+
+
+def test_batch_drift_follows_solver_order():
+    dts = [0.04, 0.02, 0.01]
+    res = integrate_batch(0.15, 0.25, 0.12, 10.0, dts, solver="rk4")
+    ratios = res["delta_Q_max"][:-1] / res["delta_Q_max"][1:]
+    assert np.all(ratios > 12.0)  # ≈ 2⁴ per halving
+    with pytest.raises(ValueError):
+        integrate_batch(0.15, 0.25, 0.12, 1.0, 0.1, solver="midpoint")
+
+
+def test_streaming_matches_full_trajectory_with_decimated_trace():
+    r, u, W0, T, dt = 0.15, 0.25, 0.62, 5.0, 0.001
+    t, W = integrate_numeric(r, u, W0, T, dt)
+    res = integrate_streaming(r, u, W0, T, dt, trace_points=300, chunk=256)
+
+    assert res["steps"] == 5000
+    assert res["delta_Q_max"] == float(np.nanmax(np.abs(Q_invariant(r, u, W, t) - Q_invariant(r, u, W0, 0.0))))
+    assert (res["W_min"], res["W_max"], res["W_final"]) == (W.min(), W.max(), W[-1])
+
+    t_tr, W_tr = res["trace"]
+    assert t_tr.size <= 302
+    stride = 17  # ceil(5000 / 300)
+    np.testing.assert_array_equal(t_tr, np.append(t[::stride], t[-1]))
+    np.testing.assert_array_equal(W_tr, np.append(W[::stride], W[-1]))
+    assert integrate_streaming(r, u, W0, T, dt)["trace"] is None
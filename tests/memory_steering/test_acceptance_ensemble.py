@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import numpy as np
+
+from src.common import io_paths
+from src.common.figure_service import FigureService
+from src.memory_steering import memory_steering_acceptance as ma
+
+
+def test_run_filter_batch_matches_scalar_rows():
+    rng = np.random.default_rng(0)
+    B, T = 12, 200
+    g = rng.uniform(0.05, 0.3, B)
+    lam = rng.uniform(0.02, 0.2, B)
+    s = rng.uniform(0.0, 1.0, size=(B, T))
+    M = ma.run_filter_batch(s, g, lam, rng=[np.random.default_rng(i) for i in range(B)], noise_std=0.1)
+    assert M.shape == (B, T)
+    for b in range(B):
+        ref = ma.run_filter(s[b], g[b], lam[b], rng=np.random.default_rng(b), noise_std=0.1)
+        np.testing.assert_array_equal(M[b], ref)
+    assert M.min() >= 0.0 and M.max() <= 1.0
+
+    # shared input, one generator for the whole batch
+    M = ma.run_filter_batch(np.full(T, 0.4), g, lam, M0=0.0, rng=np.random.default_rng(1), noise_std=0.05)
+    assert M.shape == (B, T) and np.all(M[:, 0] == 0.0)
+
+
+def test_fit_pole_batch_matches_scalar_fit():
+    g = np.array([0.05, 0.12, 0.2, 0.3])
+    lam = np.array([0.02, 0.08, 0.1, 0.15])
+    s = np.full(400, 0.2)
+    s[64:] = 0.8
+    M = ma.run_filter_batch(s, g, lam)
+    p_fit, p_pred, M_star, _ = ma.fit_pole_from_step_batch(M, s, g, lam, 64)
+    for b in range(g.size):
+        ref = ma.fit_pole_from_step(M[b], s, g[b], lam[b], 64)
+        assert abs(p_fit[b] - ref[0]) < 1e-12
+        assert p_pred[b] == ref[1] and M_star[b] == ref[2]
+
+
+def test_acceptance_ensemble_reproduces_single_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_paths, "FIGURES_ROOT", tmp_path / "figures")
+    seeds, g_list, lam_list, steps = range(5), [0.06, 0.12], [0.04, 0.08], 256
+    ens = ma.acceptance_ensemble(seeds, g_list, lam_list, steps, noise_std=0.01)
+    assert ens["g"].size == 20 and ens["summary"]["rows"] == 20
+    assert ens["seed"].tolist()[:4] == [0, 0, 0, 0] and ens["lam"].tolist()[:2] == [0.04, 0.08]
+
+    figs = FigureService("defer")
+    for b in (0, 7, 19):
+        seed, g, lam = int(ens["seed"][b]), float(ens["g"][b]), float(ens["lam"][b])
+        step = ma.step_response_experiment(seed, steps, g, lam, figs=figs)
+        noise = ma.noise_suppression_experiment(seed, steps, g, lam, figs=figs)
+        lyap = ma.lyapunov_experiment(seed, steps, g, lam, figs=figs)
+        bound = ma.boundedness_experiment(seed, steps, g, lam)
+        assert abs(ens["p_fit"][b] - step["p_fit"]) < 1e-12
+        assert ens["M_final"][b] == step["M_final"] and ens["pass_pole"][b] == step["pass_pole"]
+        assert np.isclose(ens["delta_snr_db"][b], noise["delta_snr_db"], rtol=1e-12)
+        assert ens["frac_positive"][b] == lyap["frac_positive"] and ens["median_dF"][b] == lyap["median_dF"]
+        assert ens["violations"][b] == bound["violations"]
+    assert np.all(ens["pass_repro"]) and np.all(ens["pass_target"])
+
+    digest = ma.ensemble_summary(ens)
+    assert digest["seeds"] == list(seeds) and len(digest["by_param"]) == 4
+    assert all(e["seeds"] == 5 for e in digest["by_param"])
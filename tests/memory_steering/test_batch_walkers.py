@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+
+import vdm.memory_steering as ms
+
+
+def _random_graph(n: int = 40, p: float = 0.15, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    A = (rng.random((n, n)) < p).astype(np.int8)
+    A = np.triu(A, 1)
+    A = A + A.T
+    A[0, :] = 0  # isolated node exercises the empty-segment path
+    A[:, 0] = 0
+    return A
+
+
+def test_csr_matches_dense_neighbors():
+    A = _random_graph()
+    indptr, indices = ms.adjacency_to_csr(A)
+    for i in range(A.shape[0]):
+        assert np.array_equal(indices[indptr[i]:indptr[i + 1]], np.where(A[i] != 0)[0])
+
+
+def test_batch_probs_match_scalar():
+    A = _random_graph()
+    indptr, indices = ms.adjacency_to_csr(A)
+    m = np.random.default_rng(1).normal(size=A.shape[0])
+    nodes = np.arange(A.shape[0])
+    for temperature in (1.0, 0.3):
+        probs, offsets = ms.transition_probs_batch(nodes, indptr, indices, m, 2.5, temperature=temperature)
+        for k, i in enumerate(nodes):
+            neigh = np.where(A[i] != 0)[0]
+            ref = ms.transition_probs_temp(i, neigh, m, 2.5, temperature=temperature)
+            assert np.allclose(probs[offsets[k]:offsets[k + 1]], ref)
+
+
+def test_batch_sampler_distribution_matches_scalar():
+    A = _random_graph()
+    indptr, indices = ms.adjacency_to_csr(A)
+    m = np.random.default_rng(2).normal(size=A.shape[0])
+    src = int(np.argmax(np.diff(indptr)))
+    walkers = np.full(200_000, src)
+    nxt = ms.sample_next_neighbor_batch(walkers, indptr, indices, m, 1.5, rng=np.random.default_rng(4))
+    neigh = indices[indptr[src]:indptr[src + 1]]
+    freq = np.array([np.mean(nxt == j) for j in neigh])
+    ref = ms.transition_probs(src, neigh, m, 1.5)
+    assert np.all(np.isin(nxt, neigh))
+    assert np.max(np.abs(freq - ref)) < 5e-3
+
+
+def test_batch_sampler_isolated_node_returns_sentinel():
+    A = _random_graph()
+    indptr, indices = ms.adjacency_to_csr(A)
+    nxt = ms.sample_next_neighbor_batch(np.array([0, 1, 0]), indptr, indices, np.zeros(A.shape[0]), 1.0,
+                                        rng=np.random.default_rng(0))
+    assert nxt[0] == -1 and nxt[2] == -1
+
+
+def test_heading_batch_matches_scalar_sampler():
+    rng = np.random.default_rng(5)
+    pos = rng.normal(size=(12, 2))
+    A = np.ones((12, 12), dtype=np.int8) - np.eye(12, dtype=np.int8)
+    indptr, indices = ms.adjacency_to_csr(A)
+    dirs = ms.edge_unit_directions(pos, indptr, indices)
+    m = rng.normal(size=12)
+    heading = np.array([0.3, -1.0])
+    neigh = indices[indptr[4]:indptr[5]]
+
+    walkers = np.full(200_000, 4)
+    nxt, hdg = ms.sample_next_neighbor_heading_batch(
+        walkers, np.tile(heading, (walkers.size, 1)), indptr, indices, m, 1.2, dirs,
+        heading_bias=2.0, temperature=0.7, rng=np.random.default_rng(6),
+    )
+    scalar_rng = np.random.default_rng(7)
+    ref = np.array([
+        ms.sample_next_neighbor_heading(4, neigh, m, 1.2, pos, heading, heading_bias=2.0,
+                                        temperature=0.7, rng=scalar_rng)
+        for _ in range(20_000)
+    ])
+    f_batch = np.array([np.mean(nxt == j) for j in neigh])
+    f_ref = np.array([np.mean(ref == j) for j in neigh])
+    assert np.max(np.abs(f_batch - f_ref)) < 0.02
+    step = pos[nxt] - pos[4]
+    assert np.allclose(hdg, step / np.linalg.norm(step, axis=1, keepdims=True))
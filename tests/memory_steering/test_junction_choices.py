@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import vdm.memory_steering as ms
+
+
+def test_batch_binomial_matches_logistic():
+    A, J, a0, b0 = ms.y_junction_adjacency(5, 5, 5)
+    d = np.linspace(-2.0, 2.0, 9)
+    M = np.zeros((d.size, A.shape[0]))
+    M[:, a0] = 0.5 * d
+    M[:, b0] = -0.5 * d
+    trials = 200_000
+    counts = ms.collect_junction_choices_batch(A, M, J, (a0, b0), theta=2.0, trials=trials,
+                                               rng=np.random.default_rng(0))
+    assert counts.shape == (d.size, 2)
+    assert np.all(counts.sum(axis=1) == trials)
+    expected = 1.0 / (1.0 + np.exp(-2.0 * d))
+    assert np.max(np.abs(counts[:, 0] / trials - expected)) < 5e-3
+
+
+def test_scalar_binomial_method_matches_loop_distribution():
+    A, J, a0, b0 = ms.y_junction_adjacency(5, 5, 5)
+    m = np.zeros(A.shape[0])
+    m[a0], m[b0] = 0.4, -0.4
+    ca, cb = ms.collect_junction_choices(A, m, J, a0, b0, theta=1.5, trials=100_000,
+                                         rng=np.random.default_rng(1), method="binomial")
+    assert ca + cb == 100_000
+    assert abs(ca / 100_000 - 1.0 / (1.0 + np.exp(-1.5 * 0.8))) < 1e-2
+
+
+def test_batch_multinomial_for_three_branches():
+    A, J, a0, b0 = ms.y_junction_adjacency(5, 5, 5)
+    m = np.arange(A.shape[0], dtype=float) / A.shape[0]
+    counts = ms.collect_junction_choices_batch(A, m, J, None, theta=np.array([1.0]), trials=50_000,
+                                               rng=np.random.default_rng(2))
+    neigh = np.where(A[J] != 0)[0]
+    assert counts.shape == (1, neigh.size)
+    p = ms.transition_probs(J, neigh, m, 1.0)
+    assert np.max(np.abs(counts[0] / 50_000 - p)) < 1e-2
+
+
+def test_batch_rejects_non_neighbor_branch():
+    A, J, a0, b0 = ms.y_junction_adjacency(5, 5, 5)
+    with pytest.raises(ValueError):
+        ms.collect_junction_choices_batch(A, np.zeros(A.shape[0]), J, (a0, 0), theta=1.0)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from src.memory_steering.memory_steering_experiments import (
+    integrate_rays,
+    mean_path_curvature,
+    polyline_curvature,
+    polyline_curvature_signed,
+)
+
+
+def _turn_curvature_reference(line):
+    """Scalar loop: signed 2 sin(Δθ/2)/ℓ with Δθ from atan2 of consecutive segments."""
+    k = np.zeros(len(line))
+    for i in range(1, len(line) - 1):
+        ax, ay = line[i] - line[i - 1]
+        bx, by = line[i + 1] - line[i]
+        la, lb = math.hypot(ax, ay), math.hypot(bx, by)
+        if la == 0.0 or lb == 0.0:
+            continue
+        dtheta = math.atan2(ax * by - ay * bx, ax * bx + ay * by)
+        k[i] = 2.0 * math.sin(0.5 * dtheta) / (0.5 * (la + lb))
+    return k
+
+
+def test_curvature_ensemble_matches_scalar_reference():
+    pts = np.random.default_rng(0).normal(size=(30, 5, 2))
+    pts[7, 2] = pts[6, 2]  # zero-length segment
+    k = polyline_curvature(pts)
+    ks = polyline_curvature_signed(pts)
+    assert k.shape == ks.shape == (30, 5)
+    for p in range(5):
+        ref = _turn_curvature_reference(pts[:, p])
+        np.testing.assert_allclose(ks[:, p], ref, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(k[:, p], np.abs(ref), rtol=1e-9, atol=1e-12)
+    assert ks[6, 2] == ks[7, 2] == 0.0
+
+
+def test_arc_curvature_is_inverse_radius():
+    t = np.linspace(0.0, np.pi / 3.0, 200)
+    pts = 40.0 * np.stack([np.cos(t), np.sin(t)], axis=1)
+    k = polyline_curvature_signed(pts)[1:-1]
+    assert np.allclose(k, 1.0 / 40.0, rtol=1e-3)
+
+
+def test_integrate_rays_bends_with_theta_sign():
+    x0 = np.zeros((3, 2))
+    traj, npts = integrate_rays(x0, np.array([2.0, 0.0, -2.0]), np.array([0.0, 0.05]), dt=0.1, nsteps=200)
+    assert traj.shape == (201, 3, 2) and np.all(npts == 201)
+    kbar = mean_path_curvature(traj, npts)
+    ks = polyline_curvature_signed(traj).mean(axis=0)
+    assert kbar[0] > 0 and abs(kbar[1]) < 1e-12 and kbar[2] > 0
+    assert ks[0] > 0 > ks[2]
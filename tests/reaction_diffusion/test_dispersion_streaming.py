@@ -0,0 +1,46 @@
+import numpy as np
+
+from src.reaction_diffusion.rd_dispersion_experiment import (
+    StreamingDispersion,
+    analyze_dispersion,
+    analyze_dispersion_streaming,
+    linear_sim_schedule,
+    run_linear_sim,
+)
+
+
+def test_streaming_fits_match_snapshot_analysis():
+    N, L, D, r, T, cfl, rec = 512, 100.0, 1.0, 0.25, 5.0, 0.2, 60
+    sim = run_linear_sim(N, L, D, r, T, cfl, 7, record_slices=rec)
+    ref = analyze_dispersion(sim, D, r, L, 32, (0.1, 0.4))
+
+    _, _, steps, out_every = linear_sim_schedule(N, L, D, r, T, cfl, rec)
+    assert steps // out_every == len(sim["snapshot_times"])
+    an = StreamingDispersion(N, 32, steps // out_every, (0.1, 0.4))
+    sim_s = run_linear_sim(N, L, D, r, T, cfl, 7, record_slices=rec, analyzer=an)
+    assert sim_s["snapshots"] == []
+    out = analyze_dispersion_streaming(an, sim_s, D, r, L)
+
+    np.testing.assert_allclose(out["sigma_meas"], ref["sigma_meas"], rtol=0, atol=1e-8)
+    assert out["good_mask"] == ref["good_mask"]
+    assert abs(out["med_rel_err"] - ref["med_rel_err"]) < 1e-8
+
+
+def test_streaming_needs_two_fitted_samples():
+    an = StreamingDispersion(64, 4, 3, (0.0, 0.1))
+    an.update(0.1, np.ones(64))
+    sigma, r2 = an.result()
+    assert sigma.shape == (5,) and np.all(np.isnan(sigma)) and np.all(np.isnan(r2))
+
+
+def test_etd_spectrum_feed_matches_real_space_feed():
+    N, L, D, r, T, cfl, rec = 256, 50.0, 1.0, 0.25, 5.0, 0.2, 40
+    kw = dict(record_slices=rec, scheme="etd")
+    spec = StreamingDispersion(N, 16, rec, (0.1, 0.6))
+    run_linear_sim(N, L, D, r, T, cfl, 3, analyzer=spec, **kw)
+    real = StreamingDispersion(N, 16, rec, (0.1, 0.6))
+    sim = run_linear_sim(N, L, D, r, T, cfl, 3, **kw)
+    for t, u in zip(sim["snapshot_times"], sim["snapshots"]):
+        real.update(t, u)
+    assert spec.count == real.count == rec and spec.n_fit == real.n_fit
+    np.testing.assert_allclose(spec.result()[0], real.result()[0], rtol=1e-8, atol=1e-10)
@@ -0,0 +1,77 @@
+import numpy as np
+
+from src.common import io_paths
+from src.reaction_diffusion import rd_front_speed_sweep as sweep
+from src.reaction_diffusion.rd_front_speed_experiment import run_sim
+
+
+def _case(**kw):
+    p = dict(N=256, L=200.0, D=1.0, r=0.25, T=20.0, cfl=0.2, seed=42, x0=-60.0,
+             level=0.1, fit_start=0.6, fit_end=0.9, noise_amp=0.0)
+    p.update(kw)
+    return p
+
+
+def test_run_sweep_matches_direct_run_sim(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_paths, "LOGS_ROOT", tmp_path / "logs")
+    monkeypatch.setattr(io_paths, "FIGURES_ROOT", tmp_path / "figures")
+    cases = [_case(D=0.5), _case(D=1.0, level=0.5)]
+    seen = []
+    results = sweep.run_sweep(cases, workers=1, on_result=seen.append)
+    assert len(results) == len(seen) == 2
+    for res in results:
+        p = res["params"]
+        data = run_sim(p["N"], p["L"], p["D"], p["r"], p["T"], p["cfl"], p["seed"],
+                       level=p["level"], x0=p["x0"], fit_frac=(p["fit_start"], p["fit_end"]))
+        assert np.isclose(res["metrics"]["c_meas"], data["c_meas"])
+        assert res["figure"] is None
+        assert (tmp_path / "logs") in io_paths.Path(res["log"]).parents
+    # per-case slugs keep same-second logs distinct
+    assert len({res["log"] for res in results}) == 2
+
+
+def test_pooled_sweep_matches_in_process_sweep(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_paths, "LOGS_ROOT", tmp_path / "logs")
+    cases = [_case(D=0.5), _case(D=1.0, level=0.5), _case(N=128, r=0.5)]
+    serial = sweep.run_sweep(cases, workers=1)
+    seen = []
+    pooled = sweep.run_sweep(cases, workers=2, on_result=seen.append)
+    assert len(seen) == 3
+    assert [res["params"] for res in pooled] == [res["params"] for res in serial] == cases
+    for a, b in zip(pooled, serial):
+        a["metrics"].pop("elapsed_sec", None)
+        b["metrics"].pop("elapsed_sec", None)
+        assert a["metrics"] == b["metrics"]
+        assert (tmp_path / "logs") in io_paths.Path(a["log"]).parents
+
+
+def test_run_sim_batch_rows_match_run_sim():
+    from src.reaction_diffusion.rd_front_speed_experiment import run_sim_batch
+
+    D = np.array([0.5, 1.0, 2.0])
+    r = np.array([0.25, 0.1, 0.25])
+    level = np.array([0.1, 0.5, 0.5])
+    batch = run_sim_batch(256, 200.0, D, r, 20.0, 0.2, 42, level=level, x0=-60.0,
+                          fit_frac=(0.6, 0.9), noise_amp=0.01)
+    for b in range(D.size):
+        one = run_sim(256, 200.0, D[b], r[b], 20.0, 0.2, 42, level=level[b], x0=-60.0,
+                      fit_frac=(0.6, 0.9), noise_amp=0.01)
+        m = int(batch["n_rec"][b])
+        assert m == len(one["rec_t"])
+        np.testing.assert_array_equal(batch["rec_xf"][b, :m], one["rec_xf"])
+        for k in ("c_meas", "r2", "c_meas_grad", "r2_grad"):
+            np.testing.assert_allclose(batch[k][b], one[k], equal_nan=True)
+
+
+def test_batched_sweep_matches_in_process_sweep(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_paths, "LOGS_ROOT", tmp_path / "logs")
+    cases = [_case(D=0.5), _case(D=1.0, level=0.5), _case(N=128, r=0.5)]
+    ref = {(p["N"], p["D"], p["r"], p["level"]): p for p in cases}
+    serial = {tuple(res["params"][k] for k in ("N", "D", "r", "level")): res["metrics"]
+              for res in sweep.run_sweep(cases, workers=1)}
+    batched = sweep.run_sweep_batched(cases)
+    assert len(batched) == len(ref)
+    for res in batched:
+        key = tuple(res["params"][k] for k in ("N", "D", "r", "level"))
+        assert np.isclose(res["metrics"]["c_meas"], serial[key]["c_meas"])
+        assert res["metrics"]["passed"] == serial[key]["passed"]
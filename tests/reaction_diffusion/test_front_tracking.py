@@ -0,0 +1,61 @@
+import numpy as np
+
+from src.reaction_diffusion.rd_front_speed_experiment import (
+    front_position_near,
+    front_position_window,
+    gradient_peak,
+    run_sim,
+)
+
+
+def test_window_search_matches_full_scan_with_many_crossings():
+    rng = np.random.default_rng(3)
+    x = np.linspace(-50.0, 50.0, 2001)
+    for _ in range(50):
+        u = 0.5 + 0.5 * np.sin(x / rng.uniform(0.5, 5.0) + rng.uniform(0, 6)) * rng.uniform(0.2, 1.0)
+        level = rng.uniform(u.min() + 1e-3, u.max() - 1e-3)
+        guess = rng.uniform(-50.0, 50.0)
+        i_guess = int(rng.integers(0, x.size - 1))  # deliberately unrelated to guess
+        hit = front_position_window(x, u, level, guess, i_guess, half_width=4)
+        assert hit is not None
+        assert hit[0] == front_position_near(x, u, level, guess)
+
+
+def test_window_search_reports_no_crossing():
+    x = np.linspace(0.0, 1.0, 101)
+    assert front_position_window(x, np.full(101, 0.9), 0.5, 0.3, 30) is None
+
+
+def test_gradient_peak_window_matches_full():
+    x = np.linspace(-10.0, 10.0, 401)
+    u = 0.5 * (1.0 - np.tanh(x - 2.0))
+    dx = x[1] - x[0]
+    assert gradient_peak(x, u, dx, 200, 300) == gradient_peak(x, u, dx)
+
+
+def test_windowed_tracker_reproduces_scan_track():
+    kw = dict(level=0.1, x0=-60.0, fit_frac=(0.6, 0.9))
+    scan = run_sim(512, 200.0, 1.0, 0.25, 30.0, 0.2, 42, tracker="scan", **kw)
+    win = run_sim(512, 200.0, 1.0, 0.25, 30.0, 0.2, 42, tracker="window", **kw)
+    np.testing.assert_array_equal(scan["rec_xf"], win["rec_xf"])
+    np.testing.assert_array_equal(scan["rec_xg"], win["rec_xg"])
+    every = run_sim(512, 200.0, 1.0, 0.25, 30.0, 0.2, 42, record_every=1, **kw)
+    assert every["rec_t"].size == every["steps"]
+
+
+def test_comoving_frame_keeps_absolute_track():
+    kw = dict(level=0.1, fit_frac=(0.6, 0.9))
+    fixed = run_sim(1024, 200.0, 1.0, 0.25, 60.0, 0.2, 42, x0=-60.0, **kw)
+    moving = run_sim(512, 100.0, 1.0, 0.25, 60.0, 0.2, 42, x0=-10.0, comoving=True, **kw)
+    assert moving["snapshot_offsets"][-1] > 0.0
+    # same dx, front starts 50 units further right: absolute tracks differ by that shift
+    np.testing.assert_allclose(moving["rec_xf"][-50:] - 50.0 - fixed["rec_xf"][-50:], 0.0, atol=1e-3)
+    assert abs(moving["c_meas"] - fixed["c_meas"]) < 1e-3
+
+
+def test_comoving_long_run_on_small_domain():
+    data = run_sim(256, 50.0, 1.0, 0.25, 400.0, 0.2, 42, level=0.1, x0=-5.0,
+                   fit_frac=(0.6, 0.9), comoving=True)
+    # the front travels several domain lengths while staying inside the grid
+    assert data["rec_xf"][-1] > 6 * 50.0
+    assert data["rel_err"] <= 0.05 and data["r2"] >= 0.98
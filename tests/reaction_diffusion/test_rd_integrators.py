@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("scipy")
+
+from src.reaction_diffusion.rd_dispersion_experiment import analyze_dispersion, run_linear_sim
+from src.reaction_diffusion.rd_front_speed_experiment import (
+    cn_neumann_factor,
+    passes_acceptance,
+    run_sim,
+)
+
+
+def test_cn_front_speed_passes_gate_at_high_resolution():
+    cn_neumann_factor.cache_clear()
+    data = run_sim(8192, 200.0, 1.0, 0.25, 80.0, 0.2, 42, level=0.1, x0=-60.0,
+                   fit_frac=(0.6, 0.9), scheme="cn")
+    # dt is set by r alone, so the step count does not grow with N
+    assert data["steps"] == 400
+    assert passes_acceptance(data)
+    assert cn_neumann_factor.cache_info().currsize == 1
+
+
+def test_cn_matches_euler_speed():
+    kw = dict(level=0.1, x0=-60.0, fit_frac=(0.6, 0.9))
+    euler = run_sim(1024, 200.0, 1.0, 0.25, 80.0, 0.2, 42, **kw)
+    cn = run_sim(1024, 200.0, 1.0, 0.25, 80.0, 0.2, 42, scheme="cn", **kw)
+    assert abs(cn["c_meas"] - euler["c_meas"]) < 5e-3
+
+
+def test_etd_dispersion_matches_discrete_symbol():
+    sim = run_linear_sim(4096, 200.0, 1.0, 0.25, 10.0, 0.2, 42, record_slices=80, scheme="etd")
+    assert sim["steps"] == 80
+    out = analyze_dispersion(sim, 1.0, 0.25, 200.0, 64, (0.1, 0.4))
+    assert out["med_rel_err"] < 1e-8
+    assert out["r2_array"] > 0.999
+
+
+def test_unknown_scheme_rejected():
+    with pytest.raises(ValueError):
+        run_sim(64, 200.0, 1.0, 0.25, 1.0, 0.2, 0, scheme="rk4")
+    with pytest.raises(ValueError):
+        run_linear_sim(64, 200.0, 1.0, 0.25, 1.0, 0.2, 0, scheme="cn")
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from src.reaction_diffusion.rd_dispersion_experiment import laplacian_periodic
+from src.reaction_diffusion.rd_front_speed_experiment import laplacian_neumann, run_sim
+from src.reaction_diffusion.rd_nd_engine import (
+    diffusion_symbol,
+    initial_front_nd,
+    laplacian_nd,
+    passes_acceptance_nd,
+    run_sim_nd,
+)
+
+
+def test_laplacian_nd_matches_1d_stencils_and_is_separable():
+    rng = np.random.default_rng(0)
+    u = rng.random(40)
+    np.testing.assert_array_equal(laplacian_nd(u, 0.3), laplacian_neumann(u, 0.3))
+    np.testing.assert_allclose(laplacian_nd(u, 0.3, "periodic"), laplacian_periodic(u, 0.3))
+    U = rng.random((12, 9))
+    rows = np.stack([laplacian_neumann(U[i], 0.5) for i in range(12)])
+    cols = np.stack([laplacian_neumann(U[:, j], 0.5) for j in range(9)], axis=1)
+    np.testing.assert_allclose(laplacian_nd(U, 0.5), rows + cols, atol=1e-12)
+
+
+@pytest.mark.parametrize("bc", ["periodic", "neumann"])
+def test_diffusion_symbol_diagonalizes_stencil(bc):
+    if bc == "neumann":
+        sp_fft = pytest.importorskip("scipy.fft")
+    rng = np.random.default_rng(1)
+    u = rng.random((10, 14))
+    lam = diffusion_symbol(u.shape, 0.4, bc)
+    if bc == "periodic":
+        spec = np.fft.irfftn(np.fft.rfftn(u) * lam, s=u.shape, axes=(0, 1))
+    else:
+        spec = sp_fft.idctn(sp_fft.dctn(u, type=1) * lam, type=1)
+    np.testing.assert_allclose(spec, laplacian_nd(u, 0.4, bc), atol=1e-10)
+
+
+def test_planar_2d_front_matches_1d_speed():
+    one = run_sim(256, 50.0, 1.0, 0.25, 20.0, 0.2, 0, level=0.1, x0=-15.0, fit_frac=(0.6, 0.9))
+    two = run_sim_nd((256, 4), 50.0, 1.0, 0.25, 20.0, 0.2, 0, level=0.1, geometry="planar",
+                     x0=-15.0, fit_frac=(0.6, 0.9))
+    assert abs(two["c_meas"] - one["c_meas"]) < 5e-3
+
+
+def test_memmap_storage_matches_in_memory(tmp_path):
+    kw = dict(level=0.1, geometry="radial", R0=4.0, noise_amp=0.01)
+    mem = run_sim_nd((24, 24, 24), 24.0, 1.0, 0.25, 3.0, 0.2, 0, **kw)
+    disk = run_sim_nd((24, 24, 24), 24.0, 1.0, 0.25, 3.0, 0.2, 0, storage="memmap",
+                      scratch_dir=str(tmp_path), slab=5, **kw)
+    np.testing.assert_allclose(disk["rec_xf"], mem["rec_xf"], atol=1e-12)
+    np.testing.assert_allclose(disk["final_slice"], mem["final_slice"], atol=1e-12)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_slab_initialisation_matches_full_field():
+    coords = [(-0.5 * n + np.arange(n)) * 0.5 for n in (20, 12, 9)]
+    for geometry in ("planar", "radial"):
+        full = initial_front_nd(coords, geometry, -1.0, 3.0, 0.05, np.random.default_rng(1))
+        out = initial_front_nd(coords, geometry, -1.0, 3.0, 0.05, np.random.default_rng(1),
+                               out=np.zeros(full.shape), slab=3)
+        np.testing.assert_array_equal(out, full)
+
+
+def test_memmap_scratch_removed_when_allocation_fails(tmp_path, monkeypatch):
+    real_open = np.lib.format.open_memmap
+    calls = []
+
+    def open_once(*args, **kwargs):
+        calls.append(args[0])
+        if len(calls) == 2:
+            raise OSError("disk full")
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(np.lib.format, "open_memmap", open_once)
+    with pytest.raises(OSError, match="disk full"):
+        run_sim_nd((16, 16), 16.0, 1.0, 0.25, 1.0, 0.2, 0, storage="memmap", scratch_dir=str(tmp_path))
+    assert len(calls) == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_radial_front_expands_below_planar_speed():
+    data = run_sim_nd((128, 128), 64.0, 1.0, 0.25, 24.0, 0.2, 0, level=0.1,
+                      geometry="radial", scheme="spectral", bc="periodic", R0=6.0)
+    assert data["r2"] > 0.99
+    assert data["rec_xf"][-1] > data["rec_xf"][0] + 10.0
+    assert data["c_th_curv"] < data["c_th"]
+
+
+def test_default_radial_run_passes_the_radial_gate():
+    data = run_sim_nd((256, 256), 100.0, 1.0, 0.25, 60.0, 0.2, 42, geometry="radial",
+                      scheme="spectral", bc="periodic")
+    assert data["rel_err"] > 0.05  # planar c_th is the wrong reference at this radius
+    assert data["c_th_radial"] < data["c_th_curv"] < data["c_th"]
+    assert data["rel_err_radial"] < 0.05
+    assert passes_acceptance_nd(data)
+    assert 0.7 * data["c_th"] < data["c_meas"] < data["c_th"]
@@ -0,0 +1,49 @@
+import numpy as np
+
+from src.reaction_diffusion.robust_fit import robust_linear_fit_batch
+
+
+def _reference_fit(t, y, smooth_win, mad_k=3.0, max_iter=3):
+    """Per-series polyfit recipe the batched fitter reproduces."""
+    n = t.size
+    if smooth_win % 2 == 0:
+        smooth_win += 1
+    y_s = np.convolve(y, np.ones(smooth_win) / smooth_win, mode="same") if n >= smooth_win else y.copy()
+    mask = np.isfinite(y_s)
+    a = b = float("nan")
+    for _ in range(max_iter):
+        if mask.sum() < 2:
+            break
+        a, b = np.polyfit(t[mask], y_s[mask], 1)
+        resid = y_s - (a * t + b)
+        mad = np.median(np.abs(resid[mask])) + 1e-12
+        new_mask = np.isfinite(y_s) & (np.abs(resid) <= mad_k * mad)
+        if new_mask.sum() < max(5, int(0.2 * n)) or np.array_equal(new_mask, mask):
+            break
+        mask = new_mask
+    pred = a * t[mask] + b
+    r2 = 1.0 - np.sum((y_s[mask] - pred) ** 2) / (np.sum((y_s[mask] - y_s[mask].mean()) ** 2) + 1e-12)
+    return a, r2
+
+
+def test_batch_matches_per_series_recipe_on_ragged_rows():
+    rng = np.random.default_rng(1)
+    K, T = 200, 50
+    t = np.linspace(0.0, 4.0, T)
+    Y = rng.normal(size=(K, 1)) * t + rng.normal(size=(K, 1)) + rng.normal(scale=0.05, size=(K, T))
+    Y[rng.random((K, T)) < 0.05] += 2.0  # outliers for the MAD stage
+    lengths = rng.integers(8, T + 1, size=K)
+    for win in (5, 7):
+        a, r2 = robust_linear_fit_batch(t, Y, lengths, smooth_win=win)
+        ref = np.array([_reference_fit(t[:n], Y[k, :n], win) for k, n in enumerate(lengths)])
+        np.testing.assert_allclose(a, ref[:, 0], rtol=0, atol=1e-10)
+        np.testing.assert_allclose(r2, ref[:, 1], rtol=0, atol=1e-10)
+
+
+def test_batch_handles_short_and_nonfinite_rows():
+    t = np.arange(6.0)
+    Y = np.vstack([2.0 * t + 1.0, np.full(6, np.nan), t])
+    a, r2 = robust_linear_fit_batch(t, Y, lengths=[6, 6, 1], smooth_win=1)
+    assert np.isclose(a[0], 2.0) and np.isclose(r2[0], 1.0)
+    assert np.isnan(a[1]) and np.isnan(r2[1])
+    assert np.isnan(a[2]) and np.isnan(r2[2])
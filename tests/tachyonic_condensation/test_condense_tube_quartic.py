@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+from scipy import integrate
+
+from src.tachyonic_condensation import condense_tube as ct
+from src.tachyonic_condensation import cylinder_modes as cm
+
+
+@pytest.mark.parametrize("ell,R,kappa", [(0, 0.3, 0.5), (3, 1.0, 0.9), (12, 1.0, 0.1), (6, 20.0, 0.5)])
+def test_radial_integral_matches_adaptive_quad(ell, R, kappa):
+    root = {"ell": ell, "k_in": np.sqrt(1.0 - kappa ** 2), "k_out": np.sqrt(kappa ** 2 + 2.0)}
+    u = cm.mode_functions(R, root)["u"]
+
+    def f(r):
+        return r * u(r) ** 4
+
+    ref = (integrate.quad(f, 0.0, R, epsabs=0.0, epsrel=1e-13, limit=500)[0]
+           + integrate.quad(f, R, np.inf, epsabs=0.0, epsrel=1e-13, limit=500)[0])
+    assert ct._radial_integral_u4(R, u) == pytest.approx(ref, rel=1e-11)
+
+
+def test_gauss_legendre_adaptive_resolves_a_sharp_peak():
+    # e^{40 (x - 1)} on [0, 1]: all the mass sits in the last few percent of the interval
+    got = ct._gauss_legendre_adaptive(lambda x: np.exp(40.0 * (x - 1.0)), 0.0, 1.0)
+    assert got == pytest.approx((1.0 - np.exp(-40.0)) / 40.0, rel=1e-13)
+
+
+def _modes(R, mu, ell_max):
+    modes = ct.compute_modes_for_R(R, mu, ell_max=ell_max)
+    assert len(modes) >= 3
+    return modes
+
+
+def test_quartic_tensor_entries_and_selection_rule():
+    R = 1.0
+    modes = _modes(R, 1.0, 12)
+    T = ct.quartic_unit_tensor(R, modes)
+    ells = [m.ell for m in modes]
+    us = [cm.mode_functions(R, {"ell": m.ell, "k_in": m.k_in, "k_out": m.k_out})["u"] for m in modes]
+
+    assert np.allclose(T, T.transpose(1, 0, 2, 3)) and np.allclose(T, T.transpose(2, 3, 0, 1))
+    for a, m in enumerate(modes):
+        assert T[a, a, a, a] == pytest.approx(ct._radial_integral_u4(R, us[a]), rel=1e-10)
+
+    # (a, b, c, d) with ℓa+ℓb = ℓc+ℓd holds for one of its three pairings -> weight 1/3
+    a, b, c, d = 0, 2, 1, 1
+    assert ells[a] + ells[b] == ells[c] + ells[d]
+
+    def f(r):
+        return r * us[a](r) * us[b](r) * us[c](r) * us[d](r)
+
+    ref = (integrate.quad(f, 0.0, R, epsabs=0.0, epsrel=1e-13)[0]
+           + integrate.quad(f, R, np.inf, epsabs=0.0, epsrel=1e-13)[0])
+    assert T[a, b, c, d] == pytest.approx(ref / 3.0, rel=1e-10)
+    # ℓ-sum mismatch in every pairing: forbidden
+    assert T[0, 0, 0, 1] == 0.0 and T[0, 1, 1, 1] == 0.0
+
+
+def test_quartic_potential_derivatives_match_finite_differences():
+    rng = np.random.default_rng(0)
+    M = 4
+    N4 = rng.normal(size=(M, M, M, M))
+    N4 = sum(N4.transpose(p) for p in itertools.permutations(range(4))) / 24.0
+    m2 = rng.normal(size=M)
+    v = rng.normal(size=M)
+    V, g, H = ct.quartic_potential(v, m2, N4)
+    h = 1e-6
+    eye = np.eye(M)
+    g_fd = np.array([(ct.quartic_potential(v + h * e, m2, N4)[0] - ct.quartic_potential(v - h * e, m2, N4)[0]) / (2 * h) for e in eye])
+    H_fd = np.array([(ct.quartic_potential(v + h * e, m2, N4)[1] - ct.quartic_potential(v - h * e, m2, N4)[1]) / (2 * h) for e in eye])
+    assert np.allclose(g, g_fd, rtol=1e-6, atol=1e-8)
+    assert np.allclose(H, H_fd, rtol=1e-6, atol=1e-8)
+
+
+def test_coupled_solver_reduces_to_diagonal_baseline():
+    R = 1.0
+    modes = _modes(R, 1.0, 12)
+    N4_diag = ct.build_quartic_diagonal(R, modes, lam=0.5, c=1.0)
+    N4 = np.zeros((len(modes),) * 4)
+    for a, m in enumerate(modes):
+        N4[a, a, a, a] = N4_diag[m.ell]
+    # start away from the baseline so Newton has work to do
+    v_diag = ct.find_condensate_diagonal(R, modes, N4_diag, c=1.0)
+    sol = ct.find_condensate_coupled(modes, N4, c=1.0, v0=np.array([1.3 * v_diag[m.ell] for m in modes]))
+    assert sol["converged"]
+    assert np.allclose(sol["v"], [v_diag[m.ell] for m in modes], rtol=1e-10)
+    M2 = ct.mass_matrix_coupled(modes, N4, sol["v"], c=1.0)
+    M2_diag = ct.mass_matrix_diagonal(modes, N4_diag, v_diag, c=1.0)
+    assert np.allclose(M2, np.diag([M2_diag[m.ell] for m in modes]), rtol=1e-9, atol=1e-12)
+
+
+def test_coupled_condensate_at_ell_max_12_is_a_minimum():
+    sol = ct.condense_coupled_for_R(10.0, mu=2.0, lam=0.5, ell_max=12)
+    assert sol is not None and sol["converged"]
+    assert len(sol["ell"]) == 13
+    assert sol["grad_norm"] <= 1e-10
+    assert np.allclose(sol["M2"], sol["M2"].T)
+    assert sol["M2_eigs"].min() > 0.0
+    # off-diagonal overlaps only add positive quartic weight here: the coupled minimum lies above
+    modes = ct.compute_modes_for_R(10.0, 2.0, ell_max=12)
+    N4_diag = ct.build_quartic_diagonal(10.0, modes, lam=0.5, c=1.0)
+    v_diag = ct.find_condensate_diagonal(10.0, modes, N4_diag, c=1.0)
+    assert sol["V"] > ct.tube_energy_diagonal(modes, N4_diag, v_diag, c=1.0)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+from src.tachyonic_condensation import condense_tube as ct
+
+R_GRID = np.array([0.5, 0.8, 1.2])
+
+
+def _E_bg(R):
+    return 2.0 * np.pi * 0.1 * R + 0.5 / R
+
+
+def test_parallel_scan_matches_serial_scan(tmp_path):
+    ref = ct.energy_scan(R_GRID, mu=1.0, lam=0.5, ell_max=12, E_bg=_E_bg)
+    got = ct.energy_scan_parallel(R_GRID, mu=1.0, lam=0.5, ell_max=12, E_bg=_E_bg,
+                                  workers=2, cache_dir=tmp_path)
+    assert np.isfinite(ref["E"]).all()
+    assert np.array_equal(got["E"], ref["E"])
+    assert got["min_R"] == ref["min_R"]
+    assert len(list(tmp_path.glob("tube_modes_*.npz"))) == R_GRID.size
+
+
+def test_cached_rescan_with_new_lambda_skips_mode_solves(tmp_path, monkeypatch):
+    ct.energy_scan_parallel(R_GRID, mu=1.0, lam=0.5, ell_max=12, workers=1, cache_dir=tmp_path)
+
+    def _no_solve(*args, **kwargs):
+        raise AssertionError("mode data should come from the cache")
+
+    monkeypatch.setattr(ct, "compute_kappas", _no_solve)
+    got = ct.energy_scan_parallel(R_GRID, mu=1.0, lam=0.9, ell_max=12, E_bg=_E_bg,
+                                  workers=1, cache_dir=tmp_path)
+    monkeypatch.undo()
+    ref = ct.energy_scan(R_GRID, mu=1.0, lam=0.9, ell_max=12, E_bg=_E_bg)
+    assert np.array_equal(got["E"], ref["E"])
+
+    # the key covers every solve parameter
+    keys = {ct.mode_cache_path(tmp_path, 0.5, 1.0, 1.0, 12, 1e-8),
+            ct.mode_cache_path(tmp_path, 0.5, 1.0, 1.0, 12, 1e-9),
+            ct.mode_cache_path(tmp_path, 0.5, 1.0, 1.0, 11, 1e-8),
+            ct.mode_cache_path(tmp_path, 0.5, 1.0, 0.9, 12, 1e-8),
+            ct.mode_cache_path(tmp_path, 0.5, 1.1, 1.0, 12, 1e-8),
+            ct.mode_cache_path(tmp_path, np.nextafter(0.5, 1.0), 1.0, 1.0, 12, 1e-8),
+            ct.mode_cache_path(tmp_path, 0.5, 1.0, 1.0, 12, 1e-8, solver="track")}
+    assert len(keys) == 7
+
+
+def test_continuation_scan_matches_independent_solves(tmp_path):
+    R_grid = np.linspace(0.5, 1.5, 12)
+    ref = ct.energy_scan_parallel(R_grid, mu=1.0, lam=0.5, ell_max=12, E_bg=_E_bg, workers=1)
+    got = ct.energy_scan_parallel(R_grid, mu=1.0, lam=0.5, ell_max=12, E_bg=_E_bg,
+                                  workers=2, cache_dir=tmp_path, continuation=True)
+    assert np.isfinite(ref["E"]).all()
+    assert np.allclose(got["E"], ref["E"], rtol=1e-6, atol=0.0)
+    assert len(list(tmp_path.glob("tube_modes_*.npz"))) == R_grid.size
+    for R in R_grid:
+        assert ct.mode_cache_path(tmp_path, R, 1.0, 1.0, 12, 1e-8, solver="track").is_file()
+        assert not ct.mode_cache_path(tmp_path, R, 1.0, 1.0, 12, 1e-8).is_file()
+
+    # an independent scan never reads tracked roots: it solves and fills its own entries
+    again = ct.energy_scan_parallel(R_grid, mu=1.0, lam=0.5, ell_max=12, E_bg=_E_bg,
+                                    workers=1, cache_dir=tmp_path)
+    assert np.array_equal(again["E"], ref["E"])
+    assert len(list(tmp_path.glob("tube_modes_*.npz"))) == 2 * R_grid.size
+
+
+def test_mode_data_table_keeps_grid_order(tmp_path):
+    table = ct.mode_data_table(R_GRID[::-1], mu=1.0, ell_max=12, workers=2, cache_dir=tmp_path)
+    assert len(table) == R_GRID.size
+    for R, data in zip(R_GRID[::-1], table):
+        ref = ct.mode_data_for_R(float(R), mu=1.0, ell_max=12)
+        assert data.keys() == ref.keys()
+        for key in ref:
+            assert np.array_equal(data[key], ref[key])
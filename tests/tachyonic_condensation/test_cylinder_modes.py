@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+from scipy import optimize, special
+
+from src.tachyonic_condensation import cylinder_modes as cm
+
+
+def _secular_direct(kappa, ell, R, mu, c):
+    """Unscaled textbook form; reliable for moderate arguments."""
+    k_in = np.sqrt((mu / c) ** 2 - kappa ** 2)
+    k_out = np.sqrt(kappa ** 2 + 2.0 * (mu / c) ** 2)
+    x_in, x_out = k_in * R, k_out * R
+    return (k_in / k_out) * special.ivp(ell, x_in) / special.iv(ell, x_in) + special.kvp(ell, x_out) / special.kv(ell, x_out)
+
+
+def _roots_pointwise(ell, R, mu, c, num_brackets, tol=1e-8):
+    """Reference bracket scan: one scalar evaluation per grid node."""
+    grid = cm._kappa_grid(mu, c, None, num_brackets)
+    f = [cm._secular_value(x, ell, R, mu, c) for x in grid]
+    roots = []
+    for i in range(len(grid) - 1):
+        f0, f1 = f[i], f[i + 1]
+        if not (np.isfinite(f0) and np.isfinite(f1)):
+            continue
+        if f0 == 0.0:
+            root = grid[i]
+        elif f1 == 0.0:
+            root = grid[i + 1]
+        elif np.sign(f0) == np.sign(f1):
+            continue
+        else:
+            root = optimize.brentq(cm._secular_value, grid[i], grid[i + 1], args=(ell, R, mu, c), xtol=tol, rtol=tol, maxiter=200)
+        if not roots or abs(root - roots[-1]) > 1e-6:
+            roots.append(root)
+    return roots
+
+
+def test_vectorized_secular_matches_textbook_form():
+    kappa = np.linspace(0.05, 0.95, 37)
+    ells = np.arange(0, 6)
+    F = cm.secular_values(kappa, ells, 2.0, 1.0, 1.0)
+    assert F.shape == (ells.size, kappa.size)
+    ref = np.array([[_secular_direct(k, ell, 2.0, 1.0, 1.0) for k in kappa] for ell in ells])
+    assert np.allclose(F, ref, rtol=1e-9, atol=0.0)
+
+    # out-of-domain κ (κ ≥ μ/c or κ ≤ 0) is NaN, not an error
+    assert np.isnan(cm.secular_values([0.0, 1.0, 1.5], [0], 2.0, 1.0, 1.0)).all()
+
+
+@pytest.mark.parametrize("R,mu,c", [(0.5, 1.0, 1.0), (3.0, 0.5, 0.7), (20.0, 1.0, 1.0)])
+def test_scalar_and_grid_evaluators_agree(R, mu, c):
+    grid = cm._kappa_grid(mu, c, None, 64)
+    F = cm.secular_values(grid, range(13), R, mu, c)
+    S = np.array([[cm._secular_value(k, ell, R, mu, c) for k in grid] for ell in range(13)])
+    assert np.allclose(F, S, rtol=1e-12, atol=0.0, equal_nan=True)
+
+
+@pytest.mark.parametrize("R,mu", [(0.5, 1.0), (1.0, 2.0), (10.0, 2.0)])
+def test_compute_kappas_matches_pointwise_scan(R, mu):
+    got = cm.compute_kappas(R, mu, ell_max=12, num_brackets=128)
+    want = [(ell, k) for ell in range(13) for k in _roots_pointwise(ell, R, mu, 1.0, 128)]
+    assert want
+    assert [int(d["ell"]) for d in got] == [ell for ell, _ in want]
+    assert np.allclose([d["kappa"] for d in got], [k for _, k in want], rtol=0.0, atol=1e-10)
+    for d in got:
+        assert d["k_in"] ** 2 + d["kappa"] ** 2 == pytest.approx(mu ** 2)
+
+
+@pytest.mark.parametrize("mu,c,R_grid", [(1.0, 1.0, np.linspace(0.3, 3.0, 120)),
+                                          (1.0, 0.7, np.linspace(0.3, 25.0, 160))])
+def test_continuation_tracks_independent_solves(mu, c, R_grid):
+    stats = {}
+    tracked = cm.track_kappas(R_grid, mu, c=c, ell_max=12, num_brackets=256, stats=stats)
+    assert len(tracked) == R_grid.size
+    n_roots = 0
+    for R, got in zip(R_grid, tracked):
+        want = cm.compute_kappas(R, mu, c=c, ell_max=12, num_brackets=256)
+        assert [d["ell"] for d in got] == [d["ell"] for d in want]
+        assert np.allclose([d["kappa"] for d in got], [d["kappa"] for d in want], rtol=0.0, atol=1e-7)
+        n_roots += len(want)
+    assert n_roots > R_grid.size
+    # full bracket scans only at the start, on periodic rescans and where roots appear/vanish
+    assert stats["full_scans"] < 0.5 * 13 * R_grid.size
+    assert stats["tracked"] > 0
+
+
+def test_mode_functions_accept_arrays():
+    R, kappa = 2.0, 0.6
+    root = {"ell": 3.0, "k_in": np.sqrt(1.0 - kappa ** 2), "k_out": np.sqrt(kappa ** 2 + 2.0)}
+    fns = cm.mode_functions(R, root)
+    r = np.array([[0.0, 0.5, 1.0], [2.0, 3.0, 40.0]])
+    u = fns["u"](r)
+    assert u.shape == r.shape
+    # textbook unscaled form where it does not under/overflow
+    want_in = special.iv(3, root["k_in"] * r[0]) / special.iv(3, root["k_in"] * R)
+    want_out = special.kv(3, root["k_out"] * r[1]) / special.kv(3, root["k_out"] * R)
+    assert np.allclose(u[0], want_in, rtol=1e-12, atol=1e-30)  # r = 0 is clamped to ε
+    assert np.allclose(u[1], want_out, rtol=1e-12, atol=1e-300)
+    assert isinstance(fns["u"](R), float) and fns["u"](R) == pytest.approx(1.0)
+    assert fns["u_out"](R) == pytest.approx(1.0)
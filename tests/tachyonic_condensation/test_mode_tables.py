@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+from src.tachyonic_condensation import condense_tube as ct
+from src.tachyonic_condensation import cylinder_modes as cm
+from src.tachyonic_condensation import mode_tables as mt
+
+
+def _root(ell, kappa, mu=1.0):
+    return {"ell": float(ell), "k_in": np.sqrt(mu ** 2 - kappa ** 2), "k_out": np.sqrt(kappa ** 2 + 2.0 * mu ** 2)}
+
+
+@pytest.mark.parametrize("ell,R,kappa", [(0, 0.3, 0.5), (3, 1.0, 0.1), (12, 5.0, 0.9), (1, 20.0, 0.5)])
+def test_table_matches_direct_within_its_error_bound(ell, R, kappa):
+    table = mt.ModeTable(R, ell, _root(ell, kappa)["k_in"], _root(ell, kappa)["k_out"])
+    assert table.error_bound < 1e-12
+    u_tab = table.functions()
+    u_dir = cm.mode_functions(R, _root(ell, kappa))
+    r = np.linspace(0.0, 1.2 * table.r_cut, 5001)
+    for name in ("u", "u_in", "u_out"):
+        sel = r <= R if name == "u_in" else (r >= R if name == "u_out" else slice(None))
+        err = np.max(np.abs(u_tab[name](r[sel]) - u_dir[name](r[sel])))
+        assert err <= 2.0 * table.error_bound + 1e-15
+    # nodes, panel edges and scalars go through the same convention as mode_functions
+    assert u_tab["u"](table.edges).shape == table.edges.shape
+    assert isinstance(u_tab["u"](R), float) and u_tab["u"](R) == pytest.approx(1.0, abs=1e-13)
+
+
+def test_tables_are_cached_by_mode_and_radius():
+    mt.clear_mode_tables()
+    root = _root(2, 0.4)
+    first = mt.mode_table(1.0, root)
+    assert mt.mode_table(1.0, dict(root)) is first
+    assert mt.mode_table(1.5, root) is not first
+    assert mt._cached_table.cache_info().hits == 1
+    mt.clear_mode_tables()
+    assert mt._cached_table.cache_info().currsize == 0
+
+
+def test_tabulated_overlaps_match_direct():
+    R = 1.0
+    modes = ct.compute_modes_for_R(R, 1.0, ell_max=12)
+    direct = ct.quartic_unit_tensor(R, modes)
+    tabulated = ct.quartic_unit_tensor(R, modes, tabulated=True)
+    assert np.allclose(tabulated, direct, rtol=1e-10, atol=0.0)
+    I4 = ct.quartic_unit_integrals(R, modes, tabulated=True)
+    assert all(I4[m.ell] == pytest.approx(direct[a, a, a, a], rel=1e-10) for a, m in enumerate(modes))
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Entry points spawned by sweeps and pool workers; importing them must stay light.
+ENTRY_MODULES = [
+    "src.reaction_diffusion.rd_front_speed_experiment",
+    "src.reaction_diffusion.rd_dispersion_experiment",
+    "src.reaction_diffusion.rd_nd_engine",
+    "src.conservation_law.qfum_validate",
+    "src.memory_steering.memory_steering_acceptance",
+    "src.fluid_dynamics.taylor_green_benchmark",
+    "src.fluid_dynamics.lid_cavity_benchmark",
+    "src.tachyonic_condensation.cylinder_modes",
+]
+HEAVY_MODULES = ["matplotlib", "matplotlib.pyplot", "scipy"]
+# Seconds on top of numpy; pyplot alone costs several times this.
+IMPORT_BUDGET_S = 0.25
+
+_PROBE = """
+import importlib, json, sys, time
+import numpy
+t0 = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - t0
+print(json.dumps({"elapsed": elapsed, "loaded": [m for m in sys.argv[2:] if m in sys.modules]}))
+"""
+
+
+def _probe(module: str, *watch: str) -> dict:
+    env = dict(os.environ)
+    # the fluid benchmarks import `common.io_paths`, so src/ is on the path as well
+    env["PYTHONPATH"] = os.pathsep.join([str(PROJECT_ROOT), str(PROJECT_ROOT / "src")])
+    env.pop("VDM_CLASSIFIED_PLUGIN", None)
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, module, *watch],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", ENTRY_MODULES)
+def test_entry_module_import_is_light(module: str):
+    result = _probe(module, *HEAVY_MODULES)
+    assert result["loaded"] == [], f"{module} imports {result['loaded']} at module load"
+    assert result["elapsed"] <= IMPORT_BUDGET_S, f"{module} import took {result['elapsed']:.3f}s"
+
+
+def test_vdm_import_defers_kernel_discovery():
+    result = _probe("vdm", "vdm.void_dynamics", "vdm.memory_steering")
+    assert result["loaded"] == []
+
+    import vdm
+    import vdm.void_dynamics as vd
+
+    # re-exports resolve on first access and run the discovery only once
+    assert vdm.universal_void_dynamics is vd.universal_void_dynamics
+    assert vdm.VOID_SOURCE.startswith("placeholder")
+    assert vd._impl.cache_info().misses == 1
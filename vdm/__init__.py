@@ -1,28 +1,51 @@
 from __future__ import annotations
 
-from .void_dynamics import (
-    CLASSIFIED_MESSAGE as VOID_CLASSIFIED_MESSAGE,
-    HAS_CLASSIFIED_IMPL as HAS_CLASSIFIED_VOID_IMPL,
-    VOID_SOURCE,
-    VoidDebtModulation,
-    ensure_classified_void_kernel,
-    universal_void_dynamics,
-)
-from .memory_steering import (
-    CLASSIFIED_MESSAGE as MEMORY_CLASSIFIED_MESSAGE,
-    HAS_CLASSIFIED_IMPL as HAS_CLASSIFIED_MEMORY_IMPL,
-    MEMORY_SOURCE,
-    build_graph_laplacian,
-    collect_junction_choices,
-    compute_dimensionless_groups,
-    ensure_classified_memory_kernel,
-    sample_next_neighbor,
-    sample_next_neighbor_heading,
-    transition_probs,
-    transition_probs_temp,
-    update_memory,
-    y_junction_adjacency,
-)
+import importlib
+
+# Public name -> (submodule, attribute). Resolved on first access so `import vdm` does
+# not run the classified-kernel discovery (or import numpy) until a kernel is used.
+_EXPORTS = {
+    "VOID_CLASSIFIED_MESSAGE": ("void_dynamics", "CLASSIFIED_MESSAGE"),
+    "HAS_CLASSIFIED_VOID_IMPL": ("void_dynamics", "HAS_CLASSIFIED_IMPL"),
+    "VOID_SOURCE": ("void_dynamics", "VOID_SOURCE"),
+    "VoidDebtModulation": ("void_dynamics", "VoidDebtModulation"),
+    "ensure_classified_void_kernel": ("void_dynamics", "ensure_classified_void_kernel"),
+    "universal_void_dynamics": ("void_dynamics", "universal_void_dynamics"),
+    "MEMORY_CLASSIFIED_MESSAGE": ("memory_steering", "CLASSIFIED_MESSAGE"),
+    "HAS_CLASSIFIED_MEMORY_IMPL": ("memory_steering", "HAS_CLASSIFIED_IMPL"),
+    "MEMORY_SOURCE": ("memory_steering", "MEMORY_SOURCE"),
+    "adjacency_to_csr": ("memory_steering", "adjacency_to_csr"),
+    "build_graph_laplacian": ("memory_steering", "build_graph_laplacian"),
+    "collect_junction_choices": ("memory_steering", "collect_junction_choices"),
+    "collect_junction_choices_batch": ("memory_steering", "collect_junction_choices_batch"),
+    "compute_dimensionless_groups": ("memory_steering", "compute_dimensionless_groups"),
+    "edge_unit_directions": ("memory_steering", "edge_unit_directions"),
+    "ensure_classified_memory_kernel": ("memory_steering", "ensure_classified_memory_kernel"),
+    "sample_next_neighbor": ("memory_steering", "sample_next_neighbor"),
+    "sample_next_neighbor_batch": ("memory_steering", "sample_next_neighbor_batch"),
+    "sample_next_neighbor_heading": ("memory_steering", "sample_next_neighbor_heading"),
+    "sample_next_neighbor_heading_batch": ("memory_steering", "sample_next_neighbor_heading_batch"),
+    "transition_probs": ("memory_steering", "transition_probs"),
+    "transition_probs_batch": ("memory_steering", "transition_probs_batch"),
+    "transition_probs_temp": ("memory_steering", "transition_probs_temp"),
+    "update_memory": ("memory_steering", "update_memory"),
+    "y_junction_adjacency": ("memory_steering", "y_junction_adjacency"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "HAS_CLASSIFIED_MEMORY_IMPL",
@@ -32,14 +55,20 @@ __all__ = [
     "VOID_CLASSIFIED_MESSAGE",
     "VOID_SOURCE",
     "VoidDebtModulation",
+    "adjacency_to_csr",
     "build_graph_laplacian",
     "collect_junction_choices",
+    "collect_junction_choices_batch",
     "compute_dimensionless_groups",
+    "edge_unit_directions",
     "ensure_classified_memory_kernel",
     "ensure_classified_void_kernel",
     "sample_next_neighbor",
+    "sample_next_neighbor_batch",
     "sample_next_neighbor_heading",
+    "sample_next_neighbor_heading_batch",
     "transition_probs",
+    "transition_probs_batch",
     "transition_probs_temp",
     "universal_void_dynamics",
     "update_memory",
@@ -17,12 +17,18 @@ def _load_public_reference():
 
 _PUBLIC = _load_public_reference()
 
+adjacency_to_csr = getattr(_PUBLIC, "adjacency_to_csr")
 build_graph_laplacian = getattr(_PUBLIC, "build_graph_laplacian")
 collect_junction_choices = getattr(_PUBLIC, "collect_junction_choices")
+collect_junction_choices_batch = getattr(_PUBLIC, "collect_junction_choices_batch")
 compute_dimensionless_groups = getattr(_PUBLIC, "compute_dimensionless_groups")
+edge_unit_directions = getattr(_PUBLIC, "edge_unit_directions")
 sample_next_neighbor = getattr(_PUBLIC, "sample_next_neighbor")
+sample_next_neighbor_batch = getattr(_PUBLIC, "sample_next_neighbor_batch")
 sample_next_neighbor_heading = getattr(_PUBLIC, "sample_next_neighbor_heading")
+sample_next_neighbor_heading_batch = getattr(_PUBLIC, "sample_next_neighbor_heading_batch")
 transition_probs = getattr(_PUBLIC, "transition_probs")
+transition_probs_batch = getattr(_PUBLIC, "transition_probs_batch")
 transition_probs_temp = getattr(_PUBLIC, "transition_probs_temp")
 update_memory = getattr(_PUBLIC, "update_memory")
 y_junction_adjacency = getattr(_PUBLIC, "y_junction_adjacency")
@@ -38,12 +44,18 @@ __all__ = [
     "CLASSIFIED_MESSAGE",
     "HAS_CLASSIFIED_IMPL",
     "MEMORY_SOURCE",
+    "adjacency_to_csr",
     "build_graph_laplacian",
     "collect_junction_choices",
+    "collect_junction_choices_batch",
     "compute_dimensionless_groups",
+    "edge_unit_directions",
     "sample_next_neighbor",
+    "sample_next_neighbor_batch",
     "sample_next_neighbor_heading",
+    "sample_next_neighbor_heading_batch",
     "transition_probs",
+    "transition_probs_batch",
     "transition_probs_temp",
     "update_memory",
     "y_junction_adjacency",
@@ -4,6 +4,7 @@ import importlib
 import importlib.util
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from types import ModuleType
 from typing import Any, Tuple
@@ -64,21 +65,69 @@ def _load_impl() -> Tuple[ModuleType, str, bool]:
     return placeholder, source, has_impl
 
 
-_IMPL, MEMORY_SOURCE, HAS_CLASSIFIED_IMPL = _load_impl()
+@lru_cache(maxsize=None)
+def _impl() -> Tuple[ModuleType, str, bool]:
+    """Run the kernel discovery once, on first access to a kernel attribute."""
+    return _load_impl()
 
-build_graph_laplacian = getattr(_IMPL, "build_graph_laplacian")
-collect_junction_choices = getattr(_IMPL, "collect_junction_choices")
-compute_dimensionless_groups = getattr(_IMPL, "compute_dimensionless_groups")
-sample_next_neighbor = getattr(_IMPL, "sample_next_neighbor")
-sample_next_neighbor_heading = getattr(_IMPL, "sample_next_neighbor_heading")
-transition_probs = getattr(_IMPL, "transition_probs")
-transition_probs_temp = getattr(_IMPL, "transition_probs_temp")
-update_memory = getattr(_IMPL, "update_memory")
-y_junction_adjacency = getattr(_IMPL, "y_junction_adjacency")
+
+def _resolve(name: str) -> Any:
+    """Fetch ``name`` from the active kernel, falling back to the public reference.
+
+    Used for primitives added after the classified kernels were frozen, so older
+    private builds keep working with newer experiment scripts.
+    """
+    attr = getattr(_impl()[0], name, None)
+    if attr is None:
+        attr = getattr(importlib.import_module(_PLACEHOLDER_MODULE), name)
+    return attr
+
+
+# Required on every kernel.
+_KERNEL_ATTRS = (
+    "build_graph_laplacian",
+    "collect_junction_choices",
+    "compute_dimensionless_groups",
+    "sample_next_neighbor",
+    "sample_next_neighbor_heading",
+    "transition_probs",
+    "transition_probs_temp",
+    "update_memory",
+    "y_junction_adjacency",
+)
+# Resolved through _resolve (public fallback).
+_FALLBACK_ATTRS = (
+    "adjacency_to_csr",
+    "collect_junction_choices_batch",
+    "edge_unit_directions",
+    "sample_next_neighbor_batch",
+    "sample_next_neighbor_heading_batch",
+    "transition_probs_batch",
+)
+
+
+def __getattr__(name: str) -> Any:
+    # Kernel symbols resolve lazily so importing vdm does not probe the candidate files.
+    if name == "MEMORY_SOURCE":
+        value = _impl()[1]
+    elif name == "HAS_CLASSIFIED_IMPL":
+        value = _impl()[2]
+    elif name in _KERNEL_ATTRS:
+        value = getattr(_impl()[0], name)
+    elif name in _FALLBACK_ATTRS:
+        value = _resolve(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 def ensure_classified_memory_kernel() -> None:
-    if not HAS_CLASSIFIED_IMPL:
+    if not _impl()[2]:
         raise ImportError(CLASSIFIED_MESSAGE)
 
 
@@ -86,13 +135,19 @@ __all__ = [
     "CLASSIFIED_MESSAGE",
     "HAS_CLASSIFIED_IMPL",
     "MEMORY_SOURCE",
+    "adjacency_to_csr",
     "build_graph_laplacian",
     "collect_junction_choices",
+    "collect_junction_choices_batch",
     "compute_dimensionless_groups",
+    "edge_unit_directions",
     "ensure_classified_memory_kernel",
     "sample_next_neighbor",
+    "sample_next_neighbor_batch",
     "sample_next_neighbor_heading",
+    "sample_next_neighbor_heading_batch",
     "transition_probs",
+    "transition_probs_batch",
     "transition_probs_temp",
     "update_memory",
     "y_junction_adjacency",
@@ -4,6 +4,7 @@ import importlib
 import importlib.util
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from types import ModuleType
 from typing import Tuple
@@ -90,14 +91,35 @@ def _load_impl() -> Tuple[ModuleType, str, bool]:
     return placeholder, source, getattr(placeholder, "HAS_CLASSIFIED_IMPL", False)
 
 
-_IMPL, VOID_SOURCE, HAS_CLASSIFIED_IMPL = _load_impl()
+@lru_cache(maxsize=None)
+def _impl() -> Tuple[ModuleType, str, bool]:
+    """Run the kernel discovery once, on first access to a kernel attribute."""
+    return _load_impl()
 
-universal_void_dynamics = getattr(_IMPL, "universal_void_dynamics")
-VoidDebtModulation = getattr(_IMPL, "VoidDebtModulation")
+
+_KERNEL_ATTRS = ("universal_void_dynamics", "VoidDebtModulation")
+
+
+def __getattr__(name: str):
+    # Kernel symbols resolve lazily so importing vdm does not probe the candidate files.
+    if name == "VOID_SOURCE":
+        value = _impl()[1]
+    elif name == "HAS_CLASSIFIED_IMPL":
+        value = _impl()[2]
+    elif name in _KERNEL_ATTRS:
+        value = getattr(_impl()[0], name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 def ensure_classified_void_kernel() -> None:
-    if not HAS_CLASSIFIED_IMPL:
+    if not _impl()[2]:
         raise ImportError(CLASSIFIED_MESSAGE)
 
 
@@ -218,7 +218,12 @@ def grid_neighbors(nx: int, ny: int, i: int) -> List[int]:
 # 1) Junction logistic collapse
 # ---------------------------
 
-def run_junction_logistic(theta: float = 2.0, delta_m_values: Sequence[float] = None, trials: int = 2000) -> Tuple[np.ndarray, np.ndarray]:
+def run_junction_logistic(
+    theta: float = 2.0,
+    delta_m_values: Sequence[float] = None,
+    trials: int = 2000,
+    method: str = "binomial",
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Junction logistic collapse: P(A) ≈ σ(Θ Δm)
 
@@ -234,6 +239,8 @@ def run_junction_logistic(theta: float = 2.0, delta_m_values: Sequence[float] =
         theta: Θ (dimensionless steering strength)
         delta_m_values: sweep of Δm values in m‑units (dimensionless)
         trials: Bernoulli samples for P(A) estimation
+        method: "binomial" (default) computes P(A) once per Δm and draws the whole sweep with a
+            single rng.binomial call; "loop" reproduces the historical per-trial sampler.
 
     Returns:
         x: array of Θ Δm (abscissa of the collapse)
@@ -245,6 +252,17 @@ def run_junction_logistic(theta: float = 2.0, delta_m_values: Sequence[float] =
     N = A.shape[0]
     rng = np.random.default_rng(123)
     m = np.zeros(N, dtype=np.float64)
+    if method == "binomial":
+        d = np.asarray(delta_m_values, dtype=np.float64)
+        p = np.empty(d.size, dtype=np.float64)
+        for k, dk in enumerate(d):
+            m[:] = 0.0
+            m[a0] = +0.5 * dk
+            m[b0] = -0.5 * dk
+            p[k] = transition_probs(J, (a0, b0), m, theta)[0]
+        counts = rng.binomial(int(trials), p)
+        return theta * d, counts / max(1, int(trials))
+
     xvals, pvals = [], []
     for d in delta_m_values:
         m[:] = 0.0